@@ -0,0 +1,425 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.aliases;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.math.BigInteger;
+import java.nio.charset.StandardCharsets;
+import java.security.NoSuchAlgorithmException;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.HashMap;
+import java.util.IdentityHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.zip.GZIPInputStream;
+import java.util.zip.GZIPOutputStream;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+import oracle.weblogic.deploy.util.FileUtils;
+import oracle.weblogic.deploy.util.PyOrderedDict;
+import oracle.weblogic.deploy.util.PyRealBoolean;
+import oracle.weblogic.deploy.util.StringUtils;
+import oracle.weblogic.deploy.util.WebLogicDeployToolingVersion;
+
+import org.python.core.Py;
+import org.python.core.PyBoolean;
+import org.python.core.PyDictionary;
+import org.python.core.PyFloat;
+import org.python.core.PyInteger;
+import org.python.core.PyList;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyString;
+import org.python.core.PyUnicode;
+
+/**
+ * A file cache for alias category dictionaries that have already been resolved for a WLS version and WLST mode.
+ * The dictionaries are stored in a compact binary form, along with the WDT version and a hash of each category
+ * JSON resource used to build them.  A cache file is only used if all of those are unchanged, so the cache never
+ * needs to be cleared manually.  Any problem reading or writing a cache file is logged and treated as a
+ * cache miss, since the caller can always fall back to loading the category JSON files.
+ */
+public class AliasCategoryCache {
+    private static final String CLASS = AliasCategoryCache.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.aliases");
+
+    private static final String CACHE_DIR_NAME = "alias_cache";
+    private static final String USER_CACHE_DIR_NAME = ".wdt";
+    private static final String CACHE_FILE_EXTENSION = ".bin";
+
+    private static final int MAGIC = 0x57445441;  // WDTA
+
+    // Increment the format version whenever the tags or the structure of the cached dictionaries change,
+    // since development builds share the same WDT version string.
+    private static final int FORMAT_VERSION = 2;
+
+    private static final byte TAG_NONE = 0;
+    private static final byte TAG_TRUE = 1;
+    private static final byte TAG_FALSE = 2;
+    private static final byte TAG_INTEGER = 3;
+    private static final byte TAG_LONG = 4;
+    private static final byte TAG_FLOAT = 5;
+    private static final byte TAG_STRING = 6;
+    private static final byte TAG_UNICODE = 7;
+    private static final byte TAG_STRING_REF = 8;
+    private static final byte TAG_LIST = 9;
+    private static final byte TAG_DICT = 10;
+    private static final byte TAG_ORDERED_DICT = 11;
+    private static final byte TAG_OBJECT_REF = 12;
+    private static final byte TAG_PY_TRUE = 13;
+    private static final byte TAG_PY_FALSE = 14;
+
+    private final File cacheDirectory;
+
+    /**
+     * Create a cache that stores its files in the specified directory.
+     *
+     * @param cacheDirectory the cache directory, which is created when the first file is saved
+     */
+    public AliasCategoryCache(File cacheDirectory) {
+        this.cacheDirectory = cacheDirectory;
+    }
+
+    /**
+     * Get the default cache directory for the WDT installation.  This is the alias_cache directory under the
+     * installation's lib directory, if it can be written, or under the .wdt directory of the user's home directory.
+     *
+     * @param wlsDeployHome the WDT installation directory, may be null
+     * @return the cache directory, or null if the installation directory is not specified
+     */
+    public static File getDefaultCacheDirectory(String wlsDeployHome) {
+        final String METHOD = "getDefaultCacheDirectory";
+
+        LOGGER.entering(CLASS, METHOD, wlsDeployHome);
+        File result = null;
+        if (!StringUtils.isEmpty(wlsDeployHome)) {
+            File libDirectory = new File(wlsDeployHome, "lib");
+            File installCacheDirectory = new File(libDirectory, CACHE_DIR_NAME);
+            if (isWritableDirectory(installCacheDirectory) || isWritableDirectory(libDirectory)) {
+                result = installCacheDirectory;
+            } else {
+                File userDirectory = new File(System.getProperty("user.home"), USER_CACHE_DIR_NAME);
+                result = new File(userDirectory, CACHE_DIR_NAME);
+            }
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Get the cache directory.
+     *
+     * @return the cache directory
+     */
+    public File getCacheDirectory() {
+        return cacheDirectory;
+    }
+
+    /**
+     * Load the value stored under the specified name.
+     *
+     * @param cacheName the name of the cache entry
+     * @return the cached value, or null if there is no entry, or the entry is stale or unreadable
+     */
+    public PyObject load(String cacheName) {
+        final String METHOD = "load";
+
+        LOGGER.entering(CLASS, METHOD, cacheName);
+        File cacheFile = getCacheFile(cacheName);
+        PyObject result = null;
+        if (cacheFile.isFile()) {
+            try (DataInputStream input = new DataInputStream(new BufferedInputStream(
+                new GZIPInputStream(new FileInputStream(cacheFile))))) {
+                if (readHeader(input, cacheFile)) {
+                    result = new Reader(input).readValue();
+                }
+            } catch (IOException | NoSuchAlgorithmException | RuntimeException ex) {
+                LOGGER.fine("WLSDPLY-08219", cacheFile, ex.getLocalizedMessage());
+                result = null;
+            }
+        }
+        LOGGER.exiting(CLASS, METHOD, result != null);
+        return result;
+    }
+
+    /**
+     * Save the value under the specified name.  The file is written to a temporary file first,
+     * so that concurrent tool invocations never see a partially written entry.
+     *
+     * @param cacheName the name of the cache entry
+     * @param resourcePaths the class path resources the value was built from
+     * @param value the value to store
+     * @return true if the value was saved, false otherwise
+     */
+    public boolean save(String cacheName, String[] resourcePaths, PyObject value) {
+        final String METHOD = "save";
+
+        LOGGER.entering(CLASS, METHOD, cacheName, Arrays.toString(resourcePaths));
+        File cacheFile = getCacheFile(cacheName);
+        File tempFile = null;
+        boolean result = false;
+        try {
+            if (!cacheDirectory.isDirectory() && !cacheDirectory.mkdirs() && !cacheDirectory.isDirectory()) {
+                throw new IOException(cacheDirectory.getPath());
+            }
+            tempFile = File.createTempFile(cacheName, ".tmp", cacheDirectory);
+            try (DataOutputStream output = new DataOutputStream(new BufferedOutputStream(
+                new GZIPOutputStream(new FileOutputStream(tempFile))))) {
+                writeHeader(output, resourcePaths);
+                new Writer(output).writeValue(value);
+            }
+            if (cacheFile.exists() && !cacheFile.delete()) {
+                throw new IOException(cacheFile.getPath());
+            }
+            if (!tempFile.renameTo(cacheFile)) {
+                throw new IOException(cacheFile.getPath());
+            }
+            result = true;
+            LOGGER.fine("WLSDPLY-08218", cacheName, cacheFile);
+        } catch (IOException | NoSuchAlgorithmException | RuntimeException ex) {
+            LOGGER.fine("WLSDPLY-08220", cacheFile, ex.getLocalizedMessage());
+        } finally {
+            if (tempFile != null && tempFile.exists() && !tempFile.delete()) {
+                tempFile.deleteOnExit();
+            }
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    private File getCacheFile(String cacheName) {
+        return new File(cacheDirectory, cacheName + CACHE_FILE_EXTENSION);
+    }
+
+    private static boolean isWritableDirectory(File directory) {
+        return directory.isDirectory() && directory.canWrite();
+    }
+
+    private static String computeResourceHash(String resourcePath) throws IOException, NoSuchAlgorithmException {
+        try (InputStream stream = FileUtils.getResourceAsStream(resourcePath)) {
+            if (stream == null) {
+                return "";
+            }
+            return FileUtils.computeHash(FileUtils.readInputStreamToByteArray(stream));
+        }
+    }
+
+    private static void writeHeader(DataOutputStream output, String[] resourcePaths)
+        throws IOException, NoSuchAlgorithmException {
+        output.writeInt(MAGIC);
+        output.writeInt(FORMAT_VERSION);
+        output.writeUTF(WebLogicDeployToolingVersion.getVersion());
+        output.writeInt(resourcePaths.length);
+        for (String resourcePath : resourcePaths) {
+            output.writeUTF(resourcePath);
+            output.writeUTF(computeResourceHash(resourcePath));
+        }
+    }
+
+    private static boolean readHeader(DataInputStream input, File cacheFile)
+        throws IOException, NoSuchAlgorithmException {
+        if (input.readInt() != MAGIC || input.readInt() != FORMAT_VERSION
+            || !WebLogicDeployToolingVersion.getVersion().equals(input.readUTF())) {
+            LOGGER.fine("WLSDPLY-08221", cacheFile);
+            return false;
+        }
+        int resourceCount = input.readInt();
+        for (int i = 0; i < resourceCount; i++) {
+            String resourcePath = input.readUTF();
+            String resourceHash = input.readUTF();
+            if (!resourceHash.equals(computeResourceHash(resourcePath))) {
+                LOGGER.fine("WLSDPLY-08222", cacheFile, resourcePath);
+                return false;
+            }
+        }
+        return true;
+    }
+
+    /**
+     * Writes Python values, storing each distinct string only once.  Dictionaries and lists that are
+     * referenced more than once are also stored once, so shared references are preserved when reading.
+     */
+    private static final class Writer {
+        private final DataOutputStream output;
+        private final Map<String, Integer> strings = new HashMap<>();
+        private final Map<PyObject, Integer> objects = new IdentityHashMap<>();
+
+        private Writer(DataOutputStream output) {
+            this.output = output;
+        }
+
+        private void writeValue(PyObject value) throws IOException {
+            if (value == null || value == Py.None) {
+                output.writeByte(TAG_NONE);
+            } else if (value instanceof PyRealBoolean) {
+                output.writeByte(((PyRealBoolean) value).getValue() ? TAG_TRUE : TAG_FALSE);
+            } else if (value instanceof PyBoolean) {
+                // PyBoolean extends PyInteger, so it must be checked first
+                output.writeByte(((PyBoolean) value).getBooleanValue() ? TAG_PY_TRUE : TAG_PY_FALSE);
+            } else if (value instanceof PyInteger) {
+                output.writeByte(TAG_INTEGER);
+                output.writeInt(((PyInteger) value).getValue());
+            } else if (value instanceof PyLong) {
+                output.writeByte(TAG_LONG);
+                byte[] bytes = ((PyLong) value).getValue().toByteArray();
+                output.writeInt(bytes.length);
+                output.write(bytes);
+            } else if (value instanceof PyFloat) {
+                output.writeByte(TAG_FLOAT);
+                output.writeDouble(((PyFloat) value).getValue());
+            } else if (value instanceof PyUnicode) {
+                writeString(TAG_UNICODE, value.toString());
+            } else if (value instanceof PyString) {
+                writeString(TAG_STRING, value.toString());
+            } else if (objects.containsKey(value)) {
+                output.writeByte(TAG_OBJECT_REF);
+                output.writeInt(objects.get(value));
+            } else if (value instanceof PyList) {
+                objects.put(value, objects.size());
+                PyList list = (PyList) value;
+                output.writeByte(TAG_LIST);
+                output.writeInt(list.__len__());
+                for (int i = 0; i < list.__len__(); i++) {
+                    writeValue(list.pyget(i));
+                }
+            } else if (value instanceof PyDictionary) {
+                objects.put(value, objects.size());
+                PyDictionary dict = (PyDictionary) value;
+                output.writeByte(dict instanceof PyOrderedDict ? TAG_ORDERED_DICT : TAG_DICT);
+                PyList keys = dict.keys();
+                output.writeInt(keys.__len__());
+                for (int i = 0; i < keys.__len__(); i++) {
+                    PyObject key = keys.pyget(i);
+                    writeValue(key);
+                    writeValue(dict.__finditem__(key));
+                }
+            } else {
+                throw new IOException(value.getType().fastGetName());
+            }
+        }
+
+        private void writeString(byte tag, String text) throws IOException {
+            String key = tag + text;
+            Integer index = strings.get(key);
+            if (index != null) {
+                output.writeByte(TAG_STRING_REF);
+                output.writeInt(index);
+            } else {
+                strings.put(key, strings.size());
+                byte[] bytes = text.getBytes(StandardCharsets.UTF_8);
+                output.writeByte(tag);
+                output.writeInt(bytes.length);
+                output.write(bytes);
+            }
+        }
+    }
+
+    /**
+     * Reads the values written by the Writer class.
+     */
+    private static final class Reader {
+        private final DataInputStream input;
+        private final List<PyObject> strings = new ArrayList<>();
+        private final List<PyObject> objects = new ArrayList<>();
+
+        private Reader(DataInputStream input) {
+            this.input = input;
+        }
+
+        private PyObject readValue() throws IOException {
+            byte tag = input.readByte();
+            switch (tag) {
+                case TAG_NONE:
+                    return Py.None;
+
+                case TAG_TRUE:
+                    return new PyRealBoolean(true);
+
+                case TAG_FALSE:
+                    return new PyRealBoolean(false);
+
+                case TAG_PY_TRUE:
+                    return Py.True;
+
+                case TAG_PY_FALSE:
+                    return Py.False;
+
+                case TAG_INTEGER:
+                    return new PyInteger(input.readInt());
+
+                case TAG_LONG:
+                    return new PyLong(new BigInteger(readBytes()));
+
+                case TAG_FLOAT:
+                    return new PyFloat(input.readDouble());
+
+                case TAG_STRING:
+                    return addString(new PyString(new String(readBytes(), StandardCharsets.UTF_8)));
+
+                case TAG_UNICODE:
+                    return addString(new PyUnicode(new String(readBytes(), StandardCharsets.UTF_8)));
+
+                case TAG_STRING_REF:
+                    return strings.get(input.readInt());
+
+                case TAG_OBJECT_REF:
+                    return objects.get(input.readInt());
+
+                case TAG_LIST:
+                    return readList();
+
+                case TAG_DICT:
+                    return readDictionary(new PyDictionary());
+
+                case TAG_ORDERED_DICT:
+                    return readDictionary(new PyOrderedDict());
+
+                default:
+                    throw new IOException(String.valueOf(tag));
+            }
+        }
+
+        private PyObject addString(PyObject value) {
+            strings.add(value);
+            return value;
+        }
+
+        private byte[] readBytes() throws IOException {
+            byte[] bytes = new byte[input.readInt()];
+            input.readFully(bytes);
+            return bytes;
+        }
+
+        private PyList readList() throws IOException {
+            PyList list = new PyList();
+            objects.add(list);
+            int size = input.readInt();
+            for (int i = 0; i < size; i++) {
+                list.pyadd(readValue());
+            }
+            return list;
+        }
+
+        private PyDictionary readDictionary(PyDictionary dict) throws IOException {
+            objects.add(dict);
+            int size = input.readInt();
+            for (int i = 0; i < size; i++) {
+                PyObject key = readValue();
+                dict.__setitem__(key, readValue());
+            }
+            return dict;
+        }
+    }
+}
@@ -0,0 +1,164 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.aliases;
+
+import java.util.Arrays;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+
+import oracle.weblogic.deploy.exception.ExceptionHelper;
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+import oracle.weblogic.deploy.util.StringUtils;
+
+/**
+ * A Maven-style version range that has been parsed once, so that it can be tested against versions
+ * without parsing the range string again.  The alias data only uses a small number of distinct range
+ * strings, so each one is compiled once per process and shared.  The result of testing a version is
+ * remembered, since the same WLS version is tested against the same ranges many times.
+ */
+public final class VersionRange {
+    private static final String CLASS = VersionRange.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.versions");
+
+    private static final int RANGE_SIZE = 2;
+    private static final int RANGE_LOW_INDEX = 0;
+    private static final int RANGE_HIGH_INDEX = 1;
+    private static final int VERSION_INDEX = 0;
+
+    private static final Map<String, VersionRange> RANGES = new ConcurrentHashMap<>();
+
+    private final String range;
+    private final String lowerVersion;
+    private final String upperVersion;
+    private final boolean singleVersion;
+    private final boolean inclusiveStart;
+    private final boolean inclusiveEnd;
+    private final Map<String, Boolean> results = new ConcurrentHashMap<>();
+
+    private VersionRange(String range, String[] versions) throws VersionException {
+        this.range = range;
+        switch (versions.length) {
+            case RANGE_SIZE:
+                this.lowerVersion = versions[RANGE_LOW_INDEX];
+                this.upperVersion = versions[RANGE_HIGH_INDEX];
+                this.singleVersion = false;
+                break;
+
+            case 1:
+                this.lowerVersion = versions[VERSION_INDEX];
+                this.upperVersion = null;
+                this.singleVersion = true;
+                break;
+
+            default:
+                throw new VersionException("WLSDPLY-08206", range, Arrays.asList(versions));
+        }
+        this.inclusiveStart = range.startsWith("[");
+        this.inclusiveEnd = range.endsWith("]");
+    }
+
+    /**
+     * Get the compiled version range for the specified range string, compiling it the first time it is used.
+     *
+     * @param range the Maven-style version range
+     * @return the compiled version range
+     * @throws VersionException if the range is not a valid version or version range
+     * @throws IllegalArgumentException if the range argument is empty or null
+     */
+    public static VersionRange getInstance(String range) throws VersionException {
+        final String METHOD = "getInstance";
+
+        VersionRange result = RANGES.get(range);
+        if (result == null) {
+            String[] versions = VersionUtils.getLowerAndUpperVersionStrings(range);
+            LOGGER.finest("WLSDPLY-08201", range, Arrays.asList(versions));
+            try {
+                result = new VersionRange(range, versions);
+            } catch (VersionException ve) {
+                LOGGER.throwing(CLASS, METHOD, ve);
+                throw ve;
+            }
+            VersionRange existing = RANGES.putIfAbsent(range, result);
+            if (existing != null) {
+                result = existing;
+            }
+        }
+        return result;
+    }
+
+    /**
+     * Get the number of distinct version ranges that have been compiled.
+     *
+     * @return the number of compiled version ranges
+     */
+    public static int getCompiledRangeCount() {
+        return RANGES.size();
+    }
+
+    /**
+     * Get the version range string.
+     *
+     * @return the version range string
+     */
+    public String getRange() {
+        return range;
+    }
+
+    /**
+     * Determine if the specified version is included in this version range.
+     *
+     * @param version the version to test
+     * @return true if the specified version falls within this version range, false otherwise
+     * @throws VersionException if the version is not valid
+     * @throws IllegalArgumentException if the version argument is empty or null
+     */
+    public boolean includes(String version) throws VersionException {
+        final String METHOD = "includes";
+
+        if (StringUtils.isEmpty(version)) {
+            String message = ExceptionHelper.getMessage("WLSDPLY-08200");
+            IllegalArgumentException iae = new IllegalArgumentException(message);
+            LOGGER.throwing(CLASS, METHOD, iae);
+            throw iae;
+        }
+
+        Boolean result = results.get(version);
+        if (result == null) {
+            result = computeIncludes(version);
+            results.put(version, result);
+        }
+        return result;
+    }
+
+    @Override
+    public String toString() {
+        return range;
+    }
+
+    private boolean computeIncludes(String version) throws VersionException {
+        boolean result = false;
+        if (singleVersion) {
+            result = (VersionUtils.compareVersions(version, lowerVersion) == 0);
+            LOGGER.finest("WLSDPLY-08205", version, lowerVersion, result);
+        } else {
+            int lowerCompare = VersionUtils.compareVersions(version, lowerVersion);
+            LOGGER.finest("WLSDPLY-08202", version, lowerVersion, lowerCompare);
+            if (lowerCompare > 0 || (lowerCompare == 0 && inclusiveStart)) {
+                if (!StringUtils.isEmpty(upperVersion)) {
+                    int upperCompare = VersionUtils.compareVersions(version, upperVersion);
+                    LOGGER.finest("WLSDPLY-08203", version, upperVersion, upperCompare);
+                    if (upperCompare < 0 || (upperCompare == 0 && inclusiveEnd)) {
+                        result = true;
+                    }
+                } else {
+                    LOGGER.finest("WLSDPLY-08204", range);
+                    result = true;
+                }
+            }
+        }
+        return result;
+    }
+}
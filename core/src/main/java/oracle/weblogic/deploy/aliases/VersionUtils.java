@@ -162,43 +162,8 @@ public final class VersionUtils {
             throw iae;
         }
 
-        String[] versions = getLowerAndUpperVersionStrings(range);
-        LOGGER.finest("WLSDPLY-08201", range, Arrays.asList(versions));
-        boolean result = false;
-        switch (versions.length) {
-            case RANGE_SIZE:
-                String lowerVersion = versions[RANGE_LOW_INDEX];
-                String upperVersion = versions[RANGE_HIGH_INDEX];
-                boolean inclusiveStart = range.startsWith("[");
-                boolean inclusiveEnd = range.endsWith("]");
-
-                int lowerCompare = compareVersions(version, lowerVersion);
-                LOGGER.finest("WLSDPLY-08202", version, lowerVersion, lowerCompare);
-                if (lowerCompare > 0 || (lowerCompare == 0 && inclusiveStart)) {
-                    if (!StringUtils.isEmpty(upperVersion)) {
-                        int upperCompare = compareVersions(version, upperVersion);
-                        LOGGER.finest("WLSDPLY-08203", version, upperVersion, upperCompare);
-                        if (upperCompare < 0 || (upperCompare == 0 && inclusiveEnd)) {
-                            result = true;
-                        }
-                    } else {
-                        LOGGER.finest("WLSDPLY-08204", range);
-                        result = true;
-                    }
-                }
-                break;
-
-            case VERSION_SIZE:
-                String singleVersion = versions[VERSION_INDEX];
-                result = (compareVersions(version, singleVersion) == 0);
-                LOGGER.finest("WLSDPLY-08205", version, singleVersion, result);
-                break;
-
-            default:
-                VersionException ve = new VersionException("WLSDPLY-08206", range, Arrays.asList(versions));
-                LOGGER.throwing(CLASS, METHOD, ve);
-                throw ve;
-        }
+        // the compiled range is shared by all callers, and remembers the result for each version
+        boolean result = VersionRange.getInstance(range).includes(version);
         LOGGER.exiting(CLASS, METHOD, result);
         return result;
     }
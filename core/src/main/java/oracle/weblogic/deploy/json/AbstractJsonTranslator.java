@@ -32,9 +32,15 @@ import org.python.core.PyString;
 import org.python.core.PyUnicode;
 
 /**
- * This class does the heavy-lifting of walking the parse tree and performing the conversion into a Python dictionary.
+ * This class does the heavy-lifting of reading the JSON and performing the conversion into a Python dictionary.
+ * The JSON is read by JsonStreamReader, unless the wdt.json.use.antlr.parser system property is set to true,
+ * in which case it is parsed using the ANTLR JSON grammar and this class walks the parse tree.
  */
 public abstract class AbstractJsonTranslator extends JSONBaseListener {
+    /**
+     * The system property that selects the ANTLR grammar-based parser instead of the default streaming reader.
+     */
+    public static final String USE_ANTLR_PARSER_PROPERTY = "wdt.json.use.antlr.parser";
 
     private PyDictionary fileDict;
     private Deque<PyDictionary> currentDict;
@@ -296,45 +302,54 @@ public abstract class AbstractJsonTranslator extends JSONBaseListener {
 
     @SuppressWarnings("WeakerAccess")
     protected PyDictionary parseInternal(String jsonFileName, InputStream jsonStream) throws JsonException {
-        final String METHOD = "parseInternal";
-
         PyDictionary result = null;
         if (jsonStream != null) {
-            JsonErrorListener errorListener = new JsonErrorListener(jsonFileName, false);
-            try {
-                CharStream input = CharStreams.fromStream(jsonStream);
-                JSONLexer lexer = new JSONLexer(input);
-                lexer.removeErrorListeners();
-                lexer.addErrorListener(errorListener);
-
-                CommonTokenStream tokens = new CommonTokenStream(lexer);
-                JSONParser parser = new JSONParser(tokens);
-
-                parser.removeErrorListeners();
-                parser.addErrorListener(errorListener);
-                parser.getInterpreter().setPredictionMode(PredictionMode.LL_EXACT_AMBIG_DETECTION);
-
-                ParseTree tree = parser.json();
-                ParseTreeWalker walker = new ParseTreeWalker();
-                walker.walk(this, tree);
-            } catch (IOException ioe) {
-                JsonException ex =
-                    new JsonException("WLSDPLY-18007", ioe, "JSON", jsonFileName, ioe.getLocalizedMessage());
-                getLogger().throwing(getClassName(), METHOD, ex);
-                throw ex;
-            }
-
-            int errorCount = errorListener.getErrorCount();
-            if (errorCount > 0) {
-                JsonException je = new JsonException("WLSDPLY-18017", "JSON", errorCount, jsonFileName);
-                getLogger().throwing(getClassName(), METHOD, je);
-                throw je;
+            if (Boolean.getBoolean(USE_ANTLR_PARSER_PROPERTY)) {
+                getLogger().fine("WLSDPLY-18034", jsonFileName, USE_ANTLR_PARSER_PROPERTY);
+                result = parseWithAntlr(jsonFileName, jsonStream);
+            } else {
+                result = new JsonStreamReader(jsonFileName, jsonStream, useOrderedDict, useUnicode).read();
             }
-            result = fileDict;
         }
         return result;
     }
 
+    private PyDictionary parseWithAntlr(String jsonFileName, InputStream jsonStream) throws JsonException {
+        final String METHOD = "parseWithAntlr";
+
+        JsonErrorListener errorListener = new JsonErrorListener(jsonFileName, false);
+        try {
+            CharStream input = CharStreams.fromStream(jsonStream);
+            JSONLexer lexer = new JSONLexer(input);
+            lexer.removeErrorListeners();
+            lexer.addErrorListener(errorListener);
+
+            CommonTokenStream tokens = new CommonTokenStream(lexer);
+            JSONParser parser = new JSONParser(tokens);
+
+            parser.removeErrorListeners();
+            parser.addErrorListener(errorListener);
+            parser.getInterpreter().setPredictionMode(PredictionMode.LL_EXACT_AMBIG_DETECTION);
+
+            ParseTree tree = parser.json();
+            ParseTreeWalker walker = new ParseTreeWalker();
+            walker.walk(this, tree);
+        } catch (IOException ioe) {
+            JsonException ex =
+                new JsonException("WLSDPLY-18007", ioe, "JSON", jsonFileName, ioe.getLocalizedMessage());
+            getLogger().throwing(getClassName(), METHOD, ex);
+            throw ex;
+        }
+
+        int errorCount = errorListener.getErrorCount();
+        if (errorCount > 0) {
+            JsonException je = new JsonException("WLSDPLY-18017", "JSON", errorCount, jsonFileName);
+            getLogger().throwing(getClassName(), METHOD, je);
+            throw je;
+        }
+        return fileDict;
+    }
+
     @SuppressWarnings("unchecked")
     private void addToArrayIfNeeded() {
         ValueType myValueType = currentValueType.pop();
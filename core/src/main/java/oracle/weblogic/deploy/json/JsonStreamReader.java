@@ -0,0 +1,463 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.json;
+
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.InputStreamReader;
+import java.io.Reader;
+import java.nio.charset.StandardCharsets;
+import java.util.HashMap;
+import java.util.Map;
+
+import oracle.weblogic.deploy.exception.ExceptionHelper;
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+import oracle.weblogic.deploy.util.PyOrderedDict;
+import oracle.weblogic.deploy.util.PyRealBoolean;
+
+import org.python.core.Py;
+import org.python.core.PyDictionary;
+import org.python.core.PyFloat;
+import org.python.core.PyList;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyString;
+import org.python.core.PyUnicode;
+
+/**
+ * A streaming JSON reader that builds the Python dictionary directly as it reads the input, without
+ * creating a token stream or parse tree.  The Python objects it creates are the same as those created
+ * by the ANTLR parse tree listener in AbstractJsonTranslator, and syntax errors are reported with the
+ * same messages, including the line and position of the error.  Reading stops at the first syntax error.
+ */
+public class JsonStreamReader {
+    private static final String CLASS = JsonStreamReader.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.json");
+
+    private static final int BUFFER_SIZE = 8192;
+    private static final int END_OF_INPUT = -1;
+
+    private final String fileName;
+    private final Reader reader;
+    private final boolean useOrderedDict;
+    private final boolean useUnicode;
+
+    // keys are repeated many times in models and alias files, so share their Python strings
+    private final Map<String, PyObject> keyStrings = new HashMap<>();
+    private final StringBuilder text = new StringBuilder();
+    private final char[] buffer = new char[BUFFER_SIZE];
+    private int bufferLength;
+    private int bufferPosition;
+
+    private int line = 1;
+    private int column;
+
+    /**
+     * The constructor.
+     *
+     * @param fileName the name of the file being read, used only for messages
+     * @param jsonStream the UTF-8 encoded input stream, which is not closed by this class
+     * @param useOrderedDict whether to use ordered dictionaries for JSON objects
+     * @param useUnicode whether to use PyUnicode instead of PyString for JSON strings
+     */
+    public JsonStreamReader(String fileName, InputStream jsonStream, boolean useOrderedDict, boolean useUnicode) {
+        this.fileName = fileName;
+        this.reader = new InputStreamReader(jsonStream, StandardCharsets.UTF_8);
+        this.useOrderedDict = useOrderedDict;
+        this.useUnicode = useUnicode;
+    }
+
+    /**
+     * Read the JSON input and convert it to a Python dictionary.  If the top-level JSON value
+     * is not an object, it is read and an empty dictionary is returned.
+     *
+     * @return the Python dictionary
+     * @throws JsonException if an error occurs reading the input, or the input is not valid JSON
+     */
+    public PyDictionary read() throws JsonException {
+        final String METHOD = "read";
+
+        LOGGER.entering(CLASS, METHOD, fileName);
+        PyDictionary result;
+        try {
+            int next = skipWhitespace();
+            if (next == '{') {
+                result = readObject(null, null);
+            } else {
+                readValue(next, null, null);
+                result = newDictionary();
+            }
+
+            next = skipWhitespace();
+            if (next != END_OF_INPUT) {
+                throw syntaxError("WLSDPLY-18033", describe(next));
+            }
+        } catch (SyntaxException se) {
+            LOGGER.severe("WLSDPLY-18018", fileName, se.errorLine, se.errorColumn, se.getMessage());
+            JsonException je = new JsonException("WLSDPLY-18017", "JSON", 1, fileName);
+            LOGGER.throwing(CLASS, METHOD, je);
+            throw je;
+        } catch (IOException ioe) {
+            JsonException je = new JsonException("WLSDPLY-18007", ioe, "JSON", fileName, ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, je);
+            throw je;
+        }
+        LOGGER.exiting(CLASS, METHOD);
+        return result;
+    }
+
+    private PyObject readValue(int next, PyDictionary container, PyObject key)
+        throws IOException, SyntaxException, JsonException {
+        switch (next) {
+            case '{':
+                return readObject(container, key);
+
+            case '[':
+                return readArray();
+
+            case '"':
+                return getPythonString(readString());
+
+            case 't':
+                readLiteral("true");
+                return new PyRealBoolean(true);
+
+            case 'f':
+                readLiteral("false");
+                return new PyRealBoolean(false);
+
+            case 'n':
+                readLiteral("null");
+                return Py.None;
+
+            case END_OF_INPUT:
+                throw syntaxError("WLSDPLY-18030");
+
+            default:
+                if (next == '-' || isDigit(next)) {
+                    return readNumber(next);
+                }
+                throw syntaxError("WLSDPLY-18029", "value", describe(next));
+        }
+    }
+
+    private PyDictionary readObject(PyDictionary container, PyObject key) throws IOException, SyntaxException,
+        JsonException {
+        final String METHOD = "readObject";
+
+        // a nested object cannot replace an existing entry, as in AbstractJsonTranslator
+        if (container != null && container.has_key(key)) {
+            String message = ExceptionHelper.getMessage("WLSDPLY-18028", key);
+            JsonException je = new JsonException("WLSDPLY-18007", "JSON", fileName, message);
+            LOGGER.throwing(CLASS, METHOD, je);
+            throw je;
+        }
+
+        PyDictionary result = newDictionary();
+        int next = skipWhitespace();
+        if (next == '}') {
+            markTokenFree(result);
+            return result;
+        }
+
+        while (true) {
+            if (next != '"') {
+                throw syntaxError("WLSDPLY-18029", "string", describe(next));
+            }
+            PyObject name = getKeyString(readString());
+
+            next = skipWhitespace();
+            if (next != ':') {
+                throw syntaxError("WLSDPLY-18029", "':'", describe(next));
+            }
+
+            PyObject value = readValue(skipWhitespace(), result, name);
+            result.__setitem__(name, value);
+
+            next = skipWhitespace();
+            if (next == '}') {
+                markTokenFree(result);
+                return result;
+            } else if (next != ',') {
+                throw syntaxError("WLSDPLY-18029", "',' or '}'", describe(next));
+            }
+            next = skipWhitespace();
+        }
+    }
+
+    private PyList readArray() throws IOException, SyntaxException, JsonException {
+        PyList result = new PyList();
+        int next = skipWhitespace();
+        if (next == ']') {
+            return result;
+        }
+
+        while (true) {
+            result.pyadd(readValue(next, null, null));
+
+            next = skipWhitespace();
+            if (next == ']') {
+                return result;
+            } else if (next != ',') {
+                throw syntaxError("WLSDPLY-18029", "',' or ']'", describe(next));
+            }
+            next = skipWhitespace();
+        }
+    }
+
+    private String readString() throws IOException, SyntaxException {
+        text.setLength(0);
+        while (true) {
+            int next = nextChar();
+            if (next == '"') {
+                return text.toString();
+            } else if (next == '\\') {
+                text.append(readEscape());
+            } else if (next == END_OF_INPUT) {
+                throw syntaxError("WLSDPLY-18030");
+            } else if (next < 0x20) {
+                throw syntaxError("WLSDPLY-18029", "'\"'", describe(next));
+            } else {
+                text.append((char) next);
+            }
+        }
+    }
+
+    private char readEscape() throws IOException, SyntaxException {
+        int next = nextChar();
+        switch (next) {
+            case '"':
+            case '\\':
+            case '/':
+                return (char) next;
+
+            case 'b':
+                return '\b';
+
+            case 'f':
+                return '\f';
+
+            case 'n':
+                return '\n';
+
+            case 'r':
+                return '\r';
+
+            case 't':
+                return '\t';
+
+            case 'u':
+                int value = 0;
+                for (int i = 0; i < 4; i++) {
+                    int digit = Character.digit(nextChar(), 16);
+                    if (digit < 0) {
+                        throw syntaxError("WLSDPLY-18031", "\\u");
+                    }
+                    value = (value << 4) + digit;
+                }
+                return (char) value;
+
+            default:
+                throw syntaxError("WLSDPLY-18031", "\\" + describe(next));
+        }
+    }
+
+    private PyObject readNumber(int first) throws IOException, SyntaxException {
+        text.setLength(0);
+        text.append((char) first);
+        boolean isFloat = false;
+        int next = peekChar();
+        while (isDigit(next) || next == '.' || next == 'e' || next == 'E' || next == '+' || next == '-') {
+            isFloat = isFloat || next == '.';
+            text.append((char) nextChar());
+            next = peekChar();
+        }
+
+        String numberText = text.toString();
+        if (!isValidNumber(numberText)) {
+            throw syntaxError("WLSDPLY-18032", numberText);
+        }
+
+        // only numbers with a decimal point are floats, as in AbstractJsonTranslator
+        PyObject value;
+        if (isFloat) {
+            double doubleValue = 0.0;
+            try {
+                doubleValue = Double.parseDouble(numberText);
+            } catch (NumberFormatException nfe) {
+                LOGGER.warning("WLSDPLY-18025", nfe, numberText, nfe.getLocalizedMessage());
+            }
+            value = new PyFloat(doubleValue);
+        } else {
+            long longValue = 0;
+            try {
+                longValue = Long.parseLong(numberText);
+            } catch (NumberFormatException nfe) {
+                LOGGER.warning("WLSDPLY-18024", nfe, numberText, nfe.getLocalizedMessage());
+            }
+            value = new PyLong(longValue);
+        }
+        return value;
+    }
+
+    private void readLiteral(String literal) throws IOException, SyntaxException {
+        // the first character has already been read
+        for (int i = 1; i < literal.length(); i++) {
+            int next = nextChar();
+            if (next != literal.charAt(i)) {
+                throw syntaxError("WLSDPLY-18029", literal, describe(next));
+            }
+        }
+        if (Character.isLetterOrDigit(peekChar())) {
+            throw syntaxError("WLSDPLY-18029", literal, describe(nextChar()));
+        }
+    }
+
+    private int skipWhitespace() throws IOException {
+        int next = nextChar();
+        while (next == ' ' || next == '\t' || next == '\n' || next == '\r') {
+            next = nextChar();
+        }
+        return next;
+    }
+
+    private int nextChar() throws IOException {
+        int next = peekChar();
+        if (next != END_OF_INPUT) {
+            bufferPosition++;
+            if (next == '\n') {
+                line++;
+                column = 0;
+            } else {
+                column++;
+            }
+        }
+        return next;
+    }
+
+    private int peekChar() throws IOException {
+        if (bufferPosition >= bufferLength) {
+            bufferLength = reader.read(buffer, 0, BUFFER_SIZE);
+            bufferPosition = 0;
+            if (bufferLength <= 0) {
+                bufferLength = 0;
+                return END_OF_INPUT;
+            }
+        }
+        return buffer[bufferPosition];
+    }
+
+    private PyDictionary newDictionary() {
+        if (useOrderedDict) {
+            return new PyOrderedDict();
+        }
+        return new PyDictionary();
+    }
+
+    private static void markTokenFree(PyDictionary dictionary) {
+        if (dictionary instanceof PyOrderedDict) {
+            ((PyOrderedDict) dictionary).markTokenFree();
+        }
+    }
+
+    private PyObject getKeyString(String key) {
+        PyObject result = keyStrings.get(key);
+        if (result == null) {
+            result = getPythonString(key);
+            keyStrings.put(key, result);
+        }
+        return result;
+    }
+
+    private PyObject getPythonString(String value) {
+        if (useUnicode) {
+            return new PyUnicode(value);
+        }
+        return new PyString(value);
+    }
+
+    private SyntaxException syntaxError(String key, Object... args) {
+        // report the position of the last character read, as ANTLR reports the start of the bad token
+        return new SyntaxException(ExceptionHelper.getMessage(key, args), line, Math.max(column - 1, 0));
+    }
+
+    private static boolean isDigit(int ch) {
+        return ch >= '0' && ch <= '9';
+    }
+
+    // NUMBER : '-'? ('0' | [1-9] [0-9]*) ('.' [0-9]+)? ([Ee] [+\-]? ('0' | [1-9] [0-9]*))?
+    private static boolean isValidNumber(String number) {
+        int length = number.length();
+        int index = 0;
+        if (index < length && number.charAt(index) == '-') {
+            index++;
+        }
+        index = skipInteger(number, index);
+        if (index < 0) {
+            return false;
+        }
+        if (index < length && number.charAt(index) == '.') {
+            int start = ++index;
+            while (index < length && isDigit(number.charAt(index))) {
+                index++;
+            }
+            if (index == start) {
+                return false;
+            }
+        }
+        if (index < length && (number.charAt(index) == 'e' || number.charAt(index) == 'E')) {
+            index++;
+            if (index < length && (number.charAt(index) == '+' || number.charAt(index) == '-')) {
+                index++;
+            }
+            index = skipInteger(number, index);
+            if (index < 0) {
+                return false;
+            }
+        }
+        return index == length;
+    }
+
+    private static int skipInteger(String number, int start) {
+        int length = number.length();
+        if (start >= length || !isDigit(number.charAt(start))) {
+            return -1;
+        }
+        if (number.charAt(start) == '0') {
+            return start + 1;
+        }
+        int index = start;
+        while (index < length && isDigit(number.charAt(index))) {
+            index++;
+        }
+        return index;
+    }
+
+    private static String describe(int ch) {
+        if (ch == END_OF_INPUT) {
+            return "<EOF>";
+        } else if (ch < 0x20) {
+            return String.format("\\u%04x", ch);
+        }
+        return "'" + (char) ch + "'";
+    }
+
+    /**
+     * A syntax error at a position in the input, reported once by the read method.
+     */
+    private static final class SyntaxException extends Exception {
+        private static final long serialVersionUID = 1L;
+
+        private final int errorLine;
+        private final int errorColumn;
+
+        private SyntaxException(String message, int errorLine, int errorColumn) {
+            super(message);
+            this.errorLine = errorLine;
+            this.errorColumn = errorColumn;
+        }
+    }
+}
@@ -1,5 +1,5 @@
 /*
- * Copyright (c) 2022, Oracle and/or its affiliates.
+ * Copyright (c) 2022, 2023, Oracle and/or its affiliates.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.util;
@@ -26,6 +26,17 @@ public class CommentMap {
         getOrCreateComments(key).add(comment);
     }
 
+    /**
+     * Add copies of all the comments from another comment map.
+     *
+     * @param other the comment map to copy
+     */
+    public void addAll(CommentMap other) {
+        for (Map.Entry<String, List<String>> entry : other.internalCommentMap.entrySet()) {
+            getOrCreateComments(entry.getKey()).addAll(entry.getValue());
+        }
+    }
+
     public List<String> getComments(String key) {
         List<String> comments = internalCommentMap.get(key);
         return (comments == null) ? Collections.<String>emptyList() : comments;
@@ -39,4 +50,28 @@ public class CommentMap {
         }
         return comments;
     }
+
+    /**
+     * {@inheritDoc}
+     */
+    @Override
+    public boolean equals(Object other) {
+        boolean result;
+        if (this == other) {
+            result = true;
+        } else if (other == null || this.getClass() != other.getClass()) {
+            result = false;
+        } else {
+            result = this.internalCommentMap.equals(((CommentMap) other).internalCommentMap);
+        }
+        return result;
+    }
+
+    /**
+     * {@inheritDoc}
+     */
+    @Override
+    public int hashCode() {
+        return internalCommentMap.hashCode();
+    }
 }
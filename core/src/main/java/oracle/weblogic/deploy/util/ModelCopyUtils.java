@@ -0,0 +1,85 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.util;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+
+import org.python.core.Py;
+import org.python.core.PyDictionary;
+import org.python.core.PyFloat;
+import org.python.core.PyInteger;
+import org.python.core.PyList;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyString;
+import org.python.core.imp;
+
+/**
+ * Copies model trees without the memo bookkeeping of the Python copy.deepcopy() function.
+ * <p>
+ * Model dictionaries are read from files and built by the tools as trees, so no dictionary or list
+ * is reachable from itself.  This allows each dictionary and list to be copied as it is reached,
+ * instead of recording every copied object in a memo dictionary.  A dictionary or list that is
+ * referenced from more than one place in the tree is copied once for each reference.
+ */
+public final class ModelCopyUtils {
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.util");
+
+    private ModelCopyUtils() {
+        // hide the constructor for this utility class
+    }
+
+    /**
+     * Create a deep copy of a model tree.  Dictionaries and lists are copied, including the comments of
+     * ordered dictionaries.  Strings, numbers, booleans and None are immutable, so they are shared with
+     * the original.  Any other value is copied with the Python copy.deepcopy() function.
+     *
+     * @param model the model dictionary, or any element of the model
+     * @return the copy of the model
+     */
+    public static PyObject copyModel(PyObject model) {
+        if (model == null || model == Py.None || isImmutable(model)) {
+            return model;
+        } else if (model instanceof PyOrderedDict) {
+            PyOrderedDict original = (PyOrderedDict) model;
+            PyOrderedDict result = new PyOrderedDict();
+            copyEntries(original, result);
+            result.getCommentMap().addAll(original.getCommentMap());
+            result.markTokenFree();
+            return result;
+        } else if (model.getClass() == PyDictionary.class) {
+            PyDictionary result = new PyDictionary();
+            copyEntries((PyDictionary) model, result);
+            return result;
+        } else if (model.getClass() == PyList.class) {
+            PyList original = (PyList) model;
+            int size = original.__len__();
+            PyObject[] elements = new PyObject[size];
+            for (int i = 0; i < size; i++) {
+                elements[i] = copyModel(original.pyget(i));
+            }
+            return new PyList(elements);
+        }
+
+        LOGGER.finer("WLSDPLY-01253", model.getType().fastGetName());
+        return imp.importName("copy", true).invoke("deepcopy", model);
+    }
+
+    private static void copyEntries(PyDictionary original, PyDictionary result) {
+        PyList keys = original.keys();
+        int size = keys.__len__();
+        for (int i = 0; i < size; i++) {
+            PyObject key = keys.pyget(i);
+            result.__setitem__(key, copyModel(original.__finditem__(key)));
+        }
+    }
+
+    private static boolean isImmutable(PyObject value) {
+        // PyUnicode extends PyString, and the Jython 2.7 PyBoolean extends PyInteger
+        return value instanceof PyString || value instanceof PyInteger || value instanceof PyLong
+            || value instanceof PyFloat || value instanceof PyRealBoolean;
+    }
+}
@@ -0,0 +1,247 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.File;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.RandomAccessFile;
+import java.nio.ByteBuffer;
+import java.nio.channels.FileChannel;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+
+import org.yaml.snakeyaml.LoaderOptions;
+
+/**
+ * The content of a model file, loaded so that the size of the file can be checked and the format of the
+ * file can be determined before it is parsed.
+ * <p>
+ * The file is read into a single heap buffer, and closed before the content is returned.  The file is not
+ * memory-mapped, since a mapped file is only released when its buffer is garbage collected, and on Windows
+ * it cannot be deleted or replaced until then.  The parsers decode the UTF-8 content from the input stream
+ * over the buffer, so the file content is not copied into intermediate byte arrays or strings.
+ * <p>
+ * The format is determined from the content: a model whose first character (after any byte order mark and
+ * white space) is an opening brace is JSON, and any other model is YAML.  The YAML code point limit is checked
+ * against the whole file, so an oversize YAML model is rejected without being parsed.  A YAML model file
+ * contains a single document, so this is the same limit that the YAML parser applies to each document.
+ */
+public final class ModelFileContent {
+    private static final String CLASS = ModelFileContent.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.translator");
+
+    // the maximum number of bytes in the UTF-8 encoding of a code point
+    private static final int MAX_UTF8_BYTES = 4;
+
+    private static final byte[] UTF8_BOM = { (byte) 0xEF, (byte) 0xBB, (byte) 0xBF };
+
+    private final String fileName;
+    private final ByteBuffer content;
+    private final boolean json;
+
+    private ModelFileContent(String fileName, ByteBuffer content) {
+        this.fileName = fileName;
+        skipUtf8ByteOrderMark(content);
+        this.content = content;
+        this.json = firstSignificantByte(content) == '{';
+    }
+
+    /**
+     * Load the content of a model file, and check the size of a YAML model against the code point limit.
+     *
+     * @param modelFile the existing model file
+     * @param maxCodePoints the maximum number of code points for a YAML model, or zero to use the YAML parser default
+     * @return the content of the model file
+     * @throws TranslateException if the file cannot be read, or is too large
+     */
+    public static ModelFileContent load(File modelFile, int maxCodePoints) throws TranslateException {
+        final String METHOD = "load";
+
+        LOGGER.entering(CLASS, METHOD, modelFile, maxCodePoints);
+        String fileName = modelFile.getPath();
+        long size = modelFile.length();
+        if (size > Integer.MAX_VALUE) {
+            TranslateException ex = new TranslateException("WLSDPLY-01715", fileName, size, Integer.MAX_VALUE);
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        }
+
+        ModelFileContent result;
+        RandomAccessFile file = null;
+        try {
+            file = new RandomAccessFile(modelFile, "r");
+            FileChannel channel = file.getChannel();
+            ByteBuffer buffer = ByteBuffer.allocate((int) size);
+            while (buffer.hasRemaining() && channel.read(buffer) >= 0) {
+                // keep reading until the buffer is full or the file ends
+            }
+            buffer.flip();
+            result = new ModelFileContent(fileName, buffer);
+        } catch (IOException ioe) {
+            TranslateException ex = new TranslateException("WLSDPLY-01716", ioe, fileName, ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        } finally {
+            closeFile(file, fileName);
+        }
+
+        if (!result.isJson()) {
+            result.checkCodePoints(getCodePointLimit(maxCodePoints));
+        }
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    /**
+     * Whether the content is a JSON model.
+     *
+     * @return true if the content is JSON, false if it is YAML
+     */
+    public boolean isJson() {
+        return json;
+    }
+
+    /**
+     * Get the number of bytes of content, not including any byte order mark.
+     *
+     * @return the number of bytes
+     */
+    public int getSize() {
+        return content.remaining();
+    }
+
+    /**
+     * Get a new input stream over the content, starting after any UTF-8 byte order mark.
+     * Closing the stream does not affect the content or other streams.
+     *
+     * @return the input stream
+     */
+    public InputStream getInputStream() {
+        return new ByteBufferInputStream(content.duplicate());
+    }
+
+    @Override
+    public String toString() {
+        return fileName + (json ? " (JSON, " : " (YAML, ") + getSize() + " bytes)";
+    }
+
+    private void checkCodePoints(int maxCodePoints) throws TranslateException {
+        final String METHOD = "checkCodePoints";
+
+        // the number of code points is at most the number of bytes, and at least one quarter of the bytes
+        int size = getSize();
+        if (size <= maxCodePoints || isUtf16()) {
+            return;
+        }
+
+        long minCodePoints = (size + MAX_UTF8_BYTES - 1) / MAX_UTF8_BYTES;
+        long codePoints = minCodePoints > maxCodePoints ? minCodePoints : countCodePoints();
+        if (codePoints > maxCodePoints) {
+            TranslateException ex = new TranslateException("WLSDPLY-01717", fileName, maxCodePoints);
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        }
+    }
+
+    // the number of UTF-8 code points, each of which has a single byte that is not a continuation byte
+    private int countCodePoints() {
+        int count = 0;
+        for (int i = content.position(); i < content.limit(); i++) {
+            if ((content.get(i) & 0xC0) != 0x80) {
+                count++;
+            }
+        }
+        return count;
+    }
+
+    // a UTF-16 byte order mark, which the YAML reader accepts. The YAML parser checks the limit for this content.
+    private boolean isUtf16() {
+        if (content.remaining() < 2) {
+            return false;
+        }
+        int first = content.get(content.position()) & 0xFF;
+        int second = content.get(content.position() + 1) & 0xFF;
+        return (first == 0xFE && second == 0xFF) || (first == 0xFF && second == 0xFE);
+    }
+
+    private static int getCodePointLimit(int maxCodePoints) {
+        if (maxCodePoints > 0) {
+            return maxCodePoints;
+        }
+        return new LoaderOptions().getCodePointLimit();
+    }
+
+    private static void skipUtf8ByteOrderMark(ByteBuffer buffer) {
+        int start = buffer.position();
+        if (buffer.remaining() >= UTF8_BOM.length) {
+            for (int i = 0; i < UTF8_BOM.length; i++) {
+                if (buffer.get(start + i) != UTF8_BOM[i]) {
+                    return;
+                }
+            }
+            buffer.position(start + UTF8_BOM.length);
+        }
+    }
+
+    private static int firstSignificantByte(ByteBuffer buffer) {
+        for (int i = buffer.position(); i < buffer.limit(); i++) {
+            byte value = buffer.get(i);
+            if (!Character.isWhitespace(value)) {
+                return value;
+            }
+        }
+        return -1;
+    }
+
+    private static void closeFile(RandomAccessFile file, String fileName) {
+        if (file != null) {
+            try {
+                file.close();
+            } catch (IOException ioe) {
+                LOGGER.fine("WLSDPLY-01716", ioe, fileName, ioe.getLocalizedMessage());
+            }
+        }
+    }
+
+    private static final class ByteBufferInputStream extends InputStream {
+        private final ByteBuffer buffer;
+
+        private ByteBufferInputStream(ByteBuffer buffer) {
+            this.buffer = buffer;
+        }
+
+        @Override
+        public int read() {
+            return buffer.hasRemaining() ? buffer.get() & 0xFF : -1;
+        }
+
+        @Override
+        public int read(byte[] bytes, int offset, int length) {
+            if (length == 0) {
+                return 0;
+            }
+            if (!buffer.hasRemaining()) {
+                return -1;
+            }
+            int count = Math.min(length, buffer.remaining());
+            buffer.get(bytes, offset, count);
+            return count;
+        }
+
+        @Override
+        public long skip(long count) {
+            int skipped = (int) Math.max(0, Math.min(count, buffer.remaining()));
+            buffer.position(buffer.position() + skipped);
+            return skipped;
+        }
+
+        @Override
+        public int available() {
+            return buffer.remaining();
+        }
+    }
+}
@@ -1,19 +1,13 @@
 /*
- * Copyright (c) 2017, 2022, Oracle and/or its affiliates.
+ * Copyright (c) 2017, 2023, Oracle and/or its affiliates.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.util;
 
-import java.io.IOException;
-import java.io.ObjectInputStream;
-import java.util.ArrayList;
-import java.util.Collection;
+import java.util.Arrays;
 import java.util.Iterator;
-import java.util.LinkedHashMap;
 import java.util.LinkedHashSet;
-import java.util.List;
-import java.util.Map;
-import java.util.Set;
+import java.util.concurrent.atomic.AtomicLong;
 
 import oracle.weblogic.deploy.exception.ExceptionHelper;
 import oracle.weblogic.deploy.logging.PlatformLogger;
@@ -31,22 +25,46 @@ import org.python.core.ThreadState;
 
 /**
  * A basic implementation of a Python dictionary that preserves order.
+ * <p>
+ * The keys and values are only stored in the PyDictionary superclass, so that Jython code that accesses
+ * the dictionary storage directly sees the same entries.  The insertion order is kept in a linked set of
+ * the keys, so keys are added and removed in constant time, and the values are not referenced twice.
+ * <p>
+ * The model parsers mark each dictionary whose keys and string values have no token text (such as @@PROP:),
+ * so that tools can skip dictionaries without tokens.  Any change to the entries clears the mark.  The mark
+ * does not cover nested dictionaries and lists.  isTokenFree() checks them, and keeps the result for the
+ * dictionary until any ordered dictionary gets an entry that may add token text, so repeated checks of
+ * the same subtree are not repeated walks.  Lists can change without notice, so a subtree with lists is
+ * checked again each time it is found to be token free.
  */
 public final class PyOrderedDict extends PyDictionary implements Iterable<PyObject> {
     private static final long serialVersionUID = 1L;
 
     private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.util");
 
-    private final LinkedHashMap<PyObject, PyObject> linkedHashMap;
+    private final LinkedHashSet<PyObject> orderedKeys;
 
     private final transient CommentMap commentMap = new CommentMap();
 
+    private static final String TOKEN_TEXT = "@@";
+
+    // true if no key or string value had token text when the entries were checked
+    private transient boolean entriesTokenFree;
+
+    // incremented by any change that may add token text to an ordered dictionary, so it invalidates
+    // the subtree results kept by every ordered dictionary
+    private static final AtomicLong TOKEN_CHANGE_COUNT = new AtomicLong();
+
+    // the subtree result of the last isTokenFree() check, which is current if the check count matches
+    private transient boolean subtreeTokenFree;
+    private transient long subtreeCheckCount = -1;
+
     /**
      * The no-args constructor.
      */
     public PyOrderedDict() {
         super(PyType.fromClass(PyOrderedDict.class));
-        this.linkedHashMap = new LinkedHashMap<>();
+        this.orderedKeys = new LinkedHashSet<>();
     }
 
     /**
@@ -56,7 +74,6 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     public PyOrderedDict(PyOrderedDict other) {
         this();
-        super.update(other);
         update(other);
     }
 
@@ -105,8 +122,8 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
             return -2;
         } else {
             other = (PyOrderedDict) obOther;
-            int an = this.linkedHashMap.size();
-            int bn = other.linkedHashMap.size();
+            int an = this.__len__();
+            int bn = other.__len__();
             if (an < bn) {
                 return -1;
             } else if (an > bn) {
@@ -120,7 +137,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         akeys.sort();
         bkeys.sort();
 
-        for (int i = 0; i < other.linkedHashMap.size(); i++) {
+        for (int i = 0; i < other.__len__(); i++) {
             PyObject akey = akeys.pyget(i);
             PyObject bkey = bkeys.pyget(i);
             int c = akey._cmp(bkey);
@@ -186,11 +203,12 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         // referenced from one of it's attributes.
         memoDict.__setitem__(new PyString(Py.idstr(this)), newPyOrderedDict);
 
-        for (Map.Entry<PyObject, PyObject> entry : linkedHashMap.entrySet()) {
-            PyObject newKey = doDeepCopy(entry.getKey(), memo);
-            PyObject newValue = doDeepCopy(entry.getValue(), memo);
+        for (PyObject key : orderedKeys) {
+            PyObject newKey = doDeepCopy(key, memo);
+            PyObject newValue = doDeepCopy(super.__finditem__(key), memo);
             newPyOrderedDict.__setitem__(newKey, newValue);
         }
+        newPyOrderedDict.entriesTokenFree = this.entriesTokenFree;
         return newPyOrderedDict;
     }
 
@@ -199,13 +217,13 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public void __delitem__(PyObject key) {
-        synchronized (this.linkedHashMap){
-            PyObject ret = this.linkedHashMap.remove(key);
-            if (ret == null) {
-                throw Py.KeyError(key.toString());
-            }
+        if (super.__finditem__(key) == null) {
+            throw Py.KeyError(key.toString());
         }
+        this.orderedKeys.remove(key);
         super.__delitem__(key);
+        this.entriesTokenFree = false;
+        this.subtreeCheckCount = -1;
     }
 
     /**
@@ -219,8 +237,8 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
 
         PyObject result = Py.One;
         PyOrderedDict other = (PyOrderedDict)obOther;
-        int an = this.linkedHashMap.size();
-        int bn = other.linkedHashMap.size();
+        int an = this.__len__();
+        int bn = other.__len__();
         if (an != bn) {
             result = Py.Zero;
         } else {
@@ -257,7 +275,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject __iter__(){
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.KEYS);
+        return new PyOrderedDictIter(this, getKeyArray(), PyOrderedDictIter.KEYS);
     }
 
     /**
@@ -265,7 +283,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public int __len__() {
-        return this.linkedHashMap.size();
+        return this.orderedKeys.size();
     }
 
     /**
@@ -273,7 +291,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public boolean __nonzero__() {
-        return this.linkedHashMap.size() != 0;
+        return !this.orderedKeys.isEmpty();
     }
 
     /**
@@ -281,13 +299,17 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public void __setitem__(PyObject key, PyObject value) {
-        synchronized (this.linkedHashMap) {
-            this.linkedHashMap.put(key, value);
-        }
         // do not access protected field directly.
         // 2.7 version does not have table variable.
-        // Neither version has synchronization on the table.
+        if (super.__finditem__(key) == null) {
+            this.orderedKeys.add(key);
+        }
         super.__setitem__(key, value);
+        this.entriesTokenFree = false;
+        this.subtreeCheckCount = -1;
+        if (mayAddTokenText(key, value)) {
+            TOKEN_CHANGE_COUNT.incrementAndGet();
+        }
     }
 
     /**
@@ -295,8 +317,10 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public void clear() {
-        this.linkedHashMap.clear();
+        this.orderedKeys.clear();
         super.clear();
+        this.entriesTokenFree = false;
+        this.subtreeCheckCount = -1;
     }
 
     /**
@@ -306,6 +330,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
     public PyOrderedDict copy() {
         PyOrderedDict newPyOrderedDict = new PyOrderedDict();
         newPyOrderedDict.doUpdate(this);
+        newPyOrderedDict.entriesTokenFree = this.entriesTokenFree;
         return newPyOrderedDict;
     }
 
@@ -324,9 +349,9 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
     public PyObject get(PyObject key, PyObject defaultObject) {
         // Cannot use getOrDefault() as this is a Java 8 method and
         // the project is attempting to be compatible with Java 7...
-        PyObject result = defaultObject;
-        if (linkedHashMap.containsKey(key)) {
-            result = linkedHashMap.get(key);
+        PyObject result = super.__finditem__(key);
+        if (result == null) {
+            result = defaultObject;
         }
         return result;
     }
@@ -336,7 +361,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public boolean has_key(PyObject key) {
-        return this.linkedHashMap.containsKey(key);
+        return super.__finditem__(key) != null;
     }
 
     /**
@@ -344,12 +369,12 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyList items() {
-        Set<Map.Entry<PyObject, PyObject>> entries = this.linkedHashMap.entrySet();
-        List<PyObject> l = new ArrayList<>(entries.size());
-        for (Map.Entry<PyObject, PyObject> entry: entries) {
-            l.add(new PyTuple(new PyObject[] { entry.getKey(), entry.getValue() }));
+        PyObject[] items = new PyObject[this.orderedKeys.size()];
+        int i = 0;
+        for (PyObject key : this.orderedKeys) {
+            items[i++] = new PyTuple(new PyObject[] { key, super.__finditem__(key) });
         }
-        return new PyList(l.toArray(new PyObject[0]));
+        return new PyList(items);
     }
 
     /**
@@ -357,7 +382,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public Iterator<PyObject> iterator(){
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.ITEMS);
+        return new PyOrderedDictIter(this, getKeyArray(), PyOrderedDictIter.ITEMS);
     }
 
     /**
@@ -365,7 +390,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject iterkeys() {
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.KEYS);
+        return new PyOrderedDictIter(this, getKeyArray(), PyOrderedDictIter.KEYS);
     }
 
     /**
@@ -373,7 +398,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject itervalues() {
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.VALUES);
+        return new PyOrderedDictIter(this, getKeyArray(), PyOrderedDictIter.VALUES);
     }
 
     /**
@@ -381,7 +406,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject iteritems() {
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.ITEMS);
+        return new PyOrderedDictIter(this, getKeyArray(), PyOrderedDictIter.ITEMS);
     }
 
     /**
@@ -389,10 +414,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyList keys() {
-        Set<PyObject> keys = this.linkedHashMap.keySet();
-        List<PyObject> v = new ArrayList<>(keys.size());
-        v.addAll(keys);
-        return new PyList(v.toArray(new PyObject[0]));
+        return new PyList(getKeyArray());
     }
 
     /**
@@ -426,12 +448,11 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
             return "{...}";
         }
 
-        Set<Map.Entry<PyObject, PyObject>> entries = this.linkedHashMap.entrySet();
         StringBuilder buf = new StringBuilder("{");
-        for (Map.Entry<PyObject, PyObject> entry: entries) {
-            buf.append((entry.getKey()).__repr__());
+        for (PyObject key: this.orderedKeys) {
+            buf.append(key.__repr__());
             buf.append(": ");
-            buf.append((entry.getValue()).__repr__());
+            buf.append(super.__finditem__(key).__repr__());
             buf.append(", ");
         }
         if(buf.length() > 1){
@@ -473,16 +494,74 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      * @return an ordered list of values
      */
     public PyList getValues() {
-        Collection<PyObject> values = this.linkedHashMap.values();
-        List<PyObject> v = new ArrayList<>(values.size());
-        v.addAll(values);
-        return new PyList(v.toArray(new PyObject[0]));
+        PyObject[] values = new PyObject[this.orderedKeys.size()];
+        int i = 0;
+        for (PyObject key : this.orderedKeys) {
+            values[i++] = super.__finditem__(key);
+        }
+        return new PyList(values);
     }
 
     public CommentMap getCommentMap() {
         return commentMap;
     }
 
+    /**
+     * Check the keys and string values of this dictionary for token text, and mark the dictionary as token free
+     * if there is none.  Nested dictionaries and lists are not checked.  The mark is cleared by any change to the
+     * entries of this dictionary.
+     */
+    public void markTokenFree() {
+        for (PyObject key : this.orderedKeys) {
+            if (hasTokenText(key) || hasTokenText(super.__finditem__(key))) {
+                this.entriesTokenFree = false;
+                return;
+            }
+        }
+        this.entriesTokenFree = true;
+    }
+
+    /**
+     * Determine if this dictionary, and all the dictionaries and lists it contains, have no token text.
+     * This is only true if this dictionary and each nested ordered dictionary were marked as token free, and not
+     * changed since.  The strings in lists are checked, since changes to lists are not tracked.
+     * The result for each nested ordered dictionary is kept, so a later check of the same subtree is not
+     * another walk, unless an entry that may have token text was added to an ordered dictionary since.
+     *
+     * @return true if there are no tokens in this dictionary, false if there may be tokens
+     */
+    public boolean isTokenFree() {
+        return checkTokenFree() != TokenCheck.TOKENS;
+    }
+
+    // the subtree result is only kept if it does not depend on the contents of lists
+    private TokenCheck checkTokenFree() {
+        if (!this.entriesTokenFree) {
+            return TokenCheck.TOKENS;
+        }
+        long changeCount = TOKEN_CHANGE_COUNT.get();
+        if (this.subtreeCheckCount == changeCount) {
+            return this.subtreeTokenFree ? TokenCheck.TOKEN_FREE : TokenCheck.TOKENS;
+        }
+
+        TokenCheck result = TokenCheck.TOKEN_FREE;
+        for (PyObject key : this.orderedKeys) {
+            TokenCheck valueResult = checkTokenFreeValue(super.__finditem__(key));
+            if (valueResult == TokenCheck.TOKENS) {
+                result = TokenCheck.TOKENS;
+                break;
+            } else if (valueResult == TokenCheck.TOKEN_FREE_LISTS) {
+                result = TokenCheck.TOKEN_FREE_LISTS;
+            }
+        }
+
+        if (result != TokenCheck.TOKEN_FREE_LISTS) {
+            this.subtreeTokenFree = result == TokenCheck.TOKEN_FREE;
+            this.subtreeCheckCount = changeCount;
+        }
+        return result;
+    }
+
     public void addComment(String key, String comment) {
         commentMap.addComment(key, comment);
     }
@@ -501,7 +580,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
             result = super.equals(other);
             if (result) {
                 PyOrderedDict otherDict = (PyOrderedDict) other;
-                result = this.linkedHashMap.equals(otherDict.linkedHashMap) &&
+                result = Arrays.equals(this.getKeyArray(), otherDict.getKeyArray()) &&
                     this.commentMap.equals(otherDict.commentMap);
             }
         }
@@ -513,11 +592,44 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public int hashCode() {
-        return super.hashCode() >> 8 + this.linkedHashMap.hashCode() >> 4 + this.commentMap.hashCode();
+        return super.hashCode() >> 8 + this.orderedKeys.hashCode() >> 4 + this.commentMap.hashCode();
     }
 
     // private methods
 
+    private static boolean hasTokenText(PyObject value) {
+        // PyUnicode extends PyString
+        return value instanceof PyString && value.toString().contains(TOKEN_TEXT);
+    }
+
+    // a new entry with token text, or with a dictionary or list that may contain token text
+    private static boolean mayAddTokenText(PyObject key, PyObject value) {
+        return hasTokenText(key) || hasTokenText(value) || value instanceof PyDictionary || value instanceof PyList;
+    }
+
+    // strings were checked when the containing dictionary was marked
+    private static TokenCheck checkTokenFreeValue(PyObject value) {
+        if (value instanceof PyOrderedDict) {
+            return ((PyOrderedDict) value).checkTokenFree();
+        } else if (value instanceof PyDictionary) {
+            return TokenCheck.TOKENS;
+        } else if (value instanceof PyList) {
+            PyList list = (PyList) value;
+            for (int i = 0; i < list.__len__(); i++) {
+                PyObject element = list.pyget(i);
+                if (hasTokenText(element) || checkTokenFreeValue(element) == TokenCheck.TOKENS) {
+                    return TokenCheck.TOKENS;
+                }
+            }
+            return TokenCheck.TOKEN_FREE_LISTS;
+        }
+        return TokenCheck.TOKEN_FREE;
+    }
+
+    private PyObject[] getKeyArray() {
+        return this.orderedKeys.toArray(new PyObject[0]);
+    }
+
     private static PyObject dictFromKeys(PyType type, PyObject keys, PyObject value) {
         if (value == null) {
             value = Py.None;
@@ -536,7 +648,6 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         for (int i = 0; i < pylist.size(); i++) {
             PyTuple tuple = (PyTuple) pylist.get(i);
             this.__setitem__(Py.java2py(tuple.get(0)), Py.java2py(tuple.get(1)));
-            super.__setitem__(Py.java2py(tuple.get(0)), Py.java2py(tuple.get(1)));
         }
     }
 
@@ -617,6 +728,16 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         return newDict;
     }
 
+    /**
+     * The result of checking a dictionary or list for token text.
+     */
+    private enum TokenCheck {
+        TOKENS,
+        TOKEN_FREE,
+        // token free, but lists were checked, so the result can change without notice
+        TOKEN_FREE_LISTS
+    }
+
     /**
      * Iterator class for PyOrderedDict class.
      */
@@ -628,15 +749,14 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         private static final int ITEMS = 2;
 
         private final PyObject orderedDict;
-        private final Set<PyObject> dictKeys;
+        private final PyObject[] dictKeys;
         private final int type;
-        private transient Iterator<PyObject> iter;
+        private int index;
 
-        private PyOrderedDictIter(PyObject orderedDict, Set<PyObject> dictKeys, int type) {
+        private PyOrderedDictIter(PyObject orderedDict, PyObject[] dictKeys, int type) {
             this.orderedDict = orderedDict;
-            this.dictKeys = new LinkedHashSet<>(dictKeys);
+            this.dictKeys = dictKeys;
             this.type = type;
-            this.iter = dictKeys.iterator();
         }
 
         /**
@@ -652,7 +772,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
          */
         @Override
         public boolean hasNext(){
-            return this.iter.hasNext();
+            return this.index < this.dictKeys.length;
         }
 
         /**
@@ -662,7 +782,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         public PyObject next() {
             PyObject result = null;
             if (hasNext()) {
-                PyObject key = this.iter.next();
+                PyObject key = this.dictKeys[this.index++];
                 switch (type) {
                     case VALUES:
                         result = orderedDict.__finditem__(key);
@@ -680,12 +800,6 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
             return result;
         }
 
-        @SuppressWarnings("unused")
-        private void readObject(ObjectInputStream in) throws IOException, ClassNotFoundException {
-            in.defaultReadObject();
-            iter = dictKeys.iterator();
-        }
-
         /**
          * {@inheritDoc}
          */
@@ -706,9 +820,9 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
                 if (result) {
                     PyOrderedDictIter otherIter = (PyOrderedDictIter) other;
                     result = this.orderedDict.equals(otherIter.orderedDict) &&
-                        this.dictKeys.equals(otherIter.dictKeys) &&
+                        Arrays.equals(this.dictKeys, otherIter.dictKeys) &&
                         this.type == otherIter.type &&
-                        this.iter.equals(otherIter.iter);
+                        this.index == otherIter.index;
                 }
             }
             return result;
@@ -717,7 +831,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         @Override
         public int hashCode() {
             return super.hashCode() >> 16 + this.orderedDict.hashCode() >> 12 +
-                this.dictKeys.hashCode() >> 8 + this.iter.hashCode() >> 4 +
+                Arrays.hashCode(this.dictKeys) >> 8 + this.index >> 4 +
                 Integer.valueOf(this.type).hashCode();
         }
     }
@@ -1,5 +1,5 @@
 /*
- * Copyright (c) 2017, 2022, Oracle and/or its affiliates.
+ * Copyright (c) 2017, 2023, Oracle and/or its affiliates.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.yaml;
@@ -35,6 +35,11 @@ import org.yaml.snakeyaml.constructor.SafeConstructor;
  * This class does the heavy-lifting of walking the parse tree and performing the conversion into a Python dictionary.
  */
 public abstract class AbstractYamlTranslator {
+    /**
+     * The system property that selects the SnakeYAML SafeConstructor loader, which builds Java maps and lists
+     * that are converted to Python objects, instead of the default YamlEventReader.
+     */
+    public static final String USE_CONSTRUCTOR_PROPERTY = "wdt.yaml.use.constructor";
 
     private final boolean useOrderedDict;
     private final boolean useUnicode;
@@ -80,28 +85,16 @@ public abstract class AbstractYamlTranslator {
     protected PyList parseInternal(InputStream inputStream, boolean allowMultiple) throws YamlException {
         final String METHOD = "parseInternal";
 
-        // there are problems using PyList.add(),
-        // so build a java.util.List and construct PyList(javaList).
-        List<PyObject> result = new ArrayList<>();
+        PyList result = new PyList();
         if (inputStream != null) {
-            Yaml parser = new Yaml(new SafeConstructor(this.getDefaultLoaderOptions()));
-
             try {
-                Iterable<Object> docsIterable = parser.loadAll(inputStream);
-                List<Object> documents = new ArrayList<>();
-                for (Object document : docsIterable) {
-                    documents.add(document);
-                }
-
-                // don't continue with conversion if multiple documents check fails
-                if(!allowMultiple && documents.size() > 1) {
-                    YamlException pex = new YamlException("WLSDPLY-18101", this.fileName, documents.size());
-                    getLogger().throwing(getClassName(), METHOD, pex);
-                    throw pex;
-                }
-
-                for (Object document : documents) {
-                    result.add(convertJavaDataStructureToPython(document));
+                if (Boolean.getBoolean(USE_CONSTRUCTOR_PROPERTY)) {
+                    getLogger().fine("WLSDPLY-18119", this.fileName, USE_CONSTRUCTOR_PROPERTY);
+                    result = parseWithConstructor(inputStream, allowMultiple);
+                } else {
+                    YamlEventReader reader = new YamlEventReader(this.fileName, inputStream, this.useOrderedDict,
+                        this.useUnicode, this.getDefaultLoaderOptions());
+                    result = reader.readDocuments(allowMultiple);
                 }
             } catch (YamlException yex) {
                 throw yex;
@@ -111,6 +104,32 @@ public abstract class AbstractYamlTranslator {
                 throw pex;
             }
         }
+        return result;
+    }
+
+    private PyList parseWithConstructor(InputStream inputStream, boolean allowMultiple) throws YamlException {
+        final String METHOD = "parseWithConstructor";
+
+        Yaml parser = new Yaml(new SafeConstructor(this.getDefaultLoaderOptions()));
+        Iterable<Object> docsIterable = parser.loadAll(inputStream);
+        List<Object> documents = new ArrayList<>();
+        for (Object document : docsIterable) {
+            documents.add(document);
+        }
+
+        // don't continue with conversion if multiple documents check fails
+        if(!allowMultiple && documents.size() > 1) {
+            YamlException pex = new YamlException("WLSDPLY-18101", this.fileName, documents.size());
+            getLogger().throwing(getClassName(), METHOD, pex);
+            throw pex;
+        }
+
+        // there are problems using PyList.add(),
+        // so build a java.util.List and construct PyList(javaList).
+        List<PyObject> result = new ArrayList<>();
+        for (Object document : documents) {
+            result.add(convertJavaDataStructureToPython(document));
+        }
         return new PyList(result.toArray(new PyObject[0]));
     }
 
@@ -153,7 +172,7 @@ public abstract class AbstractYamlTranslator {
         return result;
     }
 
-    private DumperOptions getDefaultDumperOptions() {
+    static DumperOptions getDefaultDumperOptions() {
         DumperOptions result = new DumperOptions();
         result.setIndent(4);
         result.setIndicatorIndent(2);
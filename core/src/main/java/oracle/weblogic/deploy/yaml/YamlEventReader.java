@@ -0,0 +1,458 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.yaml;
+
+import java.io.InputStream;
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.Iterator;
+import java.util.List;
+import java.util.Map;
+
+import oracle.weblogic.deploy.exception.ExceptionHelper;
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+import oracle.weblogic.deploy.util.PyOrderedDict;
+import oracle.weblogic.deploy.util.PyRealBoolean;
+
+import org.python.core.Py;
+import org.python.core.PyDictionary;
+import org.python.core.PyFloat;
+import org.python.core.PyInteger;
+import org.python.core.PyList;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyString;
+import org.python.core.PyUnicode;
+
+import org.yaml.snakeyaml.LoaderOptions;
+import org.yaml.snakeyaml.Yaml;
+import org.yaml.snakeyaml.constructor.SafeConstructor;
+import org.yaml.snakeyaml.error.Mark;
+import org.yaml.snakeyaml.events.AliasEvent;
+import org.yaml.snakeyaml.events.CollectionStartEvent;
+import org.yaml.snakeyaml.events.Event;
+import org.yaml.snakeyaml.events.NodeEvent;
+import org.yaml.snakeyaml.events.ScalarEvent;
+import org.yaml.snakeyaml.nodes.NodeId;
+import org.yaml.snakeyaml.nodes.ScalarNode;
+import org.yaml.snakeyaml.nodes.Tag;
+import org.yaml.snakeyaml.reader.UnicodeReader;
+import org.yaml.snakeyaml.resolver.Resolver;
+
+/**
+ * A YAML reader that builds the Python dictionaries directly from the SnakeYAML parser event stream,
+ * without composing a node graph or constructing Java maps and lists first.  Scalars are resolved and
+ * constructed the same way as the SafeConstructor, and the Python objects that are created are the same
+ * as those created by converting the SafeConstructor result in AbstractYamlTranslator.
+ */
+public class YamlEventReader {
+    private static final String CLASS = YamlEventReader.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.yaml");
+
+    private static final String MERGE_KEY = "<<";
+    private static final String NON_SPECIFIC_TAG = "!";
+
+    private final String fileName;
+    private final InputStream yamlStream;
+    private final boolean useOrderedDict;
+    private final boolean useUnicode;
+    private final LoaderOptions loaderOptions;
+    private final Resolver resolver = new Resolver();
+    private final ScalarConstructor scalarConstructor;
+
+    // keys are repeated many times in models, so share their Python strings
+    private final Map<String, PyObject> keyStrings = new HashMap<>();
+    private final Map<String, PyObject> anchors = new HashMap<>();
+    private int collectionAliasCount;
+
+    /**
+     * The constructor.
+     *
+     * @param fileName the name of the file being read, used only for messages
+     * @param yamlStream the input stream, which is not closed by this class
+     * @param useOrderedDict whether to use ordered dictionaries for YAML mappings
+     * @param useUnicode whether to use PyUnicode instead of PyString for YAML strings
+     * @param loaderOptions the SnakeYAML loader options, such as the code point limit
+     */
+    public YamlEventReader(String fileName, InputStream yamlStream, boolean useOrderedDict, boolean useUnicode,
+                           LoaderOptions loaderOptions) {
+        this.fileName = fileName;
+        this.yamlStream = yamlStream;
+        this.useOrderedDict = useOrderedDict;
+        this.useUnicode = useUnicode;
+        this.loaderOptions = loaderOptions;
+        this.scalarConstructor = new ScalarConstructor(loaderOptions);
+    }
+
+    /**
+     * Read the YAML documents from the input stream and convert each of them to a Python dictionary.
+     * Errors reported by the SnakeYAML parser are thrown as they are, so the caller can handle them
+     * the same way as errors from the SnakeYAML loader.
+     *
+     * @param allowMultiple whether the input may contain more than one document
+     * @return a list of Python dictionaries, one for each document
+     * @throws YamlException if a document cannot be converted to a Python dictionary
+     */
+    public PyList readDocuments(boolean allowMultiple) throws YamlException {
+        final String METHOD = "readDocuments";
+
+        LOGGER.entering(CLASS, METHOD, fileName, allowMultiple);
+        PyList result = new PyList();
+        Iterator<Event> events = new Yaml(loaderOptions).parse(new UnicodeReader(yamlStream)).iterator();
+        int documentCount = 0;
+        while (events.hasNext()) {
+            Event event = events.next();
+            if (event.getEventId() == Event.ID.DocumentStart) {
+                documentCount++;
+
+                // extra documents are parsed to count them, but not converted
+                if (allowMultiple || documentCount == 1) {
+                    result.pyadd(readDocument(events));
+                }
+            }
+        }
+
+        if (!allowMultiple && documentCount > 1) {
+            YamlException pex = new YamlException("WLSDPLY-18101", fileName, documentCount);
+            LOGGER.throwing(CLASS, METHOD, pex);
+            throw pex;
+        }
+        LOGGER.exiting(CLASS, METHOD);
+        return result;
+    }
+
+    private PyDictionary readDocument(Iterator<Event> events) throws YamlException {
+        final String METHOD = "readDocument";
+
+        // anchors are only visible within their own document
+        anchors.clear();
+        PyObject value = readNode(events.next(), events, 0, false);
+        if (value == null) {
+            YamlException pex = new YamlException("WLSDPLY-18104", fileName);
+            LOGGER.throwing(CLASS, METHOD, pex);
+            throw pex;
+        } else if (!(value instanceof PyDictionary)) {
+            YamlException pex = new YamlException("WLSDPLY-18103", fileName, value.getClass().getName());
+            LOGGER.throwing(CLASS, METHOD, pex);
+            throw pex;
+        }
+        return (PyDictionary) value;
+    }
+
+    // returns null for a null scalar, so the caller can decide how to represent it
+    private PyObject readNode(Event event, Iterator<Event> events, int depth, boolean isKey) throws YamlException {
+        PyObject result;
+        switch (event.getEventId()) {
+            case Scalar:
+                result = readScalar((ScalarEvent) event, isKey);
+                break;
+
+            case MappingStart:
+                result = readMapping((CollectionStartEvent) event, events, depth + 1);
+                break;
+
+            case SequenceStart:
+                result = readSequence((CollectionStartEvent) event, events, depth + 1);
+                break;
+
+            case Alias:
+                return readAlias((AliasEvent) event);
+
+            default:
+                throw parseError(event.getStartMark(), "WLSDPLY-18117", event.getEventId());
+        }
+
+        String anchor = ((NodeEvent) event).getAnchor();
+        if (anchor != null) {
+            anchors.put(anchor, result);
+        }
+        return result;
+    }
+
+    private PyDictionary readMapping(CollectionStartEvent startEvent, Iterator<Event> events, int depth)
+        throws YamlException {
+        final String METHOD = "readMapping";
+
+        checkCollection(startEvent, Tag.MAP, depth);
+        PyDictionary result = newDictionary();
+        List<PyDictionary> mergeSources = null;
+        Event keyEvent = events.next();
+        while (keyEvent.getEventId() != Event.ID.MappingEnd) {
+            if (isMergeKey(keyEvent)) {
+                PyObject mergeValue = readNode(events.next(), events, depth, false);
+                if (mergeSources == null) {
+                    mergeSources = new ArrayList<>();
+                }
+                addMergeSources(mergeSources, mergeValue, keyEvent.getStartMark());
+            } else {
+                PyObject key = readNode(keyEvent, events, depth, true);
+                if (key == null) {
+                    key = Py.None;
+                } else if (key instanceof PyDictionary || key instanceof PyList) {
+                    YamlException pex = new YamlException("WLSDPLY-18102", fileName, key.getClass().getName());
+                    LOGGER.throwing(CLASS, METHOD, pex);
+                    throw pex;
+                }
+
+                if (!loaderOptions.isAllowDuplicateKeys() && result.has_key(key)) {
+                    throw parseError(keyEvent.getStartMark(), "WLSDPLY-18112", key);
+                }
+
+                // snakeyaml sets the value of an empty map node to null, which WDT reads as an empty dictionary
+                PyObject value = readNode(events.next(), events, depth, false);
+                if (value == null) {
+                    PyDictionary empty = newDictionary();
+                    markTokenFree(empty);
+                    value = empty;
+                }
+                result.__setitem__(key, value);
+            }
+            keyEvent = events.next();
+        }
+
+        if (mergeSources != null) {
+            result = mergeMapping(result, mergeSources);
+        }
+        markTokenFree(result);
+        return result;
+    }
+
+    private PyList readSequence(CollectionStartEvent startEvent, Iterator<Event> events, int depth)
+        throws YamlException {
+        checkCollection(startEvent, Tag.SEQ, depth);
+        PyList result = new PyList();
+        Event event = events.next();
+        while (event.getEventId() != Event.ID.SequenceEnd) {
+            PyObject value = readNode(event, events, depth, false);
+            result.pyadd(value == null ? Py.None : value);
+            event = events.next();
+        }
+        return result;
+    }
+
+    private PyObject readAlias(AliasEvent event) throws YamlException {
+        String anchor = event.getAnchor();
+        if (!anchors.containsKey(anchor)) {
+            throw parseError(event.getStartMark(), "WLSDPLY-18113", anchor);
+        }
+
+        // each alias gets its own copy, as it did when the SafeConstructor result was converted
+        PyObject value = anchors.get(anchor);
+        if (value instanceof PyDictionary || value instanceof PyList) {
+            collectionAliasCount++;
+            if (collectionAliasCount > loaderOptions.getMaxAliasesForCollections()) {
+                throw parseError(event.getStartMark(), "WLSDPLY-18114",
+                    loaderOptions.getMaxAliasesForCollections());
+            }
+            value = copyValue(value);
+        }
+        return value;
+    }
+
+    private PyObject readScalar(ScalarEvent event, boolean isKey) throws YamlException {
+        String value = event.getValue();
+        Tag tag = resolveTag(event);
+        if (Tag.STR.equals(tag)) {
+            return isKey ? getKeyString(value) : getPythonString(value);
+        }
+
+        ScalarNode node = new ScalarNode(tag, value, event.getStartMark(), event.getEndMark(), event.getScalarStyle());
+        return convertScalarToPythonObject(scalarConstructor.constructScalarValue(node));
+    }
+
+    private Tag resolveTag(ScalarEvent event) {
+        String tag = event.getTag();
+        if (tag == null || NON_SPECIFIC_TAG.equals(tag)) {
+            return resolver.resolve(NodeId.scalar, event.getValue(), event.getImplicit().canOmitTagInPlainScalar());
+        }
+        return new Tag(tag);
+    }
+
+    private boolean isMergeKey(Event event) {
+        if (event.getEventId() == Event.ID.Scalar) {
+            ScalarEvent scalarEvent = (ScalarEvent) event;
+            return MERGE_KEY.equals(scalarEvent.getValue()) && Tag.MERGE.equals(resolveTag(scalarEvent));
+        }
+        return false;
+    }
+
+    private void addMergeSources(List<PyDictionary> mergeSources, PyObject mergeValue, Mark mark)
+        throws YamlException {
+        if (mergeValue instanceof PyDictionary) {
+            mergeSources.add((PyDictionary) mergeValue);
+        } else if (mergeValue instanceof PyList) {
+            PyList list = (PyList) mergeValue;
+            for (int i = 0; i < list.__len__(); i++) {
+                PyObject element = list.__getitem__(i);
+                if (!(element instanceof PyDictionary)) {
+                    throw parseError(mark, "WLSDPLY-18115");
+                }
+                mergeSources.add((PyDictionary) element);
+            }
+        } else {
+            throw parseError(mark, "WLSDPLY-18115");
+        }
+    }
+
+    // merged keys come first and never replace explicit keys, and earlier sources take precedence
+    private PyDictionary mergeMapping(PyDictionary mapping, List<PyDictionary> mergeSources) {
+        PyDictionary result = newDictionary();
+        for (PyDictionary source : mergeSources) {
+            PyList keys = source.keys();
+            for (int i = 0; i < keys.__len__(); i++) {
+                PyObject key = keys.__getitem__(i);
+                if (!mapping.has_key(key) && !result.has_key(key)) {
+                    result.__setitem__(key, source.__finditem__(key));
+                }
+            }
+        }
+
+        PyList keys = mapping.keys();
+        for (int i = 0; i < keys.__len__(); i++) {
+            PyObject key = keys.__getitem__(i);
+            result.__setitem__(key, mapping.__finditem__(key));
+        }
+        return result;
+    }
+
+    private void checkCollection(CollectionStartEvent event, Tag expectedTag, int depth) throws YamlException {
+        if (depth > loaderOptions.getNestingDepthLimit()) {
+            throw parseError(event.getStartMark(), "WLSDPLY-18116", loaderOptions.getNestingDepthLimit());
+        }
+
+        String tag = event.getTag();
+        if (tag != null && !NON_SPECIFIC_TAG.equals(tag) && !expectedTag.equals(new Tag(tag))) {
+            throw parseError(event.getStartMark(), "WLSDPLY-18117", tag);
+        }
+    }
+
+    private PyObject copyValue(PyObject value) {
+        if (value instanceof PyDictionary) {
+            PyDictionary source = (PyDictionary) value;
+            PyDictionary result = newDictionary();
+            PyList keys = source.keys();
+            for (int i = 0; i < keys.__len__(); i++) {
+                PyObject key = keys.__getitem__(i);
+                result.__setitem__(key, copyValue(source.__finditem__(key)));
+            }
+            markTokenFree(result);
+            return result;
+        } else if (value instanceof PyList) {
+            PyList source = (PyList) value;
+            PyList result = new PyList();
+            for (int i = 0; i < source.__len__(); i++) {
+                result.pyadd(copyValue(source.__getitem__(i)));
+            }
+            return result;
+        }
+
+        // scalars are immutable, so they can be shared
+        return value;
+    }
+
+    private PyObject convertScalarToPythonObject(Object object) throws YamlException {
+        final String METHOD = "convertScalarToPythonObject";
+
+        PyObject result = null;
+        if (object != null) {
+            String classname = object.getClass().getName();
+            switch (classname) {
+                case "java.lang.String":
+                    result = getPythonString((String) object);
+                    break;
+
+                case "java.lang.Boolean":
+                    result = new PyRealBoolean((Boolean) object);
+                    break;
+
+                case "java.lang.Integer":
+                    result = new PyInteger((Integer) object);
+                    break;
+
+                case "java.lang.Long":
+                    result = new PyLong((Long) object);
+                    break;
+
+                case "java.math.BigInteger":
+                    result = new PyLong((BigInteger) object);
+                    break;
+
+                case "java.lang.Float":
+                    result = new PyFloat((Float) object);
+                    break;
+
+                case "java.lang.Double":
+                    result = new PyFloat((Double) object);
+                    break;
+
+                case "java.math.BigDecimal":
+                    result = new PyFloat(((BigDecimal) object).doubleValue());
+                    break;
+
+                default:
+                    YamlException pex = new YamlException("WLSDPLY-18102", fileName, classname);
+                    LOGGER.throwing(CLASS, METHOD, pex);
+                    throw pex;
+            }
+        }
+        return result;
+    }
+
+    private PyDictionary newDictionary() {
+        if (useOrderedDict) {
+            return new PyOrderedDict();
+        }
+        return new PyDictionary();
+    }
+
+    private static void markTokenFree(PyDictionary dictionary) {
+        if (dictionary instanceof PyOrderedDict) {
+            ((PyOrderedDict) dictionary).markTokenFree();
+        }
+    }
+
+    private PyObject getKeyString(String key) {
+        PyObject result = keyStrings.get(key);
+        if (result == null) {
+            result = getPythonString(key);
+            keyStrings.put(key, result);
+        }
+        return result;
+    }
+
+    private PyObject getPythonString(String value) {
+        if (useUnicode) {
+            return new PyUnicode(value);
+        }
+        return new PyString(value);
+    }
+
+    private YamlException parseError(Mark mark, String key, Object... args) {
+        final String METHOD = "parseError";
+
+        String message = ExceptionHelper.getMessage(key, args);
+        YamlException pex = new YamlException("WLSDPLY-18118", fileName, mark.getLine() + 1, mark.getColumn() + 1,
+            message);
+        LOGGER.throwing(CLASS, METHOD, pex);
+        return pex;
+    }
+
+    /**
+     * Exposes the SafeConstructor scalar constructors, so that scalars are constructed exactly as the
+     * SnakeYAML loader would construct them.
+     */
+    private static final class ScalarConstructor extends SafeConstructor {
+        private ScalarConstructor(LoaderOptions loaderOptions) {
+            super(loaderOptions);
+        }
+
+        private Object constructScalarValue(ScalarNode node) {
+            return getConstructor(node).construct(node);
+        }
+    }
+}
@@ -0,0 +1,256 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.yaml;
+
+import java.io.BufferedWriter;
+import java.io.IOException;
+import java.io.Writer;
+import java.math.BigInteger;
+import java.util.List;
+import java.util.regex.Pattern;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+import oracle.weblogic.deploy.util.CommentMap;
+
+import org.yaml.snakeyaml.DumperOptions;
+import org.yaml.snakeyaml.comments.CommentType;
+import org.yaml.snakeyaml.emitter.Emitter;
+import org.yaml.snakeyaml.events.CommentEvent;
+import org.yaml.snakeyaml.events.DocumentEndEvent;
+import org.yaml.snakeyaml.events.DocumentStartEvent;
+import org.yaml.snakeyaml.events.Event;
+import org.yaml.snakeyaml.events.ImplicitTuple;
+import org.yaml.snakeyaml.events.MappingEndEvent;
+import org.yaml.snakeyaml.events.MappingStartEvent;
+import org.yaml.snakeyaml.events.ScalarEvent;
+import org.yaml.snakeyaml.events.SequenceEndEvent;
+import org.yaml.snakeyaml.events.SequenceStartEvent;
+import org.yaml.snakeyaml.events.StreamEndEvent;
+import org.yaml.snakeyaml.events.StreamStartEvent;
+import org.yaml.snakeyaml.nodes.NodeId;
+import org.yaml.snakeyaml.nodes.Tag;
+import org.yaml.snakeyaml.resolver.Resolver;
+
+import static oracle.weblogic.deploy.util.CommentMap.BLANK_LINE_KEY;
+
+/**
+ * Writes YAML documents as a stream of SnakeYAML emitter events, so that a model can be written as it is
+ * walked, without first being converted to Java maps and lists.  Scalars, comments and styles are written
+ * the same way as YamlRepresenter and the SnakeYAML serializer write them, using the same dumper options as
+ * AbstractYamlTranslator, so the output is the same.  The caller is responsible for sending the start and
+ * end calls in a valid order.
+ */
+public class YamlEventWriter {
+    private static final String CLASS = YamlEventWriter.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.yaml");
+
+    // the same pattern that the SnakeYAML safe representer uses to select the literal style
+    private static final Pattern MULTILINE_PATTERN = Pattern.compile("\n|\u0085|\u2028|\u2029");
+
+    private final String fileName;
+    private final Writer writer;
+    private final DumperOptions dumperOptions;
+    private final Emitter emitter;
+    private final Resolver resolver = new Resolver();
+    private boolean streamStarted;
+    private boolean closed;
+
+    // the number of open documents and collections, which is not zero if writing stopped because of an error
+    private int depth;
+
+    /**
+     * The constructor.
+     *
+     * @param fileName the name of the output file, used only for messages
+     * @param outputWriter the writer for the YAML output, which is buffered by this class and closed by close()
+     */
+    public YamlEventWriter(String fileName, Writer outputWriter) {
+        this.fileName = fileName;
+        if (outputWriter instanceof BufferedWriter) {
+            this.writer = outputWriter;
+        } else {
+            this.writer = new BufferedWriter(outputWriter);
+        }
+        this.dumperOptions = AbstractYamlTranslator.getDefaultDumperOptions();
+        this.emitter = new Emitter(this.writer, this.dumperOptions);
+    }
+
+    /**
+     * Start a new YAML document.
+     *
+     * @throws YamlException if an error occurs writing the output
+     */
+    public void startDocument() throws YamlException {
+        depth++;
+        if (!streamStarted) {
+            emit(new StreamStartEvent(null, null));
+            streamStarted = true;
+        }
+        emit(new DocumentStartEvent(null, null, dumperOptions.isExplicitStart(), dumperOptions.getVersion(),
+            dumperOptions.getTags()));
+    }
+
+    /**
+     * End the current YAML document.
+     *
+     * @throws YamlException if an error occurs writing the output
+     */
+    public void endDocument() throws YamlException {
+        emit(new DocumentEndEvent(null, null, dumperOptions.isExplicitEnd()));
+        depth--;
+    }
+
+    /**
+     * Start a mapping.  Each entry is written as a key, followed by a scalar or a collection for the value.
+     *
+     * @throws YamlException if an error occurs writing the output
+     */
+    public void startMapping() throws YamlException {
+        depth++;
+        emit(new MappingStartEvent(null, Tag.MAP.getValue(), true, null, null, dumperOptions.getDefaultFlowStyle()));
+    }
+
+    /**
+     * End the current mapping.
+     *
+     * @throws YamlException if an error occurs writing the output
+     */
+    public void endMapping() throws YamlException {
+        emit(new MappingEndEvent(null, null));
+        depth--;
+    }
+
+    /**
+     * Start a sequence.
+     *
+     * @throws YamlException if an error occurs writing the output
+     */
+    public void startSequence() throws YamlException {
+        depth++;
+        emit(new SequenceStartEvent(null, Tag.SEQ.getValue(), true, null, null, dumperOptions.getDefaultFlowStyle()));
+    }
+
+    /**
+     * End the current sequence.
+     *
+     * @throws YamlException if an error occurs writing the output
+     */
+    public void endSequence() throws YamlException {
+        emit(new SequenceEndEvent(null, null));
+        depth--;
+    }
+
+    /**
+     * Write a mapping key, preceded by any comments for the key.
+     *
+     * @param key the key
+     * @param commentMap the comments for the mapping, or null if there are none
+     * @throws YamlException if an error occurs writing the output
+     */
+    public void writeKey(String key, CommentMap commentMap) throws YamlException {
+        if (commentMap != null) {
+            List<String> comments = commentMap.getComments(key);
+            for (String comment : comments) {
+                if (BLANK_LINE_KEY.equals(comment)) {
+                    emit(new CommentEvent(CommentType.BLANK_LINE, "", null, null));
+                } else {
+                    emit(new CommentEvent(CommentType.BLOCK, " " + comment, null, null));
+                }
+            }
+        }
+        writeScalar(key);
+    }
+
+    /**
+     * Write a scalar value, represented as the SnakeYAML safe representer would represent it.
+     *
+     * @param value a String, Boolean, Integer, Long, BigInteger or Double value, or null
+     * @throws YamlException if the value has an unsupported type, or an error occurs writing the output
+     */
+    public void writeScalar(Object value) throws YamlException {
+        final String METHOD = "writeScalar";
+
+        if (value == null) {
+            emitScalar(Tag.NULL, "null", dumperOptions.getDefaultScalarStyle());
+        } else if (value instanceof String) {
+            String text = (String) value;
+            DumperOptions.ScalarStyle style = dumperOptions.getDefaultScalarStyle();
+            if (style == DumperOptions.ScalarStyle.PLAIN && MULTILINE_PATTERN.matcher(text).find()) {
+                style = DumperOptions.ScalarStyle.LITERAL;
+            }
+            emitScalar(Tag.STR, text, style);
+        } else if (value instanceof Boolean) {
+            emitScalar(Tag.BOOL, value.toString(), dumperOptions.getDefaultScalarStyle());
+        } else if (value instanceof Integer || value instanceof Long || value instanceof BigInteger) {
+            emitScalar(Tag.INT, value.toString(), dumperOptions.getDefaultScalarStyle());
+        } else if (value instanceof Double || value instanceof Float) {
+            emitScalar(Tag.FLOAT, getFloatText((Number) value), dumperOptions.getDefaultScalarStyle());
+        } else {
+            YamlException pex = new YamlException("WLSDPLY-18201", value.getClass().getName());
+            LOGGER.throwing(CLASS, METHOD, pex);
+            throw pex;
+        }
+    }
+
+    /**
+     * End the output, and flush and close the writer.  If the output is incomplete because an error occurred,
+     * the writer is closed without ending the output.  This method can be called more than once.
+     *
+     * @throws YamlException if an error occurs writing the output
+     */
+    public void close() throws YamlException {
+        if (closed) {
+            return;
+        }
+        closed = true;
+        try {
+            if (depth == 0) {
+                if (!streamStarted) {
+                    emit(new StreamStartEvent(null, null));
+                }
+                emit(new StreamEndEvent(null, null));
+            }
+        } finally {
+            try {
+                writer.close();
+            } catch (IOException ioe) {
+                LOGGER.warning("WLSDPLY-18110", ioe, fileName, ioe.getLocalizedMessage());
+            }
+        }
+    }
+
+    private void emitScalar(Tag tag, String value, DumperOptions.ScalarStyle style) throws YamlException {
+        // the same implicit tuple that the serializer uses, so the emitter chooses the same quoting
+        Tag detectedTag = resolver.resolve(NodeId.scalar, value, true);
+        Tag defaultTag = resolver.resolve(NodeId.scalar, value, false);
+        ImplicitTuple implicit = new ImplicitTuple(tag.equals(detectedTag), tag.equals(defaultTag));
+        emit(new ScalarEvent(null, tag.getValue(), implicit, value, null, null, style));
+    }
+
+    private void emit(Event event) throws YamlException {
+        final String METHOD = "emit";
+
+        try {
+            emitter.emit(event);
+        } catch (IOException | RuntimeException ex) {
+            YamlException pex = new YamlException("WLSDPLY-18107", ex, fileName, ex.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, pex);
+            throw pex;
+        }
+    }
+
+    private static String getFloatText(Number value) {
+        double doubleValue = value.doubleValue();
+        if (Double.isNaN(doubleValue)) {
+            return ".NaN";
+        } else if (doubleValue == Double.POSITIVE_INFINITY) {
+            return ".inf";
+        } else if (doubleValue == Double.NEGATIVE_INFINITY) {
+            return "-.inf";
+        }
+        return value.toString();
+    }
+}
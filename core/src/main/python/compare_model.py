@@ -42,13 +42,13 @@ from wlsdeploy.tool.compare.model_comparer import ModelComparer
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.util import cla_helper
 from wlsdeploy.util import env_helper
+from wlsdeploy.util import model_translator
 from wlsdeploy.util import tool_main
 from wlsdeploy.util import validate_configuration
 from wlsdeploy.util import variables
 from wlsdeploy.util.cla_utils import CommandLineArgUtil
 from wlsdeploy.util.exit_code import ExitCode
 from wlsdeploy.util.model_context import ModelContext
-from wlsdeploy.util.model_translator import FileToPython
 from wlsdeploy.yaml.yaml_translator import PythonToYaml
 
 PATH_TOKEN = '|'
@@ -106,10 +106,11 @@ class ModelFileDiffer:
 
         try:
             if FileUtils.isYamlFile(JFile(os.path.splitext(self.current_dict_file)[1].lower())):
+                # the parsed models are used by the merges below
                 model_file_name = self.current_dict_file
-                FileToPython(model_file_name, True).parse()
+                model_translator.load_model_file(model_file_name)
                 model_file_name = self.past_dict_file
-                FileToPython(model_file_name, True).parse()
+                model_translator.load_model_file(model_file_name)
 
             # allow unresolved tokens and archive entries
             self.model_context.set_validation_method(validate_configuration.LAX_METHOD)
@@ -159,6 +160,7 @@ class ModelFileDiffer:
                 __logger.throwing(ex, class_name=_class_name, method_name=_method_name)
                 raise ex
             past_dict = model_dictionary
+            model_translator.log_model_file_statistics()
         except ValidateException, te:
             __logger.severe('WLSDPLY-20009', _program_name, model_file_name, te.getLocalizedMessage(),
                             error=te, class_name=_class_name, method_name=_method_name)
@@ -180,6 +182,9 @@ class ModelFileDiffer:
                                                            pe.getLocalizedMessage(), error=pe)
             __logger.throwing(ex, class_name=_class_name, method_name=_method_name)
             raise ex
+        finally:
+            # release any parsed models that were not used, such as after a validation error
+            model_translator.release_kept_models()
 
         comparer = ModelComparer(current_dict, past_dict, aliases, self.compare_msgs)
         change_model = comparer.compare_models()
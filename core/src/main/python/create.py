@@ -81,6 +81,7 @@ __optional_arguments = [
     CommandLineArgUtil.RCU_PREFIX_SWITCH,
     CommandLineArgUtil.RCU_SCHEMA_PASS_SWITCH,
     CommandLineArgUtil.VARIABLE_FILE_SWITCH,
+    CommandLineArgUtil.MODEL_CACHE_DIR_SWITCH,
     CommandLineArgUtil.USE_ENCRYPTION_SWITCH,
     CommandLineArgUtil.PASSPHRASE_SWITCH,
     CommandLineArgUtil.PASSPHRASE_ENV_SWITCH,
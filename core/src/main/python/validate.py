@@ -52,6 +52,7 @@ __optional_arguments = [
     CommandLineArgUtil.MODEL_FILE_SWITCH,
     CommandLineArgUtil.ARCHIVE_FILE_SWITCH,
     CommandLineArgUtil.VARIABLE_FILE_SWITCH,
+    CommandLineArgUtil.MODEL_CACHE_DIR_SWITCH,
     CommandLineArgUtil.TARGET_SWITCH,
     CommandLineArgUtil.TARGET_VERSION_SWITCH,
     CommandLineArgUtil.TARGET_MODE_SWITCH,
@@ -121,7 +122,8 @@ def __perform_model_file_validation(model_file_name, model_context):
         aliases = Aliases(model_context=model_context, wlst_mode=wlst_mode, exception_type=ExceptionType.VALIDATE)
         model_validator = Validator(model_context, aliases, logger=__logger)
         variable_map = model_validator.load_variables(model_context.get_variable_file())
-        model_dictionary = cla_helper.merge_model_files(model_file_name, variable_map)
+        model_dictionary = cla_helper.merge_model_files(model_file_name, variable_map,
+                                                        model_context.get_model_cache_dir())
 
         if cla_helper.check_persist_model():
             persist_model_dict = copy.deepcopy(model_dictionary)
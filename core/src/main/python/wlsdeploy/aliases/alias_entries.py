@@ -2,14 +2,15 @@
 Copyright (c) 2017, 2022, Oracle Corporation and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
-import copy
-
+from oracle.weblogic.deploy.aliases import AliasCategoryCache
 from oracle.weblogic.deploy.aliases import VersionException
-from oracle.weblogic.deploy.aliases import VersionUtils
+from oracle.weblogic.deploy.aliases import VersionRange
 from oracle.weblogic.deploy.json import JsonException
 from oracle.weblogic.deploy.json import JsonStreamTranslator
 from oracle.weblogic.deploy.util import FileUtils
 
+from java.lang import System as JSystem
+
 import wlsdeploy.aliases.alias_utils as alias_utils
 from wlsdeploy.aliases import password_utils
 from wlsdeploy.aliases.alias_constants import ATTRIBUTES
@@ -49,6 +50,8 @@ from wlsdeploy.aliases.alias_constants import WLST_PATHS
 from wlsdeploy.aliases.alias_constants import WLST_SKIP_NAMES
 from wlsdeploy.aliases.alias_constants import WLST_SUBFOLDERS_PATH
 from wlsdeploy.aliases.alias_constants import WLST_TYPE
+from wlsdeploy.aliases.attribute_entry import AttributeEntry
+from wlsdeploy.aliases.attribute_entry import AttributeIndex
 from wlsdeploy.aliases.flattened_folder import FlattenedFolder
 from wlsdeploy.aliases.location_context import LocationContext
 from wlsdeploy.aliases.model_constants import APP_DEPLOYMENTS
@@ -73,12 +76,25 @@ from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util import path_utils
 from wlsdeploy.util import string_utils
 from wlsdeploy.util import unicode_helper as str_helper
 
 _class_name = 'AliasEntries'
 _logger = PlatformLogger('wlsdeploy.aliases')
 
+# keys for the category entries stored in the alias cache
+_CACHED_CATEGORY = 'category'
+_CACHED_UNRESOLVED_VERSION = 'unresolved_version'
+
+# AliasEntries instances shared by all the Aliases objects in the process, keyed by WLS version and WLST mode
+_alias_entries_registry = dict()
+
+# keys for the placeholder folders of contained categories that have not been loaded yet
+_CONTAINED_CATEGORY = '__contained_category__'
+_CONTAINED_BASE_PATH = '__contained_base_path__'
+_HAS_CONTAINED_FOLDERS = '__has_contained_folders__'
+
 
 class AliasEntries(object):
     """
@@ -202,6 +218,10 @@ class AliasEntries(object):
         :param wls_version: the WLS version to use, the default is the version of WLST being used to run the program.
         """
         self._category_dict = {}
+        self._attribute_indexes = {}
+        self._loaded_category_count = 0
+        self._category_load_nanos = {}
+        self._version_ranges = {}
         self._wlst_mode = wlst_mode
         if wls_version is None:
             from wlsdeploy.util.weblogic_helper import WebLogicHelper
@@ -210,13 +230,21 @@ class AliasEntries(object):
         else:
             self._wls_version = wls_version
 
-    def get_dictionary_for_location(self, location, resolve=True):
+        self._category_cache = None
+        self._category_files = None
+        cache_directory = AliasCategoryCache.getDefaultCacheDirectory(path_utils.get_wls_deploy_path())
+        if cache_directory is not None:
+            self._category_cache = AliasCategoryCache(cache_directory)
+
+    def get_dictionary_for_location(self, location, resolve=True, load_contained_folders=False):
         """
         Get the alias dictionary for the specified location with all the context applied to the data.  Note
         that any paths in subfolders are not resolved by this method.
         :param location: the location context that identifies the folder in question and the name
                          tokens to use to convert the WLST paths to concrete values
         :param resolve: whether to resolve path tokens
+        :param load_contained_folders: whether to load all the contained categories in the subfolders,
+                                       only needed if the caller uses the complete set of subfolders
         :return: the alias dictionary for the specified location, or None if the dictionary is not relevant
                  to the current WLS version
         :raises AliasException: if an error occurs while loading or processing the aliases for the specified location
@@ -224,7 +252,7 @@ class AliasEntries(object):
         _method_name = 'get_dictionary_for_location'
 
         _logger.entering(str_helper.to_string(location), class_name=_class_name, method_name=_method_name)
-        result = self.__get_dictionary_for_location(location, resolve)
+        result = self.__get_dictionary_for_location(location, resolve, load_contained_folders)
         # not one caller checks to see if the dictionary returned is None
         if result is None:
             result = dict()
@@ -312,7 +340,7 @@ class AliasEntries(object):
         _method_name = 'get_model_subfolder_names_for_location'
 
         _logger.entering(str_helper.to_string(location), class_name=_class_name, method_name=_method_name)
-        folder_dict = self.__get_dictionary_for_location(location, False)
+        folder_dict = self.__get_dictionary_for_location(location, False, True)
         if folder_dict is not None and FOLDERS in folder_dict:
             subfolders_dict = folder_dict[FOLDERS]
             result = list(subfolders_dict.keys())
@@ -693,25 +721,17 @@ class AliasEntries(object):
     def get_alias_attribute_entries_by_location(self, location):
         """
         Get the attribute entries for the specified location.  Note that since this method does not resolve
-        the paths, the wlst_path attribute is removed for the returned attribute entries.
+        the paths, the wlst_path attribute is not included in the returned attribute entries.
         :param location: the location
-        :return: the dictionary of attribute entries, keyed by the model attribute names
+        :return: the dictionary of read-only attribute entries, keyed by the model attribute names
         :raises AliasException: if an error occurs
         """
         _method_name = 'get_alias_attribute_entries_by_location'
 
         _logger.entering(str_helper.to_string(location), class_name=_class_name, method_name=_method_name)
-        folder_dict = self.__get_dictionary_for_location(location, False)
-        model_attr_dict = dict()
-        if folder_dict is not None and ATTRIBUTES in folder_dict:
-            attrs = folder_dict[ATTRIBUTES]
-            for attr_name in attrs:
-                attr = copy.deepcopy(attrs[attr_name])
-                if WLST_PATH in attr:
-                    del attr[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08107', attr_name, location.get_folder_path(), WLST_PATH)
-                model_attr_dict[attr_name] = attr
+        attribute_index = self.__get_attribute_index(location)
+        if attribute_index is not None:
+            model_attr_dict = dict(attribute_index.model_entries)
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08108', location.get_folder_path(), ATTRIBUTES)
             _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
@@ -725,23 +745,16 @@ class AliasEntries(object):
         Get a single alias attribute entry from the specified location by its model name.
         :param location: the location
         :param model_attribute_name: the model name for the attribute
-        :return: the alias entry for the specified attribute
+        :return: the read-only alias entry for the specified attribute
         :raises AliasException: if an error occurs
         """
         _method_name = 'get_alias_attribute_entry_by_model_name'
         _logger.entering(str_helper.to_string(location), model_attribute_name,
                          class_name=_class_name, method_name=_method_name)
 
-        folder_dict = self.__get_dictionary_for_location(location, False)
-        if folder_dict is not None and ATTRIBUTES in folder_dict:
-            if model_attribute_name in folder_dict[ATTRIBUTES]:
-                model_attr_dict = copy.deepcopy(folder_dict[ATTRIBUTES][model_attribute_name])
-                if WLST_PATH in model_attr_dict:
-                    del model_attr_dict[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08107', model_attribute_name, location.get_folder_path(), WLST_PATH)
-            else:
-                model_attr_dict = None
+        attribute_index = self.__get_attribute_index(location)
+        if attribute_index is not None:
+            model_attr_dict = dictionary_utils.get_element(attribute_index.model_entries, model_attribute_name)
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08109', model_attribute_name,
                                                          location.get_folder_path(), ATTRIBUTES)
@@ -756,31 +769,26 @@ class AliasEntries(object):
         Get a single alias attribute entry from the specified location by its WLST name.
         :param location: the location
         :param wlst_attribute_name: the WLST name for the attribute
-        :return: the alias entry for the specified attribute
+        :return: the read-only alias entry for the specified attribute, or None if the WLST attribute
+                 is skipped or ignored
         :raises AliasException: if an error occurs
         """
         _method_name = 'get_alias_attribute_entry_by_wlst_name'
 
         _logger.entering(str_helper.to_string(location), class_name=_class_name, method_name=_method_name)
-        folder_dict = self.__get_dictionary_for_location(location, False)
-        if self._is_wlst_attribute_skipped(folder_dict, wlst_attribute_name) or \
-                self._is_wlst_attribute_ignored(wlst_attribute_name):
-            result = None
-        elif folder_dict is not None and WLST_NAMES_MAP in folder_dict:
-            if wlst_attribute_name in folder_dict[WLST_NAMES_MAP]:
-                result = copy.deepcopy(folder_dict[WLST_NAMES_MAP][wlst_attribute_name])
-                if WLST_PATH in result:
-                    del result[WLST_PATH]
-                else:
-                    _logger.warning('WLSDPLY-08110', wlst_attribute_name, location.get_folder_path(), WLST_PATH)
+        attribute_index = self.__get_attribute_index(location)
+        if attribute_index is not None:
+            # skipped and ignored WLST names are in the index with a value of None
+            wlst_entries = attribute_index.wlst_entries
+            if wlst_attribute_name in wlst_entries:
+                result = wlst_entries[wlst_attribute_name]
             else:
-                if wlst_attribute_name not in self.IGNORE_FOR_MODEL_LIST:
-                    ex = exception_helper.create_alias_exception('WLSDPLY-08111', location.get_folder_path(),
-                                                                 wlst_attribute_name)
-                    _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
-                    raise ex
-                else:
-                    result = None
+                ex = exception_helper.create_alias_exception('WLSDPLY-08111', location.get_folder_path(),
+                                                             wlst_attribute_name)
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+        elif self._is_wlst_attribute_ignored(wlst_attribute_name):
+            result = None
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08112', location.get_folder_path(),
                                                          wlst_attribute_name, WLST_NAMES_MAP)
@@ -790,6 +798,26 @@ class AliasEntries(object):
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
         return result
 
+    def get_alias_attribute_entries_by_wlst_name(self, location):
+        """
+        Get the alias attribute entries from the specified location, keyed by WLST name.
+        Skipped and ignored WLST attribute names are included with a value of None.
+        :param location: the location
+        :return: a new dictionary of the read-only alias entries, which is empty if the location has no
+                 WLST attribute names
+        :raises AliasException: if an error occurs
+        """
+        _method_name = 'get_alias_attribute_entries_by_wlst_name'
+
+        _logger.entering(str_helper.to_string(location), class_name=_class_name, method_name=_method_name)
+        result = dict()
+        attribute_index = self.__get_attribute_index(location)
+        if attribute_index is not None:
+            result.update(attribute_index.wlst_entries)
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=len(result))
+        return result
+
     def is_valid_model_folder_name_for_location(self, location, model_folder_name):
         """
         Is the specified model folder name valid for the specified location?
@@ -817,7 +845,7 @@ class AliasEntries(object):
             else:
                 result = ValidationCodes.VALID
         else:
-            folder_dict = self.__get_dictionary_for_location(location, False)
+            folder_dict = self.__get_dictionary_for_location(location, False, True)
 
             if folder_dict is None:
                 ex = exception_helper.create_alias_exception('WLSDPLY-08113', model_folder_name,
@@ -976,6 +1004,25 @@ class AliasEntries(object):
     #                         Private helper methods                          #
     ###########################################################################
 
+    def get_loaded_category_count(self):
+        """
+        Get the number of category modules that have been loaded, from their data files or from the alias cache.
+        Contained categories are only counted if a location has used the folder that contains them.
+        :return: the number of category modules loaded
+        """
+        return self._loaded_category_count
+
+    def get_category_load_times(self):
+        """
+        Get the time taken to load and resolve each category module, from its data files or from the alias cache.
+        A contained category that is used by more than one folder includes the time for each folder.
+        :return: a new dictionary of the elapsed milliseconds, keyed by category name
+        """
+        result = dict()
+        for category_name, nanos in self._category_load_nanos.items():
+            result[category_name] = nanos / 1000000.0
+        return result
+
     def _unit_test_only_get_category_map_files(self):
         """
         Internal method used to get the category files for unit testing.
@@ -1002,11 +1049,13 @@ class AliasEntries(object):
             return alternate_name
         return category_name
 
-    def __get_dictionary_for_location(self, location, resolve_path_tokens=True):
+    def __get_dictionary_for_location(self, location, resolve_path_tokens=True, load_contained_folders=False):
         """
         Get the dictionary for a location with or without path tokens resolved
         :param location: the location
         :param resolve_path_tokens: whether or not to resolve path tokens
+        :param load_contained_folders: whether to load all the contained categories in the subfolders of the
+                                       location, this is only needed if the caller uses the complete set of subfolders
         :return: the dictionary
         :raises: AliasException: if an error occurs
         """
@@ -1034,6 +1083,7 @@ class AliasEntries(object):
             location_subfolders = list(location_folders[1:])
             child_dict = category_dict
             for location_subfolder in location_subfolders:
+                self.__load_contained_folders(path_name, child_dict, location_subfolder)
                 if FOLDERS in child_dict and location_subfolder in child_dict[FOLDERS]:
                     child_dict = child_dict[FOLDERS][location_subfolder]
                 else:
@@ -1044,6 +1094,9 @@ class AliasEntries(object):
                     break
                 path_name += '/' + location_subfolder
 
+            if child_dict is not None and load_contained_folders:
+                self.__load_contained_folders(path_name, child_dict)
+
             if resolve_path_tokens:
                 resolved_dict = alias_utils.resolve_path_tokens(location, path_name, child_dict)
             else:
@@ -1054,6 +1107,136 @@ class AliasEntries(object):
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return resolved_dict
 
+    def __load_contained_folders(self, path_name, folder_dict, folder_name=None):
+        """
+        Load the contained categories that are subfolders of the folder dictionary, if they have not been loaded.
+        Each placeholder folder is replaced with the contained category, resolved for the WLS version and WLST mode.
+        If the contained category is not valid for this version or mode, it is removed from the subfolders and
+        added to the unresolved folders map of the folder dictionary.
+        :param path_name: the model folder path name for the folder dictionary
+        :param folder_dict: the resolved folder dictionary
+        :param folder_name: the subfolder to load, or None to load all the contained subfolders
+        :raises: AliasException: if an error occurs while loading a contained category
+        """
+        _method_name = '__load_contained_folders'
+
+        if _HAS_CONTAINED_FOLDERS not in folder_dict:
+            return
+
+        subfolders = folder_dict[FOLDERS]
+        if folder_name is None:
+            folder_names = list(subfolders.keys())
+        else:
+            folder_names = [folder_name]
+
+        for subfolder_name in folder_names:
+            placeholder = dictionary_utils.get_element(subfolders, subfolder_name)
+            if placeholder is None or _CONTAINED_CATEGORY not in placeholder:
+                continue
+
+            contained_category = placeholder[_CONTAINED_CATEGORY]
+            _logger.fine('WLSDPLY-08146', contained_category, path_name,
+                         class_name=_class_name, method_name=_method_name)
+            start_nanos = JSystem.nanoTime()
+            contained_dict = self.__load_contained_category(contained_category, path_name + '/' + subfolder_name,
+                                                            placeholder[_CONTAINED_BASE_PATH], folder_dict)
+            if contained_dict is None:
+                del subfolders[subfolder_name]
+            else:
+                subfolders[subfolder_name] = contained_dict
+            self.__add_category_load_time(contained_category, start_nanos)
+
+        for subfolder in subfolders.values():
+            if _CONTAINED_CATEGORY in subfolder:
+                return
+        del folder_dict[_HAS_CONTAINED_FOLDERS]
+
+    def __load_contained_category(self, contained_category, contained_path, base_path, folder_dict):
+        """
+        Load a contained category for the folder at the specified path, using the alias cache if it has a
+        current entry.  The wlst_paths of the contained category depend on the folder that contains it,
+        so the cache entry is specific to that folder.
+        :param contained_category: the contained category name
+        :param contained_path: the model folder path name of the contained category in the folder
+        :param base_path: the base path prefix for the wlst_paths of the contained category
+        :param folder_dict: the resolved folder dictionary that contains the category
+        :return: the resolved contained category, or None if it is not relevant to the current WLS version
+        :raises: AliasException: if an error occurs while loading the contained category
+        """
+        cache_name = self.__get_contained_category_cache_name(contained_path)
+        cache_entry = self.__load_cache_entry(cache_name, contained_category)
+        if cache_entry is not None:
+            contained_dict = cache_entry[_CACHED_CATEGORY]
+            if contained_dict is None:
+                _add_to_unresolved_folders(contained_path, folder_dict, cache_entry[_CACHED_UNRESOLVED_VERSION])
+            return contained_dict
+
+        self._category_files = list()
+        raw_folder_dict = self.__load_category_file(self._get_category_file_prefix(contained_category))
+        self.__load_contains_categories(contained_category, raw_folder_dict, base_path)
+        contained_dict = self.__apply_wlst_context_changes(contained_path, raw_folder_dict, folder_dict)
+        self.__save_cache_entry(cache_name, contained_path, contained_dict, folder_dict)
+        return contained_dict
+
+    def __get_attribute_index(self, location):
+        """
+        Get the attribute index for the folder at the specified location, building it the first time the
+        folder is used.  The index does not depend on the name tokens, so it is shared by all locations
+        with the same model folders, and a lookup does not need to find the folder dictionary again.
+        :param location: the location of the folder
+        :return: the attribute index, or None if the folder has no attributes or is not valid for the WLS version
+        :raises: AliasException: if an error occurs while loading the folder dictionary
+        """
+        cache_key = tuple(location.get_model_folders())
+        if cache_key in self._attribute_indexes:
+            return self._attribute_indexes[cache_key]
+
+        folder_dict = self.__get_dictionary_for_location(location, False)
+        result = None
+        if folder_dict is not None and ATTRIBUTES in folder_dict and WLST_NAMES_MAP in folder_dict:
+            result = self.__build_attribute_index(location, folder_dict)
+        self._attribute_indexes[cache_key] = result
+        return result
+
+    def __build_attribute_index(self, location, folder_dict):
+        """
+        Build the attribute index for the folder dictionary.  Each attribute entry is created once and
+        indexed by its model name and its WLST name.  WLST names that are skipped for the folder or
+        ignored for all folders are indexed with a value of None.
+        :param location: the location of the folder, used for logging
+        :param folder_dict: the unresolved folder dictionary
+        :return: the attribute index
+        """
+        _method_name = '__build_attribute_index'
+
+        model_entries = dict()
+        attrs = folder_dict[ATTRIBUTES]
+        for attr_name in attrs:
+            entry = AttributeEntry(attrs[attr_name])
+            if not entry.has_wlst_path():
+                _logger.warning('WLSDPLY-08107', attr_name, location.get_folder_path(), WLST_PATH,
+                                class_name=_class_name, method_name=_method_name)
+            model_entries[attr_name] = entry
+
+        wlst_entries = dict()
+        wlst_names_map = folder_dict[WLST_NAMES_MAP]
+        for wlst_name in wlst_names_map:
+            attr_dict = wlst_names_map[wlst_name]
+            model_name = dictionary_utils.get_element(attr_dict, MODEL_NAME)
+            entry = dictionary_utils.get_element(model_entries, model_name)
+            if entry is None or entry.wlst_name != wlst_name:
+                entry = AttributeEntry(attr_dict)
+            if not entry.has_wlst_path():
+                _logger.warning('WLSDPLY-08110', wlst_name, location.get_folder_path(), WLST_PATH,
+                                class_name=_class_name, method_name=_method_name)
+            wlst_entries[wlst_name] = entry
+
+        skip_names = dictionary_utils.get_element(folder_dict, WLST_SKIP_NAMES, [])
+        for wlst_name in skip_names + self.IGNORE_FOR_MODEL_LIST:
+            wlst_entries[wlst_name] = None
+
+        return AttributeIndex(model_entries, wlst_entries)
+
     def __get_category_dictionary(self, model_category_name):
         """
         Get the category dictionary from the cache, loading it first if required.  The dictionary
@@ -1063,9 +1246,25 @@ class AliasEntries(object):
         :raises: AliasException: if an error occurs while loading the category dictionary
         """
         if model_category_name not in self._category_dict:
+            start_nanos = JSystem.nanoTime()
             self.__load_category(model_category_name)
+            self.__add_category_load_time(model_category_name, start_nanos)
         return self._category_dict[model_category_name]
 
+    def __add_category_load_time(self, model_category_name, start_nanos):
+        """
+        Record the time taken to load the category, and log it.
+        :param model_category_name: the category name
+        :param start_nanos: the system nanosecond time when loading started
+        """
+        _method_name = '__add_category_load_time'
+
+        elapsed_nanos = JSystem.nanoTime() - start_nanos
+        total_nanos = self._category_load_nanos.get(model_category_name, 0) + elapsed_nanos
+        self._category_load_nanos[model_category_name] = total_nanos
+        _logger.fine('WLSDPLY-08147', model_category_name, elapsed_nanos / 1000000.0, self._wls_version,
+                     WlstModes.from_value(self._wlst_mode), class_name=_class_name, method_name=_method_name)
+
     def __load_category(self, model_category_name):
         """
         Load the category and apply WLS version and WLST mode context to it.
@@ -1075,6 +1274,11 @@ class AliasEntries(object):
         _method_name = '__load_category'
 
         _logger.entering(model_category_name, class_name=_class_name, method_name=_method_name)
+        if self.__load_cached_category(model_category_name):
+            _logger.exiting(class_name=_class_name, method_name=_method_name)
+            return
+
+        self._category_files = list()
         model_category_file = self._get_category_file_prefix(model_category_name)
         raw_category_dict = self.__load_category_file(model_category_file)
         _logger.fine('WLSDPLY-08118', model_category_name, class_name=_class_name, method_name=_method_name)
@@ -1086,9 +1290,95 @@ class AliasEntries(object):
         # process the folder recursively and resolve everything based on WLS version and WLST mode.
         self._category_dict[model_category_name] = \
             self.__apply_wlst_context_changes(model_category_name, raw_category_dict, self._category_dict)
+        self.__save_cached_category(model_category_name)
         _logger.exiting(class_name=_class_name, method_name=_method_name)
         return
 
+    def __load_cached_category(self, model_category_name):
+        """
+        Load the resolved category dictionary from the alias cache, if it has a current entry for the category.
+        If the category is not valid for this WLS version and WLST mode, its version range is added to
+        the unresolved folders map, as it would be when loading the category file.
+        :param model_category_name: the category name
+        :return: True if the category was loaded from the cache, False otherwise
+        """
+        cache_entry = self.__load_cache_entry(self.__get_category_cache_name(model_category_name), model_category_name)
+        if cache_entry is None:
+            return False
+
+        self._category_dict[model_category_name] = cache_entry[_CACHED_CATEGORY]
+        unresolved_version = cache_entry[_CACHED_UNRESOLVED_VERSION]
+        if unresolved_version is not None:
+            _add_to_unresolved_folders(model_category_name, self._category_dict, unresolved_version)
+        return True
+
+    def __save_cached_category(self, model_category_name):
+        """
+        Save the resolved category dictionary to the alias cache, along with the category files it was loaded from.
+        :param model_category_name: the category name
+        """
+        self.__save_cache_entry(self.__get_category_cache_name(model_category_name), model_category_name,
+                                self._category_dict[model_category_name], self._category_dict)
+
+    def __load_cache_entry(self, cache_name, model_category_name):
+        """
+        Load the cache entry for a resolved category dictionary, if the alias cache has a current entry.
+        :param cache_name: the cache entry name
+        :param model_category_name: the category name, used for logging
+        :return: the cache entry, or None if there is no current entry
+        """
+        _method_name = '__load_cache_entry'
+
+        if self._category_cache is None:
+            return None
+
+        cache_entry = self._category_cache.load(cache_name)
+        if cache_entry is not None:
+            self._loaded_category_count += 1
+            _logger.fine('WLSDPLY-08145', model_category_name, self._category_cache.getCacheDirectory(),
+                         class_name=_class_name, method_name=_method_name)
+        return cache_entry
+
+    def __save_cache_entry(self, cache_name, path_name, category_dict, parent_dict):
+        """
+        Save a resolved category dictionary to the alias cache, along with the category files it was loaded from.
+        :param cache_name: the cache entry name
+        :param path_name: the model folder path name of the category
+        :param category_dict: the resolved category dictionary, or None if it is not relevant to the WLS version
+        :param parent_dict: the dictionary that holds the unresolved folders map for the category
+        """
+        category_files = self._category_files
+        self._category_files = None
+        if self._category_cache is None:
+            return
+
+        unresolved_version = None
+        if category_dict is None:
+            unresolved_folders = parent_dict[UNRESOLVED_FOLDERS_MAP]
+            unresolved_version = unresolved_folders[alias_utils.compute_folder_name_from_path(path_name)]
+
+        cache_entry = {
+            _CACHED_CATEGORY: category_dict,
+            _CACHED_UNRESOLVED_VERSION: unresolved_version
+        }
+        self._category_cache.save(cache_name, category_files, cache_entry)
+
+    def __get_category_cache_name(self, model_category_name):
+        """
+        Get the alias cache entry name for the category in the current WLS version and WLST mode.
+        :param model_category_name: the category name
+        :return: the cache entry name
+        """
+        return '%s-%s-%s' % (model_category_name, self._wls_version, WlstModes.from_value(self._wlst_mode))
+
+    def __get_contained_category_cache_name(self, contained_path):
+        """
+        Get the alias cache entry name for a contained category in the current WLS version and WLST mode.
+        :param contained_path: the model folder path name of the contained category, such as /Partition/ResourceGroup
+        :return: the cache entry name
+        """
+        return self.__get_category_cache_name(contained_path[1:].replace('/', '.'))
+
     def __load_category_file(self, category_base_file_name):
         """
         Load the category from its data file.
@@ -1110,6 +1400,10 @@ class AliasEntries(object):
             _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
             raise ex
 
+        self._loaded_category_count += 1
+        if self._category_files is not None:
+            self._category_files.append(category_file_path)
+
         try:
             json_translator = JsonStreamTranslator(category_file_name, category_input_stream)
             result = json_translator.parse()
@@ -1155,25 +1449,24 @@ class AliasEntries(object):
             self.__load_contains_categories(folder, raw_folder_dict, base_path)
 
         #
-        # Now that the folder paths are all updated accordingly, load any contains folders, compute the
-        # new path, and recursively call the method to update all of their paths.  After processing the
-        # entire contains section and loading it into the folders, delete the contains section.
+        # Now that the folder paths are all updated accordingly, add a placeholder folder for each contains
+        # folder with the new base path.  The contained categories are loaded when a location first uses
+        # the folder that contains them.  After processing the entire contains section, delete it.
         #
         if CONTAINS in raw_model_dict:
             new_base_path = alias_utils.compute_base_path(model_category_name, raw_model_dict)
 
             contained_folders = raw_model_dict[CONTAINS]
             for contained_folder in contained_folders:
-                if contained_folder in self.__all_model_categories:
-                    folder_file = self._get_category_file_prefix(contained_folder)
-                else:
+                if contained_folder not in self.__all_model_categories:
                     ex = exception_helper.create_alias_exception('WLSDPLY-08122', contained_folder, model_category_name)
                     _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
                     raise ex
-                raw_folder_dict = self.__load_category_file(folder_file)
 
-                self.__load_contains_categories(contained_folder, raw_folder_dict, new_base_path)
-                raw_model_dict_folders[contained_folder] = raw_folder_dict
+                raw_model_dict_folders[contained_folder] = {
+                    _CONTAINED_CATEGORY: contained_folder,
+                    _CONTAINED_BASE_PATH: new_base_path
+                }
             del raw_model_dict[CONTAINS]
 
         _logger.exiting(class_name=_class_name, method_name=_method_name)
@@ -1201,6 +1494,12 @@ class AliasEntries(object):
             result_folders = dict()
             folders = alias_dict[FOLDERS]
             for folder in folders:
+                if _CONTAINED_CATEGORY in folders[folder]:
+                    # the contained category is resolved when it is loaded
+                    result_folders[folder] = folders[folder]
+                    result[_HAS_CONTAINED_FOLDERS] = True
+                    continue
+
                 folder_dict = self.__apply_wlst_context_changes(path_name + '/' + folder, folders[folder], result)
                 # if folder_dict is None, this folder was invalid for this version/mode of WLS
                 if folder_dict is not None:
@@ -1481,7 +1780,12 @@ class AliasEntries(object):
         :return: true if the current version is within the range, false otherwise
         :raises: VersionException: if an error occurs in processing the specified version range
         """
-        return VersionUtils.isVersionInRange(self._wls_version, attr_version_range)
+        if attr_version_range in self._version_ranges:
+            return self._version_ranges[attr_version_range]
+
+        result = VersionRange.getInstance(attr_version_range).includes(self._wls_version)
+        self._version_ranges[attr_version_range] = result
+        return result
 
     def __resolve_attribute(self, attr_dict):
         """
@@ -1577,12 +1881,6 @@ class AliasEntries(object):
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=version_range)
         return version_range
 
-    def _is_wlst_attribute_skipped(self, folder_dict, wlst_attribute_name):
-        skip_names = dictionary_utils.get_element(folder_dict, WLST_SKIP_NAMES)  # type: list
-        if skip_names is not None:
-            return wlst_attribute_name in skip_names
-        return False
-
     def _is_wlst_attribute_ignored(self, wlst_attribute_name):
         if wlst_attribute_name in self.IGNORE_FOR_MODEL_LIST:
             return True
@@ -1619,6 +1917,27 @@ class AliasEntries(object):
         return tokenized_path
 
 
+def get_alias_entries(wlst_mode=WlstModes.OFFLINE, wls_version=None):
+    """
+    Get the AliasEntries instance for the WLST mode and WLS version, creating it the first time it is requested.
+    The instance is shared by every caller in the process, so categories are only loaded and resolved once
+    when several tools or models are processed in the same JVM.  The instance does not hold any state
+    specific to the caller, such as the exception type.
+    :param wlst_mode: the WLST mode being used, the default is OFFLINE
+    :param wls_version: the WLS version to use, the default is the version of WLST being used to run the program.
+    :return: the shared AliasEntries instance
+    """
+    # the default version is resolved first, so callers that name the actual version get the same instance
+    if wls_version is None:
+        from wlsdeploy.util.weblogic_helper import WebLogicHelper
+        wls_version = WebLogicHelper(_logger).get_actual_weblogic_version()
+
+    registry_key = (wls_version, wlst_mode)
+    if registry_key not in _alias_entries_registry:
+        _alias_entries_registry[registry_key] = AliasEntries(wlst_mode, wls_version)
+    return _alias_entries_registry[registry_key]
+
+
 def _add_to_unresolved_folders(path_name, parent_dict, unresolved):
     if UNRESOLVED_FOLDERS_MAP not in parent_dict:
         parent_dict[UNRESOLVED_FOLDERS_MAP] = dict()
@@ -2,7 +2,6 @@
 Copyright (c) 2017, 2022, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
-import copy
 from org.python.modules import jarray
 import re
 from array import array
@@ -27,12 +26,12 @@ from wlsdeploy.aliases.alias_constants import BOOLEAN
 from wlsdeploy.aliases.alias_constants import ChildFoldersTypes
 from wlsdeploy.aliases.alias_constants import STRING
 from wlsdeploy.aliases.model_constants import MODEL_LIST_DELIMITER
+from wlsdeploy.aliases.resolved_folder import ResolvedFolder
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
 
 from wlsdeploy.aliases.alias_constants import ALIAS_DELIMITED_TYPES
-from wlsdeploy.aliases.alias_constants import ATTRIBUTES
 from wlsdeploy.aliases.alias_constants import COMMA_DELIMITED_STRING
 from wlsdeploy.aliases.alias_constants import DELIMITED_STRING
 from wlsdeploy.aliases.alias_constants import JARRAY
@@ -50,7 +49,6 @@ from wlsdeploy.aliases.alias_constants import WLST_ATTRIBUTES_PATH
 from wlsdeploy.aliases.alias_constants import WLST_CREATE_PATH
 from wlsdeploy.aliases.alias_constants import WLST_LIST_PATH
 from wlsdeploy.aliases.alias_constants import WLST_MODE
-from wlsdeploy.aliases.alias_constants import WLST_PATH
 from wlsdeploy.aliases.alias_constants import WLST_PATHS
 from wlsdeploy.aliases.alias_constants import WLST_READ_TYPE
 from wlsdeploy.aliases.alias_constants import WLST_TYPE
@@ -280,7 +278,7 @@ def resolve_path_tokens(location, path_name, folder_dict):
     :param location: the location of the folder
     :param path_name: the path name
     :param folder_dict: the dictionary for the folder
-    :return: a new dictionary with all path tokens resolved
+    :return: a read-only view of the folder with all path tokens resolved
     :raises: AliasException: if an error occurs while processing the path tokens
     """
     _method_name = 'resolve_path_tokens'
@@ -293,14 +291,17 @@ def resolve_path_tokens(location, path_name, folder_dict):
         return None
 
     #
-    # Now that we have the target dictionary, we need to make a copy of it and replace the path tokens.
+    # The folder dictionary is shared by all locations, so only the resolved paths are computed here.
+    # They are overlaid on the folder dictionary by the returned view.
     #
-    resolved_dict = copy.deepcopy(folder_dict)
-    if WLST_PATHS in resolved_dict:
-        wlst_paths_dict = resolved_dict[WLST_PATHS]
-        for path_key in wlst_paths_dict:
-            path_value = wlst_paths_dict[path_key]
+    resolved_paths = dict()
+    if WLST_PATHS in folder_dict:
+        wlst_paths_dict = dict()
+        tokenized_paths_dict = folder_dict[WLST_PATHS]
+        for path_key in tokenized_paths_dict:
+            path_value = tokenized_paths_dict[path_key]
             wlst_paths_dict[path_key] = replace_tokens_in_path(location, path_value)
+        resolved_paths[WLST_PATHS] = wlst_paths_dict
     else:
         ex = exception_helper.create_alias_exception('WLSDPLY-08007', path_name)
         _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
@@ -309,10 +310,10 @@ def resolve_path_tokens(location, path_name, folder_dict):
     #
     # Resolve the wlst path attributes in the model
     #
-    if WLST_ATTRIBUTES_PATH in resolved_dict:
-        wlst_path_key = resolved_dict[WLST_ATTRIBUTES_PATH]
+    if WLST_ATTRIBUTES_PATH in folder_dict:
+        wlst_path_key = folder_dict[WLST_ATTRIBUTES_PATH]
         if wlst_path_key in wlst_paths_dict:
-            resolved_dict[WLST_ATTRIBUTES_PATH] = wlst_paths_dict[wlst_path_key]
+            resolved_paths[WLST_ATTRIBUTES_PATH] = wlst_paths_dict[wlst_path_key]
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08008', path_name, WLST_ATTRIBUTES_PATH,
                                                          wlst_path_key, WLST_PATHS)
@@ -323,10 +324,10 @@ def resolve_path_tokens(location, path_name, folder_dict):
         _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
         raise ex
 
-    if WLST_SUBFOLDERS_PATH in resolved_dict:
-        wlst_path_key = resolved_dict[WLST_SUBFOLDERS_PATH]
+    if WLST_SUBFOLDERS_PATH in folder_dict:
+        wlst_path_key = folder_dict[WLST_SUBFOLDERS_PATH]
         if wlst_path_key in wlst_paths_dict:
-            resolved_dict[WLST_SUBFOLDERS_PATH] = wlst_paths_dict[wlst_path_key]
+            resolved_paths[WLST_SUBFOLDERS_PATH] = wlst_paths_dict[wlst_path_key]
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08008', path_name, WLST_SUBFOLDERS_PATH,
                                                          wlst_path_key, WLST_PATHS)
@@ -334,12 +335,12 @@ def resolve_path_tokens(location, path_name, folder_dict):
             raise ex
     else:
         # default back to the attributes path
-        resolved_dict[WLST_SUBFOLDERS_PATH] = resolved_dict[WLST_ATTRIBUTES_PATH]
+        resolved_paths[WLST_SUBFOLDERS_PATH] = resolved_paths[WLST_ATTRIBUTES_PATH]
 
-    if WLST_LIST_PATH in resolved_dict:
-        wlst_path_key = resolved_dict[WLST_LIST_PATH]
+    if WLST_LIST_PATH in folder_dict:
+        wlst_path_key = folder_dict[WLST_LIST_PATH]
         if wlst_path_key in wlst_paths_dict:
-            resolved_dict[WLST_LIST_PATH] = wlst_paths_dict[wlst_path_key]
+            resolved_paths[WLST_LIST_PATH] = wlst_paths_dict[wlst_path_key]
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08008', path_name, WLST_LIST_PATH,
                                                          wlst_path_key, WLST_PATHS)
@@ -347,13 +348,13 @@ def resolve_path_tokens(location, path_name, folder_dict):
             raise ex
     else:
         # default back to the parent folder of the attributes path
-        attr_path = resolved_dict[WLST_ATTRIBUTES_PATH]
-        resolved_dict[WLST_LIST_PATH] = strip_trailing_folders_in_path(attr_path)
+        attr_path = resolved_paths[WLST_ATTRIBUTES_PATH]
+        resolved_paths[WLST_LIST_PATH] = strip_trailing_folders_in_path(attr_path)
 
-    if WLST_CREATE_PATH in resolved_dict:
-        wlst_path_key = resolved_dict[WLST_CREATE_PATH]
+    if WLST_CREATE_PATH in folder_dict:
+        wlst_path_key = folder_dict[WLST_CREATE_PATH]
         if wlst_path_key in wlst_paths_dict:
-            resolved_dict[WLST_CREATE_PATH] = wlst_paths_dict[wlst_path_key]
+            resolved_paths[WLST_CREATE_PATH] = wlst_paths_dict[wlst_path_key]
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-08008', path_name, WLST_CREATE_PATH,
                                                          wlst_path_key, WLST_PATHS)
@@ -361,32 +362,13 @@ def resolve_path_tokens(location, path_name, folder_dict):
             raise ex
     else:
         # default back to the grandparent folder of the attributes path
-        attr_path = resolved_dict[WLST_ATTRIBUTES_PATH]
-        resolved_dict[WLST_CREATE_PATH] = strip_trailing_folders_in_path(attr_path, 2)
+        attr_path = resolved_paths[WLST_ATTRIBUTES_PATH]
+        resolved_paths[WLST_CREATE_PATH] = strip_trailing_folders_in_path(attr_path, 2)
 
     #
-    # Now that the wlst_paths have been resolved, resolve the references to them in each of the attributes
+    # The wlst_path references in each of the attributes are resolved from the wlst_paths when they are read.
     #
-    if ATTRIBUTES in resolved_dict:
-        attrs_dict = resolved_dict[ATTRIBUTES]
-        for attr_name in attrs_dict:
-            attr_dict = attrs_dict[attr_name]
-
-            if WLST_PATH in attr_dict:
-                wlst_path_key = attr_dict[WLST_PATH]
-
-                if wlst_path_key in wlst_paths_dict:
-                    attr_dict[WLST_PATH] = wlst_paths_dict[wlst_path_key]
-                else:
-                    ex = exception_helper.create_alias_exception('WLSDPLY-08010', attr_name,
-                                                                 path_name, wlst_path_key)
-                    _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
-                    raise ex
-            else:
-                ex = exception_helper.create_alias_exception('WLSDPLY-08011', attr_name, path_name)
-                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
-                raise ex
-    return resolved_dict
+    return ResolvedFolder(folder_dict, resolved_paths, path_name)
 
 
 def resolve_path_index(folder_dict, paths_index, path_attribute_name_used, location):
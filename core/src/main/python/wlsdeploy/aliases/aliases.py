@@ -9,6 +9,7 @@ from oracle.weblogic.deploy.aliases import VersionUtils
 from oracle.weblogic.deploy.encrypt import EncryptionException
 from oracle.weblogic.deploy.encrypt import EncryptionUtils
 
+from wlsdeploy.aliases import alias_entries
 from wlsdeploy.aliases import alias_utils
 from wlsdeploy.aliases import password_utils
 from wlsdeploy.aliases.alias_constants import ACCESS
@@ -49,7 +50,6 @@ from wlsdeploy.aliases.alias_constants import USES_PATH_TOKENS
 from wlsdeploy.aliases.alias_constants import WLST_NAME
 from wlsdeploy.aliases.alias_constants import WLST_READ_TYPE
 from wlsdeploy.aliases.alias_constants import WLST_TYPE
-from wlsdeploy.aliases.alias_entries import AliasEntries
 from wlsdeploy.aliases.model_constants import MODEL_LIST_DELIMITER
 from wlsdeploy.aliases.validation_codes import ValidationCodes
 from wlsdeploy.aliases.wlst_modes import WlstModes
@@ -87,11 +87,16 @@ class Aliases(object):
         else:
             self._wls_version = wls_version
 
-        self._alias_entries = AliasEntries(wlst_mode, self._wls_version)
+        self._alias_entries = alias_entries.get_alias_entries(wlst_mode, self._wls_version)
         self._production_mode_enabled = False
         self._secure_mode_enabled = False
         alias_utils._wlst_mode = wlst_mode
 
+        # results of attribute name queries, keyed by query name and model folders (not instance names)
+        self._query_cache = dict()
+        self._query_cache_hits = 0
+        self._query_cache_misses = 0
+
     def set_production_mode(self, production_mode_enabled):
         _method_name = 'set_production_mode'
         if production_mode_enabled:
@@ -714,7 +719,7 @@ class Aliases(object):
         try:
             model_subfolder_name = None
 
-            module_folder = self._alias_entries.get_dictionary_for_location(location)
+            module_folder = self._alias_entries.get_dictionary_for_location(location, load_contained_folders=True)
             is_base_security_provider_type_location = alias_utils.is_base_security_provider_type_location(location)
             for key, value in module_folder[FOLDERS].iteritems():
                 # value will be None if the folder is not the correct version
@@ -834,6 +839,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_restart_required_attribute_names'
 
+        cache_key = _get_query_cache_key(_method_name, location)
+        cached_result = self.__get_cached_query_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         try:
             restart_attribute_names = []
 
@@ -850,7 +860,7 @@ class Aliases(object):
                     if restart_required:
                         restart_attribute_names.append(key)
 
-            return restart_attribute_names
+            return self.__cache_query_result(cache_key, restart_attribute_names)
         except AliasException, ae:
             self._raise_exception(ae, _method_name, 'WLSDPLY-19023', location.get_folder_path(),
                                   ae.getLocalizedMessage())
@@ -864,6 +874,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_lsa_required_attribute_names'
 
+        cache_key = _get_query_cache_key(_method_name, location)
+        cached_result = self.__get_cached_query_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         lsa_required_attribute_names = []
 
         module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
@@ -876,7 +891,7 @@ class Aliases(object):
             if GET_METHOD in value and LSA in value[GET_METHOD]:
                 lsa_required_attribute_names.append(key)
 
-        return lsa_required_attribute_names
+        return self.__cache_query_result(cache_key, lsa_required_attribute_names)
 
     def model_mbean_has_set_mbean_type_attribute_name(self, location, model_name):
         """
@@ -917,6 +932,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_mbean_set_method_attribute_names_and_types'
 
+        cache_key = _get_query_cache_key(_method_name, location)
+        cached_result = self.__get_cached_query_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         try:
             model_attributes_dict = dict()
 
@@ -943,7 +963,7 @@ class Aliases(object):
 
                     model_attributes_dict[key] = attr_dict
 
-            return model_attributes_dict
+            return self.__cache_query_result(cache_key, model_attributes_dict)
         except AliasException, ae:
             self._raise_exception(ae, _method_name, 'WLSDPLY-19017', location.get_folder_path(),
                                   ae.getLocalizedMessage())
@@ -957,6 +977,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_merge_required_attribute_names'
 
+        cache_key = _get_query_cache_key(_method_name, location)
+        cached_result = self.__get_cached_query_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         try:
             model_attribute_names = list()
 
@@ -974,7 +999,7 @@ class Aliases(object):
                     if merge:
                         model_attribute_names.append(key)
 
-            return model_attribute_names
+            return self.__cache_query_result(cache_key, model_attribute_names)
         except AliasException, ae:
             self._raise_exception(ae, _method_name, 'WLSDPLY-19027', location.get_folder_path(),
                                   ae.getLocalizedMessage())
@@ -1016,6 +1041,11 @@ class Aliases(object):
         """
         _method_name = 'get_model_uses_path_tokens_attribute_names'
 
+        cache_key = _get_query_cache_key(_method_name, location, only_readable)
+        cached_result = self.__get_cached_query_result(cache_key)
+        if cached_result is not None:
+            return cached_result
+
         try:
             model_attribute_names = list()
             module_folder = self._alias_entries.get_dictionary_for_location(location, resolve=False)
@@ -1030,7 +1060,7 @@ class Aliases(object):
                     if not (only_readable and ACCESS in value and value[ACCESS] == IGNORED):
                         model_attribute_names.append(key)
 
-            return model_attribute_names
+            return self.__cache_query_result(cache_key, model_attribute_names)
         except AliasException, ae:
             self._raise_exception(ae, _method_name, 'WLSDPLY-19030', location.get_current_model_folder(),
                                   location.get_folder_path(), ae.getLocalizedMessage())
@@ -1058,67 +1088,8 @@ class Aliases(object):
 
             attribute_info = self._alias_entries.get_alias_attribute_entry_by_wlst_name(location, wlst_attribute_name)
             if attribute_info is not None and not self.__is_model_attribute_ignored(location, attribute_info):
-                data_type, preferred_type, delimiter = \
-                    alias_utils.compute_read_data_type_for_wlst_and_delimiter_from_attribute_info(attribute_info,
-                                                                                                  wlst_attribute_value)
-                model_type = data_type
-                if preferred_type:
-                    model_type = preferred_type
-
-                converted_value = alias_utils.convert_to_model_type(model_type, wlst_attribute_value,
-                                                                    delimiter=delimiter)
-
-                model_attribute_name = attribute_info[MODEL_NAME]
-                default_value = self._get_default_value_for_execution_mode(attribute_info)
-
-                #
-                # The logic below to compare the str() representation of the converted value and the default value
-                # only works for lists/maps if both the converted value and the default value are the same data type...
-                #
-                if (model_type in ALIAS_LIST_TYPES or model_type in ALIAS_MAP_TYPES) \
-                        and not (default_value == '[]' or default_value is None):
-                    # always the model delimiter
-                    default_value = alias_utils.convert_to_type(model_type, default_value,
-                                                                delimiter=MODEL_LIST_DELIMITER)
-
-                if attribute_info[WLST_TYPE] == STRING and default_value:
-                    default_value = alias_utils.replace_tokens_in_path(location, default_value)
-
-                if model_type == 'password':
-                    if string_utils.is_empty(wlst_attribute_value) or converted_value == default_value:
-                        model_attribute_value = None
-                    else:
-                        model_attribute_value = PASSWORD_TOKEN
-
-                elif model_type == 'boolean':
-                    wlst_val = alias_utils.convert_boolean(converted_value)
-                    default_val = alias_utils.convert_boolean(default_value)
-                    if wlst_val == default_val:
-                        model_attribute_value = None
-                    else:
-                        model_attribute_value = converted_value
-
-                elif (model_type in ALIAS_LIST_TYPES or data_type in ALIAS_MAP_TYPES) and \
-                        (converted_value is None or len(converted_value) == 0):
-                    if default_value == '[]' or default_value is None:
-                        model_attribute_value = None
-
-                elif self._model_context is not None and USES_PATH_TOKENS in attribute_info:
-                    if attribute_info[WLST_TYPE] == STRING:
-                        model_attribute_value = self._model_context.tokenize_path(converted_value)
-                    else:
-                        model_attribute_value = self._model_context.tokenize_classpath(converted_value)
-                    if model_attribute_value == default_value:
-                        model_attribute_value = None
-
-                elif default_value is None:
-                    model_attribute_value = converted_value
-
-                elif str_helper.to_string(converted_value) != str_helper.to_string(default_value):
-                    if _strings_are_empty(converted_value, default_value):
-                        model_attribute_value = None
-                    else:
-                        model_attribute_value = converted_value
+                model_attribute_name, model_attribute_value = \
+                    self.__get_model_attribute_name_and_value(location, attribute_info, wlst_attribute_value)
 
             self._logger.exiting(class_name=self._class_name, method_name=_method_name,
                                  result={model_attribute_name: model_attribute_value})
@@ -1128,6 +1099,55 @@ class Aliases(object):
             self._raise_exception(ae, _method_name, 'WLSDPLY-19028', str_helper.to_string(location),
                                   ae.getLocalizedMessage())
 
+    def get_model_attribute_names_and_values(self, location, wlst_attributes):
+        """
+        Returns the model attribute names and values for a set of WLST attribute names and values at the
+        specified location, such as the attributes returned by lsa().  The alias entries for the location are
+        found once and shared by all the attributes, and each attribute is converted as it would be by
+        get_model_attribute_name_and_value().  An error converting one attribute does not stop the others
+        from being converted.
+        :param location: the location
+        :param wlst_attributes: a list of (WLST attribute name, WLST attribute value) tuples
+        :return: a list of (WLST attribute name, model attribute name, model attribute value, error) tuples,
+                 in the same order.  The error is None if the attribute was converted, otherwise it is the
+                 tool type exception for the attribute, and the model name and value are None.
+        """
+        _method_name = 'get_model_attribute_names_and_values'
+        self._logger.entering(str_helper.to_string(location), class_name=self._class_name, method_name=_method_name)
+
+        try:
+            wlst_entries = self._alias_entries.get_alias_attribute_entries_by_wlst_name(location)
+        except AliasException:
+            # each attribute lookup below will report the error for the location
+            wlst_entries = dict()
+
+        result = list()
+        for wlst_attribute_name, wlst_attribute_value in wlst_attributes:
+            model_attribute_name = None
+            model_attribute_value = None
+            error = None
+            try:
+                if wlst_attribute_name in wlst_entries:
+                    attribute_info = wlst_entries[wlst_attribute_name]
+                else:
+                    # raises the same error as a single attribute lookup
+                    attribute_info = \
+                        self._alias_entries.get_alias_attribute_entry_by_wlst_name(location, wlst_attribute_name)
+
+                if attribute_info is not None and not self.__is_model_attribute_ignored(location, attribute_info):
+                    model_attribute_name, model_attribute_value = \
+                        self.__get_model_attribute_name_and_value(location, attribute_info, wlst_attribute_value)
+            except AliasException, ae:
+                error = exception_helper.create_exception(self._exception_type, 'WLSDPLY-19028',
+                                                          str_helper.to_string(location), ae.getLocalizedMessage(),
+                                                          error=ae)
+                model_attribute_name = None
+                model_attribute_value = None
+            result.append((wlst_attribute_name, model_attribute_name, model_attribute_value, error))
+
+        self._logger.exiting(class_name=self._class_name, method_name=_method_name)
+        return result
+
     def get_model_attribute_name(self, location, wlst_attribute_name, exclude_ignored=True):
         """
         Returns the model attribute name for the specified WLST attribute name and value. If the model attribute name
@@ -1168,9 +1188,15 @@ class Aliases(object):
         _method_name = 'get_model_attribute_names'
         self._logger.entering(str_helper.to_string(location), class_name=self._class_name, method_name=_method_name)
 
+        cache_key = _get_query_cache_key(_method_name, location)
+        result = self.__get_cached_query_result(cache_key)
+        if result is not None:
+            self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
+            return result
+
         try:
             attributes_dict = self._alias_entries.get_alias_attribute_entries_by_location(location)
-            result = list(attributes_dict.keys())
+            result = self.__cache_query_result(cache_key, list(attributes_dict.keys()))
             self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
             return result
         except AliasException, ae:
@@ -1296,6 +1322,83 @@ class Aliases(object):
             self._raise_exception(ae, _method_name, 'WLSDPLY-19032', model_attribute_name, location.get_folder_path(),
                                   ae.getLocalizedMessage())
 
+    def __get_model_attribute_name_and_value(self, location, attribute_info, wlst_attribute_value):
+        """
+        Convert the WLST attribute value to the model value for the alias attribute entry.
+        The model value is None if the WLST value is the default value for the attribute.
+        :param location: the location
+        :param attribute_info: the alias attribute entry
+        :param wlst_attribute_value: the WLST attribute value
+        :return: the model attribute name and value
+        :raises: AliasException: if an error occurs
+        """
+        # Assume wlst_attribute_value is the same as default value of model_attribute_name
+        model_attribute_value = None
+
+        data_type, preferred_type, delimiter = \
+            alias_utils.compute_read_data_type_for_wlst_and_delimiter_from_attribute_info(attribute_info,
+                                                                                          wlst_attribute_value)
+        model_type = data_type
+        if preferred_type:
+            model_type = preferred_type
+
+        converted_value = alias_utils.convert_to_model_type(model_type, wlst_attribute_value,
+                                                            delimiter=delimiter)
+
+        model_attribute_name = attribute_info[MODEL_NAME]
+        default_value = self._get_default_value_for_execution_mode(attribute_info)
+
+        #
+        # The logic below to compare the str() representation of the converted value and the default value
+        # only works for lists/maps if both the converted value and the default value are the same data type...
+        #
+        if (model_type in ALIAS_LIST_TYPES or model_type in ALIAS_MAP_TYPES) \
+                and not (default_value == '[]' or default_value is None):
+            # always the model delimiter
+            default_value = alias_utils.convert_to_type(model_type, default_value,
+                                                        delimiter=MODEL_LIST_DELIMITER)
+
+        if attribute_info[WLST_TYPE] == STRING and default_value:
+            default_value = alias_utils.replace_tokens_in_path(location, default_value)
+
+        if model_type == 'password':
+            if string_utils.is_empty(wlst_attribute_value) or converted_value == default_value:
+                model_attribute_value = None
+            else:
+                model_attribute_value = PASSWORD_TOKEN
+
+        elif model_type == 'boolean':
+            wlst_val = alias_utils.convert_boolean(converted_value)
+            default_val = alias_utils.convert_boolean(default_value)
+            if wlst_val == default_val:
+                model_attribute_value = None
+            else:
+                model_attribute_value = converted_value
+
+        elif (model_type in ALIAS_LIST_TYPES or data_type in ALIAS_MAP_TYPES) and \
+                (converted_value is None or len(converted_value) == 0):
+            if default_value == '[]' or default_value is None:
+                model_attribute_value = None
+
+        elif self._model_context is not None and USES_PATH_TOKENS in attribute_info:
+            if attribute_info[WLST_TYPE] == STRING:
+                model_attribute_value = self._model_context.tokenize_path(converted_value)
+            else:
+                model_attribute_value = self._model_context.tokenize_classpath(converted_value)
+            if model_attribute_value == default_value:
+                model_attribute_value = None
+
+        elif default_value is None:
+            model_attribute_value = converted_value
+
+        elif str_helper.to_string(converted_value) != str_helper.to_string(default_value):
+            if _strings_are_empty(converted_value, default_value):
+                model_attribute_value = None
+            else:
+                model_attribute_value = converted_value
+
+        return model_attribute_name, model_attribute_value
+
     def _get_default_value_for_execution_mode(self, attribute_info):
         """
         Get the default value corresponding to the domain execution mode.
@@ -1481,6 +1584,22 @@ class Aliases(object):
         """
         return self._exception_type
 
+    def get_query_cache_statistics(self):
+        """
+        Get the hit and miss counts for the cached attribute name queries.
+        :return: the number of cache hits and the number of cache misses
+        """
+        return self._query_cache_hits, self._query_cache_misses
+
+    def get_category_load_times(self):
+        """
+        Get the time taken to load and resolve each alias category used so far.  The alias entries are
+        shared by all Aliases objects for the same WLS version and WLST mode, so the times include
+        categories loaded through those objects.
+        :return: a dictionary of the elapsed milliseconds, keyed by category name
+        """
+        return self._alias_entries.get_category_load_times()
+
     def get_wlst_mbean_type_and_name(self, location):
         """
         Get the MBean type and name from the specified location.
@@ -1526,7 +1645,7 @@ class Aliases(object):
         """
         Is the model attribute ignored?
         :param location: the location
-        :param attribute_info: the attribute tuple
+        :param attribute_info: the read-only attribute entry
         :return: True if the attribute is ignored, False otherwise
         """
         _method_name = '__is_model_attribute_ignored'
@@ -1543,7 +1662,7 @@ class Aliases(object):
         """
         Is the wlst attribute ignored or read-only?
         :param location: the location
-        :param attribute_info: the attribute tuple
+        :param attribute_info: the read-only attribute entry or resolved attribute dictionary
         :return: True if the attribute is ignored or read-only, False otherwise
         """
         _method_name = '__is_wlst_attribute_read_only_or_ignored'
@@ -1556,6 +1675,28 @@ class Aliases(object):
 
         return rtnval
 
+    def __get_cached_query_result(self, cache_key):
+        """
+        Get a copy of the cached result for the specified query key, and update the hit and miss counts.
+        :param cache_key: the query cache key
+        :return: a copy of the cached result, or None if the query has not been cached
+        """
+        if cache_key in self._query_cache:
+            self._query_cache_hits += 1
+            return _copy_query_result(self._query_cache[cache_key])
+        self._query_cache_misses += 1
+        return None
+
+    def __cache_query_result(self, cache_key, result):
+        """
+        Add the query result to the cache.  The caller is given a copy, so changes to it won't affect the cache.
+        :param cache_key: the query cache key
+        :param result: the list or dictionary result of the query
+        :return: a copy of the result
+        """
+        self._query_cache[cache_key] = result
+        return _copy_query_result(result)
+
     def _raise_exception(self, error, method_name, message_key, *args):
         """
         Throw an exception matching the declared tool type, after logging the exception.
@@ -1569,6 +1710,32 @@ class Aliases(object):
         raise ex
 
 
+def _get_query_cache_key(query_name, location, *args):
+    """
+    Get the cache key for an attribute name query at the specified location.
+    The alias folder for a location depends only on its model folders, so name tokens are not part of the key.
+    :param query_name: the name of the query method
+    :param location: the location of the query
+    :param args: any additional query arguments
+    :return: a hashable cache key
+    """
+    return (query_name, tuple(location.get_model_folders())) + args
+
+
+def _copy_query_result(result):
+    """
+    Copy a cached query result, including any dictionary values.
+    :param result: a list of names, or a dictionary of names to dictionaries
+    :return: the copied result
+    """
+    if isinstance(result, dict):
+        result_copy = dict()
+        for key, value in result.iteritems():
+            result_copy[key] = dict(value)
+        return result_copy
+    return list(result)
+
+
 def _convert_to_string(value):
     if type(value) in [str, unicode]:
         str_converted_value = value
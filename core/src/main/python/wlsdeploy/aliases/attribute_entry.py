@@ -0,0 +1,131 @@
+"""
+Copyright (c) 2023, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+The immutable attribute entries returned by the AliasEntries attribute lookup methods, and their per-folder index.
+"""
+from wlsdeploy.aliases.alias_constants import ACCESS
+from wlsdeploy.aliases.alias_constants import DEFAULT_VALUE
+from wlsdeploy.aliases.alias_constants import MODEL_NAME
+from wlsdeploy.aliases.alias_constants import WLST_NAME
+from wlsdeploy.aliases.alias_constants import WLST_PATH
+from wlsdeploy.aliases.alias_constants import WLST_TYPE
+
+
+class AttributeEntry(object):
+    """
+    A read-only view of a resolved alias attribute dictionary, without the unresolved wlst_path.
+    Entries are created once per alias folder and returned by reference, so they cannot be modified.
+    The most frequently used fields are available as attributes, and the other fields can be read
+    using the dictionary methods.
+    """
+    __slots__ = ['_entry_dict', 'model_name', 'wlst_name', 'wlst_type', 'default_value', 'access']
+
+    def __init__(self, entry_dict):
+        """
+        Create an entry for the resolved alias attribute dictionary.
+        :param entry_dict: the shared attribute dictionary, which must not be modified
+        """
+        _set = object.__setattr__
+        _set(self, '_entry_dict', entry_dict)
+        _set(self, 'model_name', entry_dict.get(MODEL_NAME))
+        _set(self, 'wlst_name', entry_dict.get(WLST_NAME))
+        _set(self, 'wlst_type', entry_dict.get(WLST_TYPE))
+        _set(self, 'default_value', entry_dict.get(DEFAULT_VALUE))
+        _set(self, 'access', entry_dict.get(ACCESS))
+
+    def __setattr__(self, name, value):
+        raise TypeError('AttributeEntry is immutable')
+
+    def __delattr__(self, name):
+        raise TypeError('AttributeEntry is immutable')
+
+    def __getitem__(self, key):
+        if key == WLST_PATH:
+            raise KeyError(key)
+        return self._entry_dict[key]
+
+    def __contains__(self, key):
+        return key != WLST_PATH and key in self._entry_dict
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, AttributeEntry):
+            other = other._as_dict()
+        return self._as_dict() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __str__(self):
+        return str(self._as_dict())
+
+    def __repr__(self):
+        return self.__str__()
+
+    def has_key(self, key):
+        return self.__contains__(key)
+
+    def get(self, key, default=None):
+        if self.__contains__(key):
+            return self._entry_dict[key]
+        return default
+
+    def keys(self):
+        result = list()
+        for key in self._entry_dict.keys():
+            if key != WLST_PATH:
+                result.append(key)
+        return result
+
+    def values(self):
+        result = list()
+        for key in self.keys():
+            result.append(self._entry_dict[key])
+        return result
+
+    def items(self):
+        result = list()
+        for key in self.keys():
+            result.append((key, self._entry_dict[key]))
+        return result
+
+    def iterkeys(self):
+        return iter(self.keys())
+
+    def itervalues(self):
+        return iter(self.values())
+
+    def iteritems(self):
+        return iter(self.items())
+
+    def has_wlst_path(self):
+        """
+        Determine if the underlying alias attribute dictionary has a wlst_path entry.
+        :return: True if the wlst_path is present, False otherwise
+        """
+        return WLST_PATH in self._entry_dict
+
+    def _as_dict(self):
+        return dict(self.items())
+
+
+class AttributeIndex(object):
+    """
+    The attribute entries for an alias folder, indexed by model attribute name and by WLST attribute name.
+    """
+    __slots__ = ['model_entries', 'wlst_entries']
+
+    def __init__(self, model_entries, wlst_entries):
+        """
+        Create the index.
+        :param model_entries: the attribute entries keyed by model attribute name
+        :param wlst_entries: the attribute entries keyed by WLST attribute name, with None for WLST names to skip
+        """
+        self.model_entries = model_entries
+        self.wlst_entries = wlst_entries
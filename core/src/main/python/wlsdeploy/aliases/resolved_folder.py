@@ -0,0 +1,174 @@
+"""
+Copyright (c) 2023, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Read-only views of alias folder dictionaries with the path tokens resolved for a specific location.
+The views share the underlying alias folder dictionary and only hold the resolved path strings, so
+creating one does not copy the folder, its attributes or its subfolders.
+"""
+from wlsdeploy.aliases.alias_constants import ATTRIBUTES
+from wlsdeploy.aliases.alias_constants import WLST_PATH
+from wlsdeploy.aliases.alias_constants import WLST_PATHS
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_class_name = 'resolved_folder'
+_logger = PlatformLogger('wlsdeploy.aliases')
+
+
+class _ReadOnlyDictView(object):
+    """
+    Base class for the read-only dictionary views.  Lookups are delegated to the underlying dictionary,
+    except for keys that are overlaid by the subclass.  The underlying dictionary must not be modified.
+    """
+    def __init__(self, base_dict, overlay_dict=None):
+        """
+        Create a view of the specified dictionary.
+        :param base_dict: the shared dictionary being viewed
+        :param overlay_dict: a dictionary of values that replace or add to those in the base dictionary
+        """
+        self._base_dict = base_dict
+        if overlay_dict is None:
+            overlay_dict = dict()
+        self._overlay_dict = overlay_dict
+
+    def __getitem__(self, key):
+        if key in self._overlay_dict:
+            return self._overlay_dict[key]
+        return self._get_base_item(key)
+
+    def __contains__(self, key):
+        return key in self._overlay_dict or key in self._base_dict
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __nonzero__(self):
+        return len(self._overlay_dict) > 0 or len(self._base_dict) > 0
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __str__(self):
+        return str(dict(self.items()))
+
+    def __repr__(self):
+        return self.__str__()
+
+    def has_key(self, key):
+        return self.__contains__(key)
+
+    def get(self, key, default=None):
+        if self.__contains__(key):
+            return self.__getitem__(key)
+        return default
+
+    def keys(self):
+        result = list(self._base_dict.keys())
+        for key in self._overlay_dict:
+            if key not in self._base_dict:
+                result.append(key)
+        return result
+
+    def values(self):
+        result = list()
+        for key in self.keys():
+            result.append(self.__getitem__(key))
+        return result
+
+    def items(self):
+        result = list()
+        for key in self.keys():
+            result.append((key, self.__getitem__(key)))
+        return result
+
+    def iterkeys(self):
+        return iter(self.keys())
+
+    def itervalues(self):
+        return iter(self.values())
+
+    def iteritems(self):
+        return iter(self.items())
+
+    def _get_base_item(self, key):
+        """
+        Get the item for a key that is not overlaid.  Subclasses override this to wrap values from the base dictionary.
+        :param key: the key
+        :return: the value from the base dictionary
+        """
+        return self._base_dict[key]
+
+
+class ResolvedFolder(_ReadOnlyDictView):
+    """
+    A read-only view of an alias folder dictionary with its WLST paths resolved for a location.
+    Subfolders are returned from the shared dictionary without resolving their paths.
+    """
+    def __init__(self, folder_dict, resolved_paths, path_name):
+        """
+        Create a resolved view of the folder dictionary.
+        :param folder_dict: the alias folder dictionary, resolved for WLS version and WLST mode
+        :param resolved_paths: the resolved wlst_paths dictionary and path attributes for the folder
+        :param path_name: the model path name of the folder, used for error reporting
+        """
+        _ReadOnlyDictView.__init__(self, folder_dict, resolved_paths)
+        self._path_name = path_name
+        self._attributes_view = None
+
+    def _get_base_item(self, key):
+        if key == ATTRIBUTES:
+            if self._attributes_view is None:
+                self._attributes_view = \
+                    _ResolvedAttributes(self._base_dict[ATTRIBUTES], self._overlay_dict[WLST_PATHS], self._path_name)
+            return self._attributes_view
+        return self._base_dict[key]
+
+
+class _ResolvedAttributes(_ReadOnlyDictView):
+    """
+    A read-only view of the attributes dictionary of an alias folder, keyed by model attribute name.
+    Each attribute is checked for the required wlst_path key when it is read.
+    """
+    def __init__(self, attributes_dict, wlst_paths, path_name):
+        _ReadOnlyDictView.__init__(self, attributes_dict)
+        self._wlst_paths = wlst_paths
+        self._path_name = path_name
+
+    def _get_base_item(self, key):
+        _method_name = '_get_base_item'
+
+        attribute_dict = self._base_dict[key]
+        if WLST_PATH not in attribute_dict:
+            ex = exception_helper.create_alias_exception('WLSDPLY-08011', key, self._path_name)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+        return _ResolvedAttribute(attribute_dict, self._wlst_paths, key, self._path_name)
+
+
+class _ResolvedAttribute(_ReadOnlyDictView):
+    """
+    A read-only view of an alias attribute entry with the wlst_path index resolved on demand.
+    """
+    def __init__(self, attribute_dict, wlst_paths, attribute_name, path_name):
+        _ReadOnlyDictView.__init__(self, attribute_dict)
+        self._wlst_paths = wlst_paths
+        self._attribute_name = attribute_name
+        self._path_name = path_name
+
+    def _get_base_item(self, key):
+        value = self._base_dict[key]
+        if key == WLST_PATH:
+            return self.__resolve_wlst_path(value)
+        return value
+
+    def __resolve_wlst_path(self, wlst_path_key):
+        _method_name = '__resolve_wlst_path'
+
+        if wlst_path_key in self._wlst_paths:
+            return self._wlst_paths[wlst_path_key]
+
+        ex = exception_helper.create_alias_exception('WLSDPLY-08010', self._attribute_name,
+                                                     self._path_name, wlst_path_key)
+        _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+        raise ex
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2022, Oracle and/or its affiliates.
+Copyright (c) 2017, 2023, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 This model provider translation classes that convert between JSON and Python Dictionaries.
@@ -12,6 +12,7 @@ import java.io.IOException as JIOException
 import java.io.PrintWriter as JPrintWriter
 import java.lang.Boolean as JBoolean
 import java.lang.IllegalArgumentException as JIllegalArgumentException
+import java.lang.String as JString
 
 import oracle.weblogic.deploy.util.FileUtils as JFileUtils
 import oracle.weblogic.deploy.json.JsonStreamTranslator as JJsonStreamTranslator
@@ -126,7 +127,8 @@ class PythonToJson(object):
         writer = None
         try:
             fos = JFileOutputStream(json_file, False)
-            writer = JPrintWriter(fos, True)
+            # the print writer buffers the output, don't flush it for each line
+            writer = JPrintWriter(fos, False)
             self._write_dictionary_to_json_file(self._dictionary, writer)
 
         except JFileNotFoundException, fnfe:
@@ -167,13 +169,16 @@ class PythonToJson(object):
         for key, value in dictionary.iteritems():
             writer.println(end_line)
             end_line = ','
-            writer.write(indent + '"' + _escape_text(key) + '" : ')
+            writer.write(indent)
+            writer.write('"')
+            writer.write(_escape_text(key))
+            writer.write('" : ')
             if isinstance(value, dict):
                 self._write_dictionary_to_json_file(value, writer, indent)
             elif isinstance(value, list):
                 self._write_list_to_json_file(value, writer, indent)
             else:
-                writer.write(_format_json_value(value))
+                _write_json_value(value, writer)
         writer.println()
         writer.write(end_indent + _end_dict)
 
@@ -195,7 +200,7 @@ class PythonToJson(object):
                 self._write_dictionary_to_json_file(value, writer, list_indent)
             else:
                 writer.write(list_indent)
-                writer.write(_format_json_value(value))
+                _write_json_value(value, writer)
             end_line = ','
         writer.println()
         writer.write(indent + ']')
@@ -218,21 +223,22 @@ class PythonToJson(object):
                                   class_name=self._class_name, method_name=_method_name)
 
 
-def _format_json_value(value):
+def _write_json_value(value, writer):
     """
-    Format the value as a JSON snippet.
+    Write the value as a JSON snippet.
     :param value: the value
-    :return: the JSON snippet
+    :param writer: where to write the JSON snippet
     """
-    import java.lang.StringBuilder as StringBuilder
-    builder = StringBuilder()
     if type(value) == bool:
-        builder.append(JBoolean.toString(value))
+        writer.write(JBoolean.toString(value))
     elif isinstance(value, types.StringTypes):
-        builder.append('"').append(_escape_text(value.strip())).append('"')
+        writer.write('"')
+        writer.write(_escape_text(value.strip()))
+        writer.write('"')
+    elif value is None:
+        writer.write('null')
     else:
-        builder.append(value)
-    return builder.toString()
+        writer.write(JString.valueOf(value))
 
 
 def _escape_text(text):
@@ -2,7 +2,6 @@
 Copyright (c) 2017, 2023, Oracle Corporation and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
-import copy
 import re
 from sets import Set
 
@@ -18,6 +17,7 @@ from javax.xml.transform.dom import DOMSource
 from javax.xml.transform.stream import StreamResult
 
 import oracle.weblogic.deploy.util.FileUtils as FileUtils
+import oracle.weblogic.deploy.util.ModelCopyUtils as ModelCopyUtils
 import oracle.weblogic.deploy.util.PyOrderedDict as OrderedDict
 from oracle.weblogic.deploy.util import WLSDeployArchive
 
@@ -121,8 +121,8 @@ class ApplicationsDeployer(Deployer):
                 # WebLogic, we have to go compute the required name and change the name in the model prior to
                 # making changes to the domain.
                 #
-                shared_library = \
-                    copy.deepcopy(dictionary_utils.get_dictionary_element(shared_libraries, shared_library_name))
+                shared_library = ModelCopyUtils.copyModel(
+                    dictionary_utils.get_dictionary_element(shared_libraries, shared_library_name))
                 shlib_source_path = dictionary_utils.get_element(shared_library, SOURCE_PATH)
                 if string_utils.is_empty(shlib_source_path):
                     ex = exception_helper.create_deploy_exception('WLSDPLY-09302', LIBRARY, shared_library_name,
@@ -195,8 +195,8 @@ class ApplicationsDeployer(Deployer):
                     self.logger.info('WLSDPLY-09301', APPLICATION, application_name, self._parent_type, self._parent_name,
                                      class_name=self._class_name, method_name=_method_name)
 
-                application = \
-                    copy.deepcopy(dictionary_utils.get_dictionary_element(applications, application_name))
+                application = ModelCopyUtils.copyModel(
+                    dictionary_utils.get_dictionary_element(applications, application_name))
 
                 app_source_path = dictionary_utils.get_element(application, SOURCE_PATH)
                 if string_utils.is_empty(app_source_path):
@@ -281,8 +281,10 @@ class ApplicationsDeployer(Deployer):
 
         # Make copies of the model dictionary since we are going
         # to modify it as we build the deployment strategy.
-        model_shared_libraries = copy.deepcopy(dictionary_utils.get_dictionary_element(self._parent_dict, LIBRARY))
-        model_applications = copy.deepcopy(dictionary_utils.get_dictionary_element(self._parent_dict, APPLICATION))
+        model_shared_libraries = \
+            ModelCopyUtils.copyModel(dictionary_utils.get_dictionary_element(self._parent_dict, LIBRARY))
+        model_applications = \
+            ModelCopyUtils.copyModel(dictionary_utils.get_dictionary_element(self._parent_dict, APPLICATION))
 
         if len(model_shared_libraries) == 0 and len(model_applications) == 0:
             # Nothing to do...
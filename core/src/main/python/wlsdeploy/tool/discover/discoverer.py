@@ -118,6 +118,7 @@ class Discoverer(object):
 
         wlst_lsa_params = self._get_attributes_for_current_location(location)
         wlst_did_get = list()
+        wlst_values = list()
         _logger.finest('WLSDPLY-06102', self._wlst_helper.get_pwd(), wlst_lsa_params, class_name=_class_name,
                        method_name=_method_name)
         wlst_get_params = self._get_required_attributes(location)
@@ -145,7 +146,7 @@ class Discoverer(object):
                                  de.getLocalizedMessage(), class_name=_class_name, method_name=_method_name)
                     continue
 
-                self._add_to_dictionary(dictionary, location, wlst_lsa_param, wlst_value, wlst_path)
+                wlst_values.append((wlst_lsa_param, wlst_value))
 
         # These will come after the lsa params in the ordered dictionary
         # Find the attributes that are not in the LSA wlst map but are in the alias definitions with GET access
@@ -153,7 +154,20 @@ class Discoverer(object):
         for get_attribute in get_attributes:
             success, wlst_value = self._get_attribute_value_with_get(get_attribute, wlst_path)
             if success:
-                self._add_to_dictionary(dictionary, location, get_attribute, wlst_value, wlst_path)
+                wlst_values.append((get_attribute, wlst_value))
+
+        # convert all the values for the folder with one aliases call
+        if len(wlst_values) > 0:
+            conversions = self._aliases.get_model_attribute_names_and_values(location, wlst_values)
+            for index in range(len(conversions)):
+                wlst_param, model_param, model_value, error = conversions[index]
+                _logger.finer('WLSDPLY-06105', wlst_param, wlst_values[index][1], wlst_path, class_name=_class_name,
+                              method_name=_method_name)
+                if error is not None:
+                    _logger.info('WLSDPLY-06106', wlst_param, wlst_path, error.getLocalizedMessage(),
+                                 class_name=_class_name, method_name=_method_name)
+                else:
+                    self._add_model_value_to_dictionary(dictionary, location, model_param, model_value)
 
     def _omit_from_model(self, location, wlst_lsa_param):
         """
@@ -183,19 +197,15 @@ class Discoverer(object):
                             class_name=_class_name, method_name=_method_name)
         return success, wlst_value
 
-    def _add_to_dictionary(self, dictionary, location, wlst_param, wlst_value, wlst_path):
-        _method_name = '_add_to_dictionary'
-        _logger.finer('WLSDPLY-06105', wlst_param, wlst_value, wlst_path, class_name=_class_name,
-                      method_name=_method_name)
-        try:
-            model_param, model_value = self._aliases.get_model_attribute_name_and_value(location,
-                                                                                        wlst_param,
-                                                                                        wlst_value)
-        except DiscoverException, de:
-            _logger.info('WLSDPLY-06106', wlst_param, wlst_path, de.getLocalizedMessage(),
-                         class_name=_class_name, method_name=_method_name)
-            return
-
+    def _add_model_value_to_dictionary(self, dictionary, location, model_param, model_value):
+        """
+        Check the converted model value for the attribute, and store it in the model dictionary if it is not None.
+        :param dictionary: where to store the model value
+        :param location: the location of the attribute
+        :param model_param: the model attribute name
+        :param model_value: the model value converted from the WLST value
+        """
+        _method_name = '_add_model_value_to_dictionary'
         model_value = self._check_attribute(model_param, model_value, location)
         if model_value is not None:
             _logger.finer('WLSDPLY-06107', model_param, model_value, class_name=_class_name,
@@ -5,6 +5,7 @@ import os
 from java.io import FileInputStream
 from java.io import IOException
 from java.util import Properties
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
 from oracle.weblogic.deploy.util import VariableException
 from oracle.weblogic.deploy.validate import ValidateException
 
@@ -27,6 +28,7 @@ from wlsdeploy.tool.validate.content_validator import ContentValidator
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.util import cla_helper
 from wlsdeploy.util import model
+from wlsdeploy.util import model_translator
 from wlsdeploy.util import target_configuration_helper
 import wlsdeploy.util.unicode_helper as str_helper
 from wlsdeploy.util.model import Model
@@ -218,10 +220,13 @@ class ModelPreparer:
 
     def _add_model_variables(self, model_dictionary, all_variables):
         """
-        Add any variable values found in the model dictionary to the variables list
+        Add the keys of any variables found in the model dictionary to the variables dictionary, as keys
         :param model_dictionary: the dictionary to be examined
-        :param all_variables: the list to be appended
+        :param all_variables: the dictionary to be updated
         """
+        if isinstance(model_dictionary, OrderedDict) and model_dictionary.isTokenFree():
+            return
+
         for key in model_dictionary:
             value = model_dictionary[key]
             if isinstance(value, dict):
@@ -229,7 +234,7 @@ class ModelPreparer:
             else:
                 matches = variables.get_variable_matches(str_helper.to_string(value))
                 for token, variable_key in matches:
-                    all_variables.append(variable_key)
+                    all_variables[variable_key] = True
 
     def _clean_variable_files(self, merged_model_dictionary):
         """
@@ -238,7 +243,8 @@ class ModelPreparer:
         """
         _method_name = '_clean_variable_files'
 
-        all_model_variables = []
+        # a dictionary is used as a set, so each variable is checked in constant time
+        all_model_variables = {}
         self._add_model_variables(merged_model_dictionary, all_model_variables)
 
         original_file = self.model_context.get_variable_file()
@@ -307,6 +313,7 @@ class ModelPreparer:
         try:
             model_file_list = self.model_files.split(',')
             target = self.model_context.get_target()
+            aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE)
 
             for model_file in model_file_list:
                 if os.path.splitext(model_file)[1].lower() == ".yaml":
@@ -327,9 +334,8 @@ class ModelPreparer:
                         self._logger.throwing(ex, class_name=_class_name, method_name=_method_name)
                         raise ex
 
-                FileToPython(model_file_name, True).parse()
-
-                aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE)
+                # check the syntax before validation, the parsed model is used by the merge
+                model_translator.load_model_file(model_file_name)
 
                 validator = Validator(self.model_context, aliases, wlst_mode=WlstModes.OFFLINE)
 
@@ -404,9 +410,14 @@ class ModelPreparer:
                                                                   self.credential_injector, self.model_context,
                                                                   ExceptionType.PREPARE)
 
+            model_translator.log_model_file_statistics()
+
         except (ValidateException, VariableException, TranslateException), e:
             self._logger.severe('WLSDPLY-20009', _program_name, model_file_name, e.getLocalizedMessage(),
                                 error=e, class_name=_class_name, method_name=_method_name)
             ex = exception_helper.create_prepare_exception(e.getLocalizedMessage(), error=e)
             self._logger.throwing(ex, class_name=_class_name, method_name=_method_name)
             raise ex
+        finally:
+            # release any parsed models that were not used, such as after a validation error
+            model_translator.release_kept_models()
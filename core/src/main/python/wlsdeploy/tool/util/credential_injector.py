@@ -227,8 +227,7 @@ class CredentialInjector(VariableInjector):
             _logger.info("WLSDPLY-19650", credentials_method, class_name=_class_name, method_name=_method_name)
             return
 
-        all_variables = []
-        self._add_model_variables(model_dictionary, all_variables)
+        all_variables = self._get_model_variables(model_dictionary)
 
         cache_keys = self.get_variable_cache().keys()
         for key in cache_keys:
@@ -244,12 +243,26 @@ class CredentialInjector(VariableInjector):
                 _logger.info("WLSDPLY-19651", variable_name, class_name=_class_name, method_name=_method_name)
                 del self.get_variable_cache()[key]
 
+    def _get_model_variables(self, model_dictionary):
+        """
+        Get the variable values found in the model dictionary, in a single walk of the model.
+        A dictionary is used as a set, so each cache key can be checked in constant time.
+        :param model_dictionary: the dictionary to be examined
+        :return: a dictionary with the variable values as keys
+        """
+        variables = {}
+        self._add_model_variables(model_dictionary, variables)
+        return variables
+
     def _add_model_variables(self, model_dictionary, variables):
         """
-        Add any variable values found in the model dictionary to the variables list
+        Add any variable values found in the model dictionary to the variables dictionary, as keys
         :param model_dictionary: the dictionary to be examined
-        :param variables: the list to be appended
+        :param variables: the dictionary to be updated
         """
+        if isinstance(model_dictionary, OrderedDict) and model_dictionary.isTokenFree():
+            return
+
         for key in model_dictionary:
             value = model_dictionary[key]
             if isinstance(value, dict):
@@ -257,4 +270,4 @@ class CredentialInjector(VariableInjector):
             else:
                 text = str_helper.to_string(value)
                 if text.startswith('@@'):
-                    variables.append(text)
+                    variables[text] = True
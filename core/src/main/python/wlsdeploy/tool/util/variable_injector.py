@@ -16,6 +16,7 @@ import java.util.Properties as Properties
 
 import oracle.weblogic.deploy.aliases.AliasException as AliasException
 import oracle.weblogic.deploy.json.JsonException as JsonException
+import oracle.weblogic.deploy.util.ModelCopyUtils as ModelCopyUtils
 import oracle.weblogic.deploy.util.PyOrderedDict as OrderedDict
 import oracle.weblogic.deploy.util.VariableException as VariableException
 import wlsdeploy.tool.util.variable_injector_functions as variable_injector_functions
@@ -90,7 +91,7 @@ class VariableInjector(object):
         :param variable_dictionary: optional, a pre-populated map of variables
         """
         self.__program_name = program_name
-        self.__original = copy.deepcopy(model)
+        self.__original = ModelCopyUtils.copyModel(model)
         self.__model = model
         self.__model_context = model_context
         if self.__model_context:
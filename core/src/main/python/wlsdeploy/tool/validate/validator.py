@@ -3,11 +3,11 @@ Copyright (c) 2017, 2023, Oracle Corporation and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
-import copy
 
 from java.util.logging import Level
 
 from oracle.weblogic.deploy.logging import WLSDeployLogEndHandler
+from oracle.weblogic.deploy.util import ModelCopyUtils
 from oracle.weblogic.deploy.util import WLSDeployArchive
 from oracle.weblogic.deploy.util import VariableException
 
@@ -131,7 +131,7 @@ class Validator(object):
         # treated as a "read-only'" reference variable, during the variable
         # file validation process. The variable file validation process could
         # actually require changes to be made to the cloned model dictionary
-        cloned_model_dict = copy.deepcopy(model_dict)
+        cloned_model_dict = ModelCopyUtils.copyModel(model_dict)
 
         self._logger.entering(archive_file_name, class_name=_class_name, method_name=_method_name)
         self.__validate_model_file(cloned_model_dict, variable_map, archive_file_name)
@@ -180,7 +180,7 @@ class Validator(object):
         # treated as a "read-only'" reference variable, during the variable
         # file validation process. The variable file validation process could
         # actually require changes to be made to the cloned model dictionary
-        cloned_model_dict = copy.deepcopy(model_dict)
+        cloned_model_dict = ModelCopyUtils.copyModel(model_dict)
 
         self._logger.entering(variables_file_name, archive_file_name, class_name=_class_name, method_name=_method_name)
         return_code = Validator.ReturnCode.STOP
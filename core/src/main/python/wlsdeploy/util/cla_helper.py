@@ -5,15 +5,22 @@ Licensed under the Universal Permissive License v1.0 as shown at https://oss.ora
 Utility CLS methods shared by multiple tools.
 """
 import os
+import sys
 
 from java.io import File
 from java.io import IOException
 from java.lang import IllegalArgumentException
+from java.lang import Runtime
 from java.lang import String
+from java.math import BigInteger
+from java.security import MessageDigest
+from java.util.concurrent import Callable
+from java.util.concurrent import Executors
 
 from oracle.weblogic.deploy.util import FileUtils
 from oracle.weblogic.deploy.util import TranslateException
 from oracle.weblogic.deploy.util import VariableException
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
 from oracle.weblogic.deploy.validate import ValidateException
 
 import oracle.weblogic.deploy.util.PyOrderedDict as OrderedDict
@@ -24,15 +31,16 @@ from wlsdeploy.tool.util import filter_helper
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.util import cla_utils
 from wlsdeploy.util import getcreds
+from wlsdeploy.util import model_config
 from wlsdeploy.util import model_helper
 from wlsdeploy.util import model_translator
 from wlsdeploy.util import path_utils
 from wlsdeploy.util import env_helper
+import wlsdeploy.util.unicode_helper as str_helper
 
 from wlsdeploy.util import variables
 from wlsdeploy.util.cla_utils import CommandLineArgUtil
 from wlsdeploy.util.exit_code import ExitCode
-from wlsdeploy.util.model_translator import FileToPython
 from wlsdeploy.exception.exception_helper import create_cla_exception
 
 
@@ -225,7 +233,7 @@ def load_model(program_name, model_context, aliases, filter_type, wlst_mode, val
 
     model_file_value = model_context.get_model_file()
     try:
-        model_dictionary = merge_model_files(model_file_value, variable_map)
+        model_dictionary = merge_model_files(model_file_value, variable_map, model_context.get_model_cache_dir())
     except TranslateException, te:
         __logger.severe('WLSDPLY-09014', program_name, model_file_value, te.getLocalizedMessage(), error=te,
                         class_name=_class_name, method_name=_method_name)
@@ -303,24 +311,174 @@ def clean_up_temp_files():
         __tmp_model_dir = None
 
 
-def merge_model_files(model_file_value, variable_map=None):
+def merge_model_files(model_file_value, variable_map=None, model_cache_dir=None):
     """
     Merge the model files specified by the model file value.
     It may be a single file, or a comma-separated list of files.
+    The files are parsed concurrently, and merged in the order they are specified.
+    If a model cache directory is specified, a merged model that was saved there for the same model files and
+    variables is used instead, and a new merged model is saved there.
     :param variable_map: variables to be used for name resolution, or None
     :param model_file_value: the value specified as a command argument
+    :param model_cache_dir: the directory for saved merged models, or None
     :return: the merge model dictionary
     """
-    merged_model = OrderedDict()
     model_files = cla_utils.get_model_files(model_file_value)
 
-    for model_file in model_files:
-        model = FileToPython(model_file, True).parse()
+    cache_file = None
+    if model_cache_dir is not None:
+        cache_file = _get_model_cache_file(model_cache_dir, model_files, variable_map)
+        merged_model = _read_model_cache_file(cache_file)
+        if merged_model is not None:
+            return merged_model
+
+    merged_model = OrderedDict()
+    for model in _parse_model_files(model_files):
         merge_model_dictionaries(merged_model, model, variable_map)
 
+    if cache_file is not None:
+        _write_model_cache_file(cache_file, merged_model)
+    return merged_model
+
+
+def _get_model_cache_file(model_cache_dir, model_files, variable_map):
+    """
+    Get the file in the model cache directory for the merged model.
+    The name of the file is a hash of the tool version, the contents of the model files in order, and the variables,
+    so a change to any of these uses a different file.
+    :param model_cache_dir: the model cache directory
+    :param model_files: the list of model file names
+    :param variable_map: variables used for name resolution, or None
+    :return: the cache file, which may not exist
+    """
+    digest = MessageDigest.getInstance('SHA-256')
+    digest.update(String(WebLogicDeployToolingVersion.getVersion()).getBytes('UTF-8'))
+    for model_file in model_files:
+        file_hash = FileUtils.computeHash(File(model_file))
+        digest.update(String('\n' + file_hash).getBytes('UTF-8'))
+
+    if variable_map:
+        variable_names = variable_map.keys()
+        variable_names.sort()
+        for name in variable_names:
+            digest.update(String('\n' + name + '=' + str_helper.to_string(variable_map[name])).getBytes('UTF-8'))
+
+    file_name = 'model-' + BigInteger(1, digest.digest()).toString(16) + '.yaml'
+    return File(model_cache_dir, file_name)
+
+
+def _read_model_cache_file(cache_file):
+    """
+    Read the merged model from the cache file, if it exists.
+    :param cache_file: the cache file
+    :return: the merged model dictionary, or None if the file does not exist or could not be read
+    """
+    _method_name = '_read_model_cache_file'
+
+    if not cache_file.isFile():
+        return None
+
+    try:
+        merged_model = model_translator.FileToPython(cache_file.getAbsolutePath(), True).parse()
+    except TranslateException, te:
+        __logger.warning('WLSDPLY-01653', cache_file, te.getLocalizedMessage(), error=te,
+                         class_name=_class_name, method_name=_method_name)
+        return None
+
+    __logger.info('WLSDPLY-01652', cache_file, class_name=_class_name, method_name=_method_name)
     return merged_model
 
 
+def _write_model_cache_file(cache_file, merged_model):
+    """
+    Save the merged model to the cache file.
+    The model is written to a temporary file that is renamed, so other processes never read a partial file.
+    The model is not substituted, so it may contain passwords, and the file is only readable by its owner.
+    :param cache_file: the cache file
+    :param merged_model: the merged model dictionary
+    """
+    _method_name = '_write_model_cache_file'
+
+    temp_file = None
+    try:
+        temp_file = File.createTempFile('model-', '.yaml', cache_file.getParentFile())
+        FileUtils.chmod(temp_file.getPath(), 0600)
+        model_translator.PythonToFile(merged_model).write_to_file(temp_file.getAbsolutePath())
+        if not temp_file.renameTo(cache_file) and not cache_file.isFile():
+            __logger.warning('WLSDPLY-01655', cache_file, temp_file, class_name=_class_name, method_name=_method_name)
+        else:
+            __logger.fine('WLSDPLY-01654', cache_file, class_name=_class_name, method_name=_method_name)
+    except (IOException, TranslateException), ex:
+        __logger.warning('WLSDPLY-01656', cache_file, ex.getLocalizedMessage(), error=ex,
+                         class_name=_class_name, method_name=_method_name)
+
+    if temp_file is not None and temp_file.exists():
+        temp_file.delete()
+
+
+def _parse_model_files(model_files):
+    """
+    Parse the model files. If there is more than one file, the files are parsed on a thread pool.
+    :param model_files: the list of model file names
+    :return: the list of model dictionaries, in the same order as the model files
+    :raises TranslateException: if an error occurs, for the first model file in the list that failed
+    """
+    if len(model_files) < 2:
+        return [model_translator.parse_model_file(model_file) for model_file in model_files]
+
+    # the model configuration is shared by the translators, create it before the threads use it
+    model_config.get_model_config()
+
+    thread_count = min(len(model_files), Runtime.getRuntime().availableProcessors())
+    executor = Executors.newFixedThreadPool(thread_count)
+    try:
+        tasks = []
+        futures = []
+        for model_file in model_files:
+            task = _ParseModelTask(model_file)
+            tasks.append(task)
+            futures.append(executor.submit(task))
+
+        for future in futures:
+            future.get()
+    finally:
+        executor.shutdown()
+
+    models = []
+    for task in tasks:
+        models.append(task.get_model())
+    return models
+
+
+class _ParseModelTask(Callable):
+    """
+    A task that parses a model file on a pool thread.
+    Any error is kept, and raised on the calling thread by get_model().
+    """
+
+    def __init__(self, model_file):
+        self._model_file = model_file
+        self._model = None
+        self._error = None
+
+    def call(self):
+        try:
+            self._model = model_translator.parse_model_file(self._model_file)
+        except:
+            self._error = sys.exc_info()
+        return None
+
+    def get_model(self):
+        """
+        Get the parsed model.
+        :return: the model dictionary
+        :raises TranslateException: if an error occurred parsing the model file
+        """
+        if self._error is not None:
+            raise self._error[0], self._error[1], self._error[2]
+        return self._model
+
+
 def merge_model_dictionaries(dictionary, new_dictionary, variable_map):
     """
     Merge the values from the new dictionary to the existing one.
@@ -329,19 +487,30 @@ def merge_model_dictionaries(dictionary, new_dictionary, variable_map):
     :param new_dictionary: the new dictionary to be merged
     :param variable_map: variables to be used for name resolution, or None
     """
+    # the index of match keys is built when the first new key without an exact match is found
+    merge_index = None
+
     for new_key in new_dictionary:
         new_value = new_dictionary[new_key]
-        dictionary_key, replace_key = _find_dictionary_merge_key(dictionary, new_key, variable_map)
+        if new_key in dictionary:
+            dictionary_key, replace_key = new_key, False
+        else:
+            if merge_index is None:
+                merge_index = _MergeKeyIndex(dictionary, variable_map)
+            dictionary_key, replace_key = merge_index.find(new_key)
 
         # the key is not in the original dictionary, just add it
         if dictionary_key is None:
             dictionary[new_key] = new_value
+            merge_index.add(new_key)
 
         # the new key should replace the existing one - delete the existing key and add the new one
         elif replace_key:
             del dictionary[dictionary_key]
+            merge_index.remove(dictionary_key)
             if not model_helper.is_delete_name(new_key):
                 dictionary[new_key] = new_value
+                merge_index.add(new_key)
 
         # the key is in both dictionaries - merge if the values are dictionaries, otherwise replace the value
         else:
@@ -350,33 +519,57 @@ def merge_model_dictionaries(dictionary, new_dictionary, variable_map):
                 merge_model_dictionaries(value, new_value, variable_map)
             else:
                 dictionary[new_key] = new_value
+                if new_key != dictionary_key:
+                    merge_index.add(new_key)
 
 
-def _find_dictionary_merge_key(dictionary, new_key, variable_map):
+class _MergeKeyIndex(object):
     """
-    Find the key corresponding to new_key in the specified dictionary.
-    Determine if the new_key should completely replace the value in the dictionary.
-    If no direct match is found, and a variable map is specified, perform check with variable substitution.
+    An index of the keys in a dictionary by their merge match keys, for keys that do not match exactly.
     If keys have the same name, but one has delete notation (!server), that is a match, and replace is true.
-    :param dictionary: the dictionary to be searched
-    :param new_key: the key being checked
-    :param variable_map: variables to be used for name resolution, or None
-    :return: tuple - the corresponding key from the dictionary, True if dictionary key should be replaced
+    The index is updated as keys are added and removed during the merge, so each match key is resolved once.
     """
-    if new_key in dictionary:
-        return new_key, False
 
-    new_is_delete = model_helper.is_delete_name(new_key)
-    match_new_key = _get_merge_match_key(new_key, variable_map)
-
-    for dictionary_key in dictionary.keys():
-        dictionary_is_delete = model_helper.is_delete_name(dictionary_key)
-        match_dictionary_key = _get_merge_match_key(dictionary_key, variable_map)
-        if match_dictionary_key == match_new_key:
-            replace_key = new_is_delete != dictionary_is_delete
-            return dictionary_key, replace_key
-
-    return None, False
+    def __init__(self, dictionary, variable_map):
+        self._variable_map = variable_map
+        # the dictionary keys for each match key, in dictionary order
+        self._keys = {}
+        for dictionary_key in dictionary.keys():
+            self.add(dictionary_key)
+
+    def find(self, new_key):
+        """
+        Find the key corresponding to new_key in the dictionary.
+        Determine if the new_key should completely replace the value in the dictionary.
+        :param new_key: the key being checked
+        :return: tuple - the corresponding key from the dictionary, True if dictionary key should be replaced
+        """
+        dictionary_keys = self._keys.get(_get_merge_match_key(new_key, self._variable_map))
+        if not dictionary_keys:
+            return None, False
+
+        dictionary_key = dictionary_keys[0]
+        replace_key = model_helper.is_delete_name(new_key) != model_helper.is_delete_name(dictionary_key)
+        return dictionary_key, replace_key
+
+    def add(self, dictionary_key):
+        """
+        Add a key that was added to the dictionary.
+        :param dictionary_key: the key that was added
+        """
+        match_key = _get_merge_match_key(dictionary_key, self._variable_map)
+        if match_key in self._keys:
+            self._keys[match_key].append(dictionary_key)
+        else:
+            self._keys[match_key] = [dictionary_key]
+
+    def remove(self, dictionary_key):
+        """
+        Remove a key that was removed from the dictionary.
+        :param dictionary_key: the key that was removed
+        """
+        match_key = _get_merge_match_key(dictionary_key, self._variable_map)
+        self._keys[match_key].remove(dictionary_key)
 
 
 def _get_merge_match_key(key, variable_map):
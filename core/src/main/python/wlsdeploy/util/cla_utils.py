@@ -57,6 +57,7 @@ class CommandLineArgUtil(object):
     ARCHIVE_FILE_SWITCH        = '-archive_file'
     SKIP_ARCHIVE_FILE_SWITCH    = '-skip_archive'
     MODEL_FILE_SWITCH          = '-model_file'
+    MODEL_CACHE_DIR_SWITCH     = '-model_cache_dir'
     DISCARD_CURRENT_EDIT_SWITCH   = '-discard_current_edit'
     OPSS_WALLET_SWITCH         = '-opss_wallet'
     OPSS_WALLET_PASSPHRASE     = '-opss_wallet_passphrase'
@@ -265,6 +266,10 @@ class CommandLineArgUtil(object):
                 value, idx = self._get_arg_value(args, idx)
                 full_path = self._validate_model_file_arg(value)
                 self._add_arg(key, full_path, True)
+            elif self.is_model_cache_dir_key(key):
+                value, idx = self._get_arg_value(args, idx)
+                full_path = self._validate_model_cache_dir_arg(value)
+                self._add_arg(key, full_path, True)
             elif self.is_validate_method_key(key):
                 value, idx = self._get_arg_value(args, idx)
                 context = self._validate_validate_method_arg(value)
@@ -1027,6 +1032,25 @@ class CommandLineArgUtil(object):
             raise ex
         return variables.getAbsolutePath()
 
+    def is_model_cache_dir_key(self, key):
+        return self.MODEL_CACHE_DIR_SWITCH == key
+
+    def _validate_model_cache_dir_arg(self, value):
+        method_name = '_validate_model_cache_dir_arg'
+
+        # the directory is created if it does not exist, so a pipeline can share a new directory
+        cache_dir = JFile(value)
+        if not cache_dir.exists():
+            cache_dir.mkdirs()
+        try:
+            cache_dir = JFileUtils.validateDirectoryName(value)
+        except JIllegalArgumentException, iae:
+            ex = create_cla_exception(ExitCode.ARG_VALIDATION_ERROR,
+                                      'WLSDPLY-01645', value, iae.getLocalizedMessage(), error=iae)
+            _logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        return cache_dir.getAbsolutePath()
+
     def is_boolean_switch(self, key):
         return key in self.BOOLEAN_SWITCHES
 
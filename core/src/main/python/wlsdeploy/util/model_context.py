@@ -92,6 +92,7 @@ class ModelContext(object):
         self._validate_configuration = None  # lazy load
         self._cancel_changes_if_restart_required = None
         self._output_dir = None
+        self._model_cache_dir = None
         self._target = None
         self._target_configuration = None  # lazy load
         self._variable_injector_file = None
@@ -268,6 +269,9 @@ class ModelContext(object):
         if CommandLineArgUtil.OUTPUT_DIR_SWITCH in arg_map:
             self._output_dir = arg_map[CommandLineArgUtil.OUTPUT_DIR_SWITCH]
 
+        if CommandLineArgUtil.MODEL_CACHE_DIR_SWITCH in arg_map:
+            self._model_cache_dir = arg_map[CommandLineArgUtil.MODEL_CACHE_DIR_SWITCH]
+
         if CommandLineArgUtil.VARIABLE_INJECTOR_FILE_SWITCH in arg_map:
             self._variable_injector_file = arg_map[CommandLineArgUtil.VARIABLE_INJECTOR_FILE_SWITCH]
 
@@ -361,6 +365,8 @@ class ModelContext(object):
             arg_map[CommandLineArgUtil.TARGET_MODE_SWITCH] = self._wlst_mode
         if self._output_dir is not None:
             arg_map[CommandLineArgUtil.OUTPUT_DIR_SWITCH] = self._output_dir
+        if self._model_cache_dir is not None:
+            arg_map[CommandLineArgUtil.MODEL_CACHE_DIR_SWITCH] = self._model_cache_dir
         if self._variable_injector_file is not None:
             arg_map[CommandLineArgUtil.VARIABLE_INJECTOR_FILE_SWITCH] = self._variable_injector_file
         if self._variable_keywords_file is not None:
@@ -666,6 +672,13 @@ class ModelContext(object):
         """
         return self._output_dir
 
+    def get_model_cache_dir(self):
+        """
+        Return the directory for merged models that are shared between tools.
+        :return: the model cache directory, or None if it was not specified
+        """
+        return self._model_cache_dir
+
     def get_target_configuration(self):
         """
         Return the target configuration object, based on the target name.
@@ -1,22 +1,38 @@
 """
-Copyright (c) 2017, 2021, Oracle and/or its affiliates.
+Copyright (c) 2017, 2023, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import java.io.File as JFile
+import java.util.concurrent.locks.ReentrantLock as JReentrantLock
 
 import oracle.weblogic.deploy.json.JsonException as JJsonException
 import oracle.weblogic.deploy.util.FileUtils as JFileUtils
+import oracle.weblogic.deploy.util.ModelFileContent as JModelFileContent
 import oracle.weblogic.deploy.yaml.YamlException as JYamlException
 
 from wlsdeploy.logging import platform_logger
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.util import model_config
 
+_logger = platform_logger.PlatformLogger('wlsdeploy.translator')
+_module_name = 'model_translator'
+
+# parsed models that were kept by load_model_file(), keyed by absolute path.
+# each value is a tuple of the file's last modified time, its size, and the parsed model.
+_kept_models = {}
+
+# the number of model files parsed by parse_model_file() and load_model_file(), and the number of parses avoided
+_parse_counts = {'parsed': 0, 'reused': 0}
+
+# guards the kept models and the counts, model files may be parsed on multiple threads
+_kept_models_lock = JReentrantLock()
+
 
 class FileToPython(object):
     """
     Interface to parse the file contents into a python dictionary. The interface will determine the syntax of the
     contents of the file for the provided file name, and call the appropriate translator for that syntax.
+    The file is loaded once, and an oversize YAML file is rejected before it is parsed.
     """
     _class_name = 'FileToPython'
 
@@ -37,47 +53,57 @@ class FileToPython(object):
         self.logger.entering(class_name=self._class_name, method_name=_method_name)
         # throws IllegalArgument if not a valid existing file
         model_file = JFileUtils.validateFileName(self.file_name)
-        # yaml is the default. For now, if the file extension is not known, then parse the contents as yaml
-        if JFileUtils.isJsonFile(model_file):
-            result_dict = self._parse_json()
+        # throws TranslateException if the file cannot be read, or is too large
+        content = JModelFileContent.load(model_file, self.model_config.get_yaml_file_max_code_points())
+        # the syntax is determined by the contents, yaml is the default
+        if content.isJson():
+            result_dict = self._parse_json(content)
         else:
-            result_dict = self._parse_yaml()
+            result_dict = self._parse_yaml(content)
 
         # called method already logged result. don't log it again
         self.logger.exiting(class_name=self._class_name, method_name=_method_name)
         return result_dict
 
-    def _parse_json(self):
+    def _parse_json(self, content=None):
         """
         Parse the JSON file and convert it into a Python dictionary.
+        :param content: the loaded ModelFileContent, or None to read the file
         :return: the Python dictionary
         """
         _method_name = '_parse_json'
 
         from wlsdeploy.json.json_translator import JsonToPython as JJsonToPython
+        from wlsdeploy.json.json_translator import JsonStreamToPython as JJsonStreamToPython
         self.logger.finer('WLSDPLY-03078', 'JSON', self.file_name,
                           class_name=self._class_name, method_name=_method_name)
         try:
-            return JJsonToPython(self.file_name, self.use_ordering).parse()
+            if content is None:
+                return JJsonToPython(self.file_name, self.use_ordering).parse()
+            return JJsonStreamToPython(self.file_name, content.getInputStream(), self.use_ordering).parse()
         except JJsonException, je:
             translate_ex = exception_helper.create_translate_exception('WLSDPLY-01710', self.file_name,
                                                                        je.getLocalizedMessage(), error=je)
             self.logger.throwing(translate_ex, class_name=self._class_name, method_name=_method_name)
             raise translate_ex
 
-    def _parse_yaml(self):
+    def _parse_yaml(self, content=None):
         """
         Parse the Yaml file and convert it into a Python dictionary.
+        :param content: the loaded ModelFileContent, or None to read the file
         :return: the Python dictionary
         """
         _method_name = '_parse_yaml'
 
         from wlsdeploy.yaml.yaml_translator import YamlToPython
+        from wlsdeploy.yaml.yaml_translator import YamlStreamToPython
         self.logger.finer('WLSDPLY-01711', 'YAML', self.file_name,
                           class_name=self._class_name, method_name=_method_name)
         try:
             max_size = self.model_config.get_yaml_file_max_code_points()
-            return YamlToPython(self.file_name, self.use_ordering, max_size).parse()
+            if content is None:
+                return YamlToPython(self.file_name, self.use_ordering, max_size).parse()
+            return YamlStreamToPython(self.file_name, content.getInputStream(), self.use_ordering, max_size).parse()
         except JYamlException, ye:
             translate_ex = exception_helper.create_translate_exception('WLSDPLY-01710', self.file_name,
                                                                        ye.getLocalizedMessage(), error=ye)
@@ -152,3 +178,94 @@ class PythonToFile(object):
                                                                        ye.getLocalizedMessage(), error=ye)
             self.logger.throwing(translate_ex, class_name=self._class_name, method_name=_method_name)
             raise translate_ex
+
+
+def load_model_file(file_name):
+    """
+    Parse the model file with ordering, and keep the result so that the next call to parse_model_file()
+    for the same unchanged file uses it instead of parsing the file again.
+    This allows a tool to check the syntax of a model file before it is merged, without parsing it twice.
+    :param file_name: the model file name
+    :raises TranslateException: if an error occurs
+    """
+    key, last_modified, size = _get_file_key(file_name)
+    model = FileToPython(file_name, True).parse()
+    _kept_models_lock.lock()
+    try:
+        _parse_counts['parsed'] += 1
+        _kept_models[key] = (last_modified, size, model)
+    finally:
+        _kept_models_lock.unlock()
+
+
+def parse_model_file(file_name):
+    """
+    Return the parsed model for the model file, with ordering.
+    If the model was kept by load_model_file(), and the file has not been modified since, that model is returned
+    and is no longer kept. Otherwise, the file is parsed. The caller may modify the returned model.
+    :param file_name: the model file name
+    :return: the model dictionary
+    :raises TranslateException: if an error occurs
+    """
+    _method_name = 'parse_model_file'
+
+    key, last_modified, size = _get_file_key(file_name)
+    kept_model = None
+    _kept_models_lock.lock()
+    try:
+        if key in _kept_models:
+            kept_modified, kept_size, model = _kept_models[key]
+            del _kept_models[key]
+            if kept_modified == last_modified and kept_size == size:
+                _parse_counts['reused'] += 1
+                kept_model = model
+    finally:
+        _kept_models_lock.unlock()
+
+    if kept_model is not None:
+        _logger.finer('WLSDPLY-01718', file_name, class_name=_module_name, method_name=_method_name)
+        return kept_model
+
+    model = FileToPython(file_name, True).parse()
+    _kept_models_lock.lock()
+    try:
+        _parse_counts['parsed'] += 1
+    finally:
+        _kept_models_lock.unlock()
+    return model
+
+
+def log_model_file_statistics():
+    """
+    Log the number of model files that were parsed, and the number of parses that were avoided.
+    """
+    _method_name = 'log_model_file_statistics'
+
+    _kept_models_lock.lock()
+    try:
+        _logger.info('WLSDPLY-01719', _parse_counts['parsed'], _parse_counts['reused'],
+                     class_name=_module_name, method_name=_method_name)
+    finally:
+        _kept_models_lock.unlock()
+
+
+def release_kept_models():
+    """
+    Release any models that were kept by load_model_file() but not used.
+    Tools that call load_model_file() should call this when they finish, whether or not they succeed.
+    """
+    _kept_models_lock.lock()
+    try:
+        _kept_models.clear()
+    finally:
+        _kept_models_lock.unlock()
+
+
+def _get_file_key(file_name):
+    """
+    Get the key and the current state of the model file.
+    :param file_name: the model file name
+    :return: the absolute path of the file, its last modified time, and its size
+    """
+    model_file = JFile(file_name)
+    return model_file.getAbsolutePath(), model_file.lastModified(), model_file.length()
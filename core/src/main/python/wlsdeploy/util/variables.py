@@ -27,24 +27,40 @@ from wlsdeploy.util.cla_utils import CommandLineArgUtil
 
 _class_name = "variables"
 _logger = platform_logger.PlatformLogger('wlsdeploy.variables')
-_file_variable_pattern = re.compile("(@@FILE:([\w.\\\/:-]+)@@)")
 _property_pattern = re.compile("(@@PROP:([\\w.-]+)@@)")
 _environment_pattern = re.compile("(@@ENV:([\\w.-]+)@@)")
-_secret_pattern = re.compile("(@@SECRET:([\\w.-]+):([\\w.-]+)@@)")
-_file_nested_variable_pattern = re.compile("(@@FILE:(@@[\w]+@@[\w.\\\/:-]+)@@)")
+
+# the start of a token that is resolved by substitution, and the remainder of each type of token.
+# the path of a file token may start with a model context token, such as @@ORACLE_HOME@@,
+# and may contain property, environment and secret tokens.
+_token_start_pattern = re.compile("@@(PROP|ENV|SECRET|FILE):")
+_token_name_patterns = {
+    'PROP': re.compile("([\\w.-]+)@@"),
+    'ENV': re.compile("([\\w.-]+)@@"),
+    'SECRET': re.compile("([\\w.-]+):([\\w.-]+)@@")
+}
+_file_path_pattern = re.compile("[\\w.\\\\/:-]+")
+_file_path_token_pattern = re.compile("@@[\\w]+@@")
+
+# the order that token types are resolved, a value may contain tokens of later types
+_token_order = {'PROP': 0, 'ENV': 1, 'SECRET': 2, 'FILE': 3}
 
 # these match a string containing ONLY a token
 _property_string_pattern = re.compile("^(@@PROP:([\\w.-]+)@@)$")
 _secret_string_pattern = re.compile("^(@@SECRET:([\\w.-]+):([\\w.-]+)@@)$")
 
-# if this pattern is found, token substitution was incomplete
-_unresolved_token_pattern = re.compile("(@@(PROP|FILE|ENV|SECRET):)")
-
 _secret_dirs_variable = "WDT_MODEL_SECRETS_DIRS"
 _secret_dir_pairs_variable = "WDT_MODEL_SECRETS_NAME_DIR_PAIRS"
 
 _secret_token_map = None
 
+# values read for @@FILE and @@SECRET tokens, keyed by canonical path.
+# each value is a tuple of the file's last modified time, its size, and the value.
+_file_token_values = {}
+
+# the number of files read for @@FILE and @@SECRET tokens, and the number of reads avoided
+_file_token_counts = {'read': 0, 'reused': 0}
+
 
 def load_variables(file_path, allow_multiple_files=False):
     """
@@ -198,7 +214,15 @@ def substitute(dictionary, variables, model_context):
     """
     method_name = '_substitute'
     error_info = {'errorCount': 0}
+    file_reads = _file_token_counts['read']
+    file_reuses = _file_token_counts['reused']
     _process_node(dictionary, variables, model_context, error_info)
+
+    file_reads = _file_token_counts['read'] - file_reads
+    file_reuses = _file_token_counts['reused'] - file_reuses
+    if file_reads or file_reuses:
+        _logger.info('WLSDPLY-01741', file_reads, file_reuses, class_name=_class_name, method_name=method_name)
+
     error_count = error_info['errorCount']
     if error_count:
         ex = exception_helper.create_variable_exception("WLSDPLY-01740", error_count)
@@ -216,6 +240,9 @@ def _process_node(nodes, variables, model_context, error_info):
     """
     # iterate over copy to avoid concurrent change for add/delete
     if isinstance(nodes, OrderedDict):
+        # the parser found no tokens in this dictionary, and it hasn't changed since
+        if nodes.isTokenFree():
+            return
         nodes_iterator = OrderedDict(nodes)
     else:
         nodes_iterator = dict(nodes)
@@ -251,95 +278,16 @@ def _substitute(text, variables, model_context, error_info, attribute_name=None)
     :return: the replaced text
     """
     method_name = '_substitute'
-    validation_config = model_context.get_validate_configuration()
-    problem_found = False
 
     # skip lookups for text with no @@
     if '@@' in text:
-
-        # do properties first, to cover the case @@FILE:/dir/@@PROP:name@@.txt@@
-        matches = _property_pattern.findall(text)
-        for token, key in matches:
-            # log, or throw an exception if key is not found.
-            if key not in variables:
-                allow_unresolved = validation_config.allow_unresolved_variable_tokens()
-                if model_context.get_variable_file() is not None:
-                    _report_token_issue('WLSDPLY-01732', method_name, allow_unresolved, key)
-                else:
-                    _report_token_issue('WLSDPLY-01734', method_name, allow_unresolved, key)
-
-                _increment_error_count(error_info, allow_unresolved)
-                problem_found = True
-                continue
-
-            value = variables[key]
-            text = text.replace(token, value)
-
-        # check environment variables before @@FILE:/dir/@@ENV:name@@.txt@@
-        matches = _environment_pattern.findall(text)
-        for token, key in matches:
-            #
-            # On Windows, environment variables are not case sensitive.  On Windows 11 anyway,
-            # setting an environment variable using a name with lower-case letters will always
-            # result in an environment variable name in all upper-case.
-            #
-            env_var_name = str_helper.to_string(key)
-            is_windows = System.getProperty('os.name').startswith('Windows')
-            if is_windows and not env_helper.has_env(env_var_name) and env_var_name.has_env(env_var_name.upper()):
-                env_var_name = env_var_name.upper()
-
-            if not env_helper.has_env(env_var_name):
-                allow_unresolved = validation_config.allow_unresolved_environment_tokens()
-                _report_token_issue('WLSDPLY-01737', method_name, allow_unresolved, key)
-                _increment_error_count(error_info, allow_unresolved)
-                problem_found = True
-                continue
-            value = env_helper.getenv(env_var_name)
-            text = text.replace(token, value)
-
-        # check secret variables before @@FILE:/dir/@@SECRET:name:key@@.txt@@
-        matches = _secret_pattern.findall(text)
-        for token, name, key in matches:
-            value = _resolve_secret_token(name, key, model_context)
-            if value is None:
-                # does not match, only report for non target case
-                allow_unresolved = validation_config.allow_unresolved_environment_tokens()
-                secret_token = name + ':' + key
-                known_tokens = _list_known_secret_tokens()
-                _report_token_issue('WLSDPLY-01739', method_name, allow_unresolved, secret_token, known_tokens)
-                _increment_error_count(error_info, allow_unresolved)
-                problem_found = True
-                continue
-            text = text.replace(token, value)
-
-        matches = _file_variable_pattern.findall(text)
-        for token, path in matches:
-            allow_unresolved = validation_config.allow_unresolved_file_tokens()
-            value = _read_value_from_file(path, allow_unresolved)
-            if value is None:
-                _increment_error_count(error_info, allow_unresolved)
-                problem_found = True
-                continue
-            text = text.replace(token, value)
-
-        # special case for @@FILE:@@ORACLE_HOME@@/dir/name.txt@@
-        matches = _file_nested_variable_pattern.findall(text)
-        for token, path in matches:
-            path = model_context.replace_token_string(path)
-            allow_unresolved = validation_config.allow_unresolved_file_tokens()
-            value = _read_value_from_file(path, allow_unresolved)
-            if value is None:
-                _increment_error_count(error_info, allow_unresolved)
-                problem_found = True
-                continue
-            text = text.replace(token, value)
+        scan_info = {'problemFound': False, 'unresolvedType': None}
+        text = _substitute_tokens(text, _token_order['PROP'], variables, model_context, error_info, scan_info)
 
         # if any @@TOKEN: remains in the value, log an error.
         # if previous problems were found, don't perform this check.
-        matches = _unresolved_token_pattern.findall(text)
-        if matches and not problem_found:
-            match = matches[0]
-            token = match[1]
+        token = scan_info['unresolvedType']
+        if token is not None and not scan_info['problemFound']:
             sample = "@@" + token + ":<name>"
             if token == "SECRET":
                 sample += ":<key>"
@@ -356,6 +304,247 @@ def _substitute(text, variables, model_context, error_info, attribute_name=None)
     return text
 
 
+def _substitute_tokens(text, first_order, variables, model_context, error_info, scan_info):
+    """
+    Scan the text once, and build the result from the text between tokens and the token values.
+    Tokens are resolved in the order properties, environment variables, secrets, then files, so a
+    property value may contain the later token types, such as @@FILE:/dir/@@PROP:name@@.txt@@.
+    A token that is before the first order is left in place, and reported as unresolved.
+    :param text: the text to process for token placeholders
+    :param first_order: the order of the first token type to be resolved
+    :param variables: the variables to use
+    :param model_context: used to determine the validation method (strict, lax, etc.)
+    :param error_info: collects information about errors encountered
+    :param scan_info: collects problems, and the type of the first unresolved token
+    :return: the replaced text, or the original text if no tokens were replaced
+    """
+    parts = []
+    text_start = 0
+    match = _token_start_pattern.search(text)
+    while match is not None:
+        if _token_order[match.group(1)] < first_order:
+            _set_unresolved_type(match.group(1), scan_info)
+            value = None
+            token_end = match.end()
+        else:
+            value, token_end = _resolve_token(text, match, first_order, variables, model_context, error_info,
+                                              scan_info)
+
+        if value is not None:
+            parts.append(text[text_start:match.start()])
+            parts.append(value)
+            text_start = token_end
+        match = _token_start_pattern.search(text, token_end)
+
+    if not parts:
+        return text
+    parts.append(text[text_start:])
+    return ''.join(parts)
+
+
+def _resolve_token(text, match, first_order, variables, model_context, error_info, scan_info):
+    """
+    Resolve the token that starts with the match in the text.
+    :param text: the text that contains the token
+    :param match: the match for the start of the token, such as @@PROP:
+    :param first_order: the order of the first token type to be resolved
+    :param variables: the variables to use
+    :param model_context: used to determine the validation method (strict, lax, etc.)
+    :param error_info: collects information about errors encountered
+    :param scan_info: collects problems, and the type of the first unresolved token
+    :return: the value, or None if the token was not resolved, and the position after the token
+    """
+    token_type = match.group(1)
+    if token_type == 'FILE':
+        value, token_end = _resolve_file_token(text, match.end(), first_order, variables, model_context, error_info,
+                                               scan_info)
+    else:
+        name_match = _token_name_patterns[token_type].match(text, match.end())
+        if name_match is None:
+            _set_unresolved_type(token_type, scan_info)
+            return None, match.end()
+
+        token_end = name_match.end()
+        if token_type == 'PROP':
+            value = _resolve_property_token(name_match.group(1), variables, model_context)
+        elif token_type == 'ENV':
+            value = _resolve_environment_token(name_match.group(1), model_context)
+        else:
+            value = _resolve_secret_value(name_match.group(1), name_match.group(2), model_context)
+
+        if value is None:
+            _increment_error_count(error_info, _allow_unresolved(token_type, model_context))
+            scan_info['problemFound'] = True
+
+    # a value may contain tokens of the types that are resolved after this one
+    if value is not None and '@@' in value:
+        value = _substitute_tokens(value, _token_order[token_type] + 1, variables, model_context, error_info,
+                                   scan_info)
+    return value, token_end
+
+
+def _resolve_file_token(text, path_start, first_order, variables, model_context, error_info, scan_info):
+    """
+    Resolve the @@FILE: token with the path that starts at the specified position.
+    The path may start with a model context token, such as @@ORACLE_HOME@@, and may contain
+    property, environment and secret tokens, such as @@FILE:/dir/@@PROP:name@@.txt@@.
+    If the path is incomplete, the tokens in the path are resolved, and the @@FILE: token is reported as unresolved.
+    :param text: the text that contains the token
+    :param path_start: the position of the path, after @@FILE:
+    :param first_order: the order of the first token type to be resolved
+    :param variables: the variables to use
+    :param model_context: used to resolve variables in file paths
+    :param error_info: collects information about errors encountered
+    :param scan_info: collects problems, and the type of the first unresolved token
+    :return: the value, or None if the token was not resolved, and the position after the token
+    """
+    path_parts = []
+    position = path_start
+    resolved = True
+
+    # special case for @@FILE:@@ORACLE_HOME@@/dir/name.txt@@
+    path_match = _file_path_token_pattern.match(text, position)
+    has_path_token = path_match is not None
+    if has_path_token:
+        path_parts.append(path_match.group(0))
+        position = path_match.end()
+
+    while True:
+        path_match = _file_path_pattern.match(text, position)
+        if path_match is not None:
+            path_parts.append(path_match.group(0))
+            position = path_match.end()
+            continue
+
+        token_match = _token_start_pattern.match(text, position)
+        if token_match is not None and first_order <= _token_order[token_match.group(1)] < _token_order['FILE']:
+            value, token_end = _resolve_token(text, token_match, first_order, variables, model_context, error_info,
+                                              scan_info)
+            if value is None:
+                # leave the unresolved token in the path, and don't read the file
+                resolved = False
+                value = text[position:token_end]
+            path_parts.append(value)
+            position = token_end
+            continue
+        break
+
+    path = ''.join(path_parts)
+    token_end = position
+    if path_parts and text.startswith('@@', position):
+        token_end = position + 2
+    else:
+        _set_unresolved_type('FILE', scan_info)
+        resolved = False
+
+    if not resolved:
+        # keep any tokens in the path that were resolved, the original text is kept if there were none
+        value = '@@FILE:' + path + text[position:token_end]
+        if value == text[path_start - len('@@FILE:'):token_end]:
+            value = None
+        return value, token_end
+
+    if has_path_token:
+        path = model_context.replace_token_string(path)
+
+    value = _read_value_from_file(path, _allow_unresolved('FILE', model_context))
+    if value is None:
+        _increment_error_count(error_info, _allow_unresolved('FILE', model_context))
+        scan_info['problemFound'] = True
+    return value, token_end
+
+
+def _resolve_property_token(key, variables, model_context):
+    """
+    Get the value of the variable for a @@PROP: token, and log if it is not found.
+    :param key: the variable name
+    :param variables: the variables to use
+    :param model_context: used to determine the validation method (strict, lax, etc.)
+    :return: the value, or None if the variable was not found
+    """
+    method_name = '_substitute'
+
+    if key not in variables:
+        allow_unresolved = _allow_unresolved('PROP', model_context)
+        if model_context.get_variable_file() is not None:
+            _report_token_issue('WLSDPLY-01732', method_name, allow_unresolved, key)
+        else:
+            _report_token_issue('WLSDPLY-01734', method_name, allow_unresolved, key)
+        return None
+    return variables[key]
+
+
+def _resolve_environment_token(key, model_context):
+    """
+    Get the value of the environment variable for an @@ENV: token, and log if it is not found.
+    :param key: the environment variable name
+    :param model_context: used to determine the validation method (strict, lax, etc.)
+    :return: the value, or None if the environment variable was not found
+    """
+    method_name = '_substitute'
+
+    #
+    # On Windows, environment variables are not case sensitive.  On Windows 11 anyway,
+    # setting an environment variable using a name with lower-case letters will always
+    # result in an environment variable name in all upper-case.
+    #
+    env_var_name = str_helper.to_string(key)
+    is_windows = System.getProperty('os.name').startswith('Windows')
+    if is_windows and not env_helper.has_env(env_var_name) and env_helper.has_env(env_var_name.upper()):
+        env_var_name = env_var_name.upper()
+
+    if not env_helper.has_env(env_var_name):
+        _report_token_issue('WLSDPLY-01737', method_name, _allow_unresolved('ENV', model_context), key)
+        return None
+    return env_helper.getenv(env_var_name)
+
+
+def _resolve_secret_value(name, key, model_context):
+    """
+    Get the value for a @@SECRET: token, and log if it is not found.
+    :param name: the name of the secret
+    :param key: the key of the secret
+    :param model_context: used to determine the validation method (strict, lax, etc.)
+    :return: the value, or None if the secret was not found
+    """
+    method_name = '_substitute'
+
+    value = _resolve_secret_token(name, key, model_context)
+    if value is None:
+        # does not match, only report for non target case
+        secret_token = name + ':' + key
+        known_tokens = _list_known_secret_tokens()
+        _report_token_issue('WLSDPLY-01739', method_name, _allow_unresolved('SECRET', model_context), secret_token,
+                            known_tokens)
+    return value
+
+
+def _allow_unresolved(token_type, model_context):
+    """
+    Determine if an unresolved token of the specified type is allowed by the validation method.
+    :param token_type: the token type, such as PROP
+    :param model_context: used to determine the validation method (strict, lax, etc.)
+    :return: True if the unresolved token is allowed
+    """
+    validation_config = model_context.get_validate_configuration()
+    if token_type == 'PROP':
+        return validation_config.allow_unresolved_variable_tokens()
+    if token_type == 'FILE':
+        return validation_config.allow_unresolved_file_tokens()
+    # secrets use the same setting as environment variables
+    return validation_config.allow_unresolved_environment_tokens()
+
+
+def _set_unresolved_type(token_type, scan_info):
+    """
+    Keep the type of the first token that was not resolved, for the syntax error message.
+    :param token_type: the token type, such as PROP
+    :param scan_info: collects problems, and the type of the first unresolved token
+    """
+    if scan_info['unresolvedType'] is None:
+        scan_info['unresolvedType'] = token_type
+
+
 def _increment_error_count(error_info, allow_unresolved):
     if not allow_unresolved:
         error_info['errorCount'] = error_info['errorCount'] + 1
@@ -364,6 +553,7 @@ def _increment_error_count(error_info, allow_unresolved):
 def _read_value_from_file(file_path, allow_unresolved):
     """
     Read a single text value from the first line in the specified file.
+    The value is kept for the canonical path of the file, and is used again until the file is modified.
     :param file_path: the file from which to read the value
     :param allow_unresolved: if True, log INFO instead of SEVERE for lookup failures
     :return: the text value
@@ -372,9 +562,22 @@ def _read_value_from_file(file_path, allow_unresolved):
     method_name = '_read_value_from_file'
 
     try:
-        file_reader = BufferedReader(FileReader(file_path))
-        line = file_reader.readLine()
-        file_reader.close()
+        value_file = File(file_path)
+        canonical_path = value_file.getCanonicalPath()
+        last_modified = value_file.lastModified()
+        size = value_file.length()
+        if canonical_path in _file_token_values:
+            kept_modified, kept_size, value = _file_token_values[canonical_path]
+            if kept_modified == last_modified and kept_size == size:
+                _file_token_counts['reused'] += 1
+                _logger.finer('WLSDPLY-01742', file_path, class_name=_class_name, method_name=method_name)
+                return value
+
+        file_reader = BufferedReader(FileReader(value_file))
+        try:
+            line = file_reader.readLine()
+        finally:
+            file_reader.close()
     except IOException, e:
         _report_token_issue('WLSDPLY-01733', method_name, allow_unresolved, file_path, e.getLocalizedMessage())
         return None
@@ -382,13 +585,17 @@ def _read_value_from_file(file_path, allow_unresolved):
     if line is None:
         line = ''
 
-    return str_helper.to_string(line).strip()
+    value = str_helper.to_string(line).strip()
+    _file_token_counts['read'] += 1
+    _file_token_values[canonical_path] = (last_modified, size, value)
+    return value
 
 
 def _resolve_secret_token(name, key, model_context):
     """
     Return the value associated with the specified secret name and key.
-    If the name and key are found in the directory map, return the associated value.
+    If the name and key are found in the directory map, read the value from the associated file.
+    The value is kept, so the file is read once for all tokens that use it.
     :param name: the name of the secret (a directory name or mapped name)
     :param key: the name of the file containing the secret
     :param model_context: used to determine the validation method (strict, lax, etc.)
@@ -400,14 +607,20 @@ def _resolve_secret_token(name, key, model_context):
         _init_secret_token_map(model_context)
 
     secret_token = name + ':' + key
-    return dictionary_utils.get_element(_secret_token_map, secret_token)
+    file_path = dictionary_utils.get_element(_secret_token_map, secret_token)
+    if file_path is None:
+        return None
+
+    allow_unresolved = model_context.get_validate_configuration().allow_unresolved_secret_tokens()
+    return _read_value_from_file(file_path, allow_unresolved)
 
 
 def _init_secret_token_map(model_context):
     """
-    Initialize a global map of name/value tokens to secret values.
+    Initialize a global map of name/value tokens to secret files.
     The map includes secrets found below the directories specified in WDT_MODEL_SECRETS_DIRS,
     and in WDT_MODEL_SECRETS_NAME_DIR_PAIRS assignments.
+    Only the directories are listed, each secret file is read when a token uses it.
     :param model_context: used to determine the validation method (strict, lax, etc.)
     """
     method_name = '_init_secret_token_map'
@@ -433,7 +646,7 @@ def _init_secret_token_map(model_context):
             for subdir_name in os.listdir(secret_dir):
                 subdir_path = os.path.join(secret_dir, subdir_name)
                 if os.path.isdir(subdir_path):
-                    _add_file_secrets_to_map(subdir_path, subdir_name, model_context)
+                    _add_file_secrets_to_map(subdir_path, subdir_name)
 
     # add name/key pairs for files in directories assigned in WDT_MODEL_SECRETS_NAME_DIR_PAIRS.
     # these pairs will override if they were previously added as sub-directory pairs.
@@ -455,7 +668,7 @@ def _init_secret_token_map(model_context):
                 continue
 
             name = result[0]
-            _add_file_secrets_to_map(secret_dir, name, model_context)
+            _add_file_secrets_to_map(secret_dir, name)
 
 
 def _clear_secret_token_map():
@@ -466,12 +679,18 @@ def _clear_secret_token_map():
     _secret_token_map = None
 
 
-def _add_file_secrets_to_map(dir, name, model_context):
+def _clear_file_token_values():
     """
-    Add the secret from each file in the specified directory to the map.
+    Used by unit tests to force files to be read again.
+    """
+    _file_token_values.clear()
+
+
+def _add_file_secrets_to_map(dir, name):
+    """
+    Add the path of each file in the specified directory to the map.
     :param dir: the directory to be examined
     :param name: the name to be used in the map token
-    :param model_context: used to determine the validation method (strict, lax, etc.)
     """
     global _secret_token_map
 
@@ -479,8 +698,7 @@ def _add_file_secrets_to_map(dir, name, model_context):
         file_path = os.path.join(dir, file_name)
         if os.path.isfile(file_path):
             token = name + ":" + file_name
-            allow_unresolved = model_context.get_validate_configuration().allow_unresolved_secret_tokens()
-            _secret_token_map[token] = _read_value_from_file(file_path, allow_unresolved)
+            _secret_token_map[token] = file_path
 
 
 def _list_known_secret_tokens():
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2019, 2022, Oracle and/or its affiliates.
+Copyright (c) 2019, 2023, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 Module to handle translating between Yaml files and Python dictionaries.
@@ -13,13 +13,12 @@ import java.lang.IllegalArgumentException as JIllegalArgumentException
 import java.lang.Integer as JInteger
 import java.lang.Long as JLong
 import java.lang.String as JString
-import java.util.ArrayList as JArrayList
 from java.io import OutputStreamWriter
 
 import oracle.weblogic.deploy.util.FileUtils as JFileUtils
+import oracle.weblogic.deploy.yaml.YamlEventWriter as JYamlEventWriter
 import oracle.weblogic.deploy.yaml.YamlStreamTranslator as JYamlStreamTranslator
 import oracle.weblogic.deploy.yaml.YamlTranslator as JYamlTranslator
-from oracle.weblogic.deploy.util import OrderedMap
 from oracle.weblogic.deploy.util import PyRealBoolean
 from oracle.weblogic.deploy.util import PyOrderedDict
 
@@ -119,88 +118,6 @@ class YamlStreamToPython(object):
         return result_dict
 
 
-class PythonToJava(object):
-    """
-    A class that converts a Python dictionary or document list and its contents
-    to the Java types expected by snakeyaml.
-    """
-    _class_name = 'PythonToJava'
-
-    def __init__(self, collection):
-        self._collection = collection
-        self._logger = PlatformLogger('wlsdeploy.yaml')
-
-    def convert_to_java(self):
-        _method_name = 'convert_to_java'
-
-        if self._collection is None:
-            return None
-        if isinstance(self._collection, dict):
-            return self.convert_dict_to_java_map(self._collection)
-        if isinstance(self._collection, list):
-            return self.convert_list_to_java_list(self._collection)
-        else:
-            yaml_ex = exception_helper.create_yaml_exception('WLSDPLY-18200')
-            self._logger.throwing(class_name=self._class_name, method_name=_method_name, error=yaml_ex)
-            raise yaml_ex
-
-    def convert_dict_to_java_map(self, dictionary):
-        result = OrderedMap()
-        if isinstance(dictionary, PyOrderedDict):
-            result.setCommentMap(dictionary.getCommentMap())
-
-        for key, value in dictionary.iteritems():
-            java_key = JString(key)
-            if isinstance(value, dict):
-                java_value = self.convert_dict_to_java_map(value)
-                result.put(java_key, java_value)
-            elif isinstance(value, list):
-                java_value = self.convert_list_to_java_list(value)
-                result.put(java_key, java_value)
-            else:
-                java_value = self.convert_scalar_to_java_type(value)
-                result.put(java_key, java_value)
-        return result
-
-    def convert_list_to_java_list(self, py_list):
-        result = JArrayList()
-        for value in py_list:
-            if isinstance(value, dict):
-                java_value = self.convert_dict_to_java_map(value)
-                result.add(java_value)
-            elif isinstance(value, list):
-                java_value = self.convert_list_to_java_list(value)
-                result.add(java_value)
-            else:
-                java_value = self.convert_scalar_to_java_type(value)
-                result.add(java_value)
-        return result
-
-    def convert_scalar_to_java_type(self, py_value):
-        _method_name = 'convert_scalar_to_java_type'
-
-        result = None
-        if py_value is None:
-            result = None
-        elif type(py_value) is bool:
-            result = JBoolean(py_value is True)
-        elif type(py_value) in [str, unicode]:
-            result = JString(py_value)
-        elif type(py_value) is int:
-            result = JInteger(py_value)
-        elif type(py_value) is long:
-            result = JLong(JString(str_helper.to_string(py_value)))
-        elif type(py_value) is float:
-            result = JDouble(py_value)
-        elif isinstance(py_value, PyRealBoolean):
-            result = JBoolean(py_value.getValue())
-        else:
-            yaml_ex = exception_helper.create_yaml_exception('WLSDPLY-18201', type(py_value))
-            self._logger.throwing(class_name=self._class_name, method_name=_method_name, error=yaml_ex)
-            raise yaml_ex
-        return result
-
-
 class PythonToYaml(object):
     """
     A class that converts a Python dictionary or document list into Yaml and writes the output to a file.
@@ -255,21 +172,89 @@ class PythonToYaml(object):
     def _write_collection_to_yaml_file(self, collection, writer, file_name='<None>'):
         """
         Do the actual heavy lifting of converting a dictionary or document list and writing it to the file.
+        The collection is written as it is walked, without converting it to Java collections first.
         :param collection: the Python dictionary or document list to convert
         :param writer: the java.io.Writer for the output file
         :param file_name: the file_name for the output file
         :raises: YamlException: if an error occurs while writing the output
         """
+        _method_name = '_write_collection_to_yaml_file'
+
         if collection is None:
             return
 
-        java_object = PythonToJava(collection).convert_to_java()
-        yaml_stream_translator = JYamlStreamTranslator(file_name, writer)
+        if isinstance(collection, dict):
+            documents = [collection]
+        elif isinstance(collection, list):
+            documents = collection
+        else:
+            yaml_ex = exception_helper.create_yaml_exception('WLSDPLY-18200')
+            self._logger.throwing(class_name=self._class_name, method_name=_method_name, error=yaml_ex)
+            raise yaml_ex
+
+        yaml_writer = JYamlEventWriter(file_name, writer)
+        try:
+            for document in documents:
+                yaml_writer.startDocument()
+                self._write_value(document, yaml_writer)
+                yaml_writer.endDocument()
+        finally:
+            yaml_writer.close()
+
+    def _write_value(self, value, yaml_writer):
+        """
+        Write the value and its contents using the YAML event writer.
+        :param value: the Python dictionary, list or scalar value
+        :param yaml_writer: the YamlEventWriter for the output
+        :raises: YamlException: if an error occurs while writing the output
+        """
+        if isinstance(value, dict):
+            comment_map = None
+            if isinstance(value, PyOrderedDict):
+                comment_map = value.getCommentMap()
+
+            yaml_writer.startMapping()
+            for key, item in value.iteritems():
+                yaml_writer.writeKey(key, comment_map)
+                self._write_value(item, yaml_writer)
+            yaml_writer.endMapping()
+        elif isinstance(value, list):
+            yaml_writer.startSequence()
+            for item in value:
+                self._write_value(item, yaml_writer)
+            yaml_writer.endSequence()
+        else:
+            yaml_writer.writeScalar(self._convert_scalar_to_java_type(value))
 
-        if isinstance(collection, list):
-            yaml_stream_translator.dumpDocuments(java_object)
+    def _convert_scalar_to_java_type(self, py_value):
+        """
+        Convert the Python scalar value to the Java type expected by the YAML event writer.
+        :param py_value: the Python scalar value
+        :return: the Java value
+        :raises: YamlException: if the value is not a supported scalar type
+        """
+        _method_name = '_convert_scalar_to_java_type'
+
+        result = None
+        if py_value is None:
+            result = None
+        elif type(py_value) is bool:
+            result = JBoolean(py_value is True)
+        elif type(py_value) in [str, unicode]:
+            result = JString(py_value)
+        elif type(py_value) is int:
+            result = JInteger(py_value)
+        elif type(py_value) is long:
+            result = JLong(JString(str_helper.to_string(py_value)))
+        elif type(py_value) is float:
+            result = JDouble(py_value)
+        elif isinstance(py_value, PyRealBoolean):
+            result = JBoolean(py_value.getValue())
         else:
-            yaml_stream_translator.dump(java_object)
+            yaml_ex = exception_helper.create_yaml_exception('WLSDPLY-18201', type(py_value))
+            self._logger.throwing(class_name=self._class_name, method_name=_method_name, error=yaml_ex)
+            raise yaml_ex
+        return result
 
     def _close_writer(self, writer):
         """
@@ -0,0 +1,110 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.aliases;
+
+import java.io.File;
+import java.io.FileOutputStream;
+
+import oracle.weblogic.deploy.util.PyRealBoolean;
+import oracle.weblogic.deploy.util.WLSDeployZipFileTest;
+
+import org.junit.jupiter.api.BeforeAll;
+import org.junit.jupiter.api.Test;
+import org.python.core.Py;
+import org.python.core.PyBoolean;
+import org.python.core.PyDictionary;
+import org.python.core.PyInteger;
+import org.python.core.PyList;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyString;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertNotNull;
+import static org.junit.jupiter.api.Assertions.assertNull;
+import static org.junit.jupiter.api.Assertions.assertSame;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+public class AliasCategoryCacheTest {
+    private static final File UNIT_TEST_TARGET_DIR =
+        new File(WLSDeployZipFileTest.UNIT_TEST_TARGET_DIR, "alias-cache");
+    private static final String[] RESOURCES = {
+        "oracle/weblogic/deploy/aliases/category_modules/Server.json"
+    };
+
+    @BeforeAll
+    static void initialize() throws Exception {
+        if(!UNIT_TEST_TARGET_DIR.exists() && !UNIT_TEST_TARGET_DIR.mkdirs()) {
+            throw new Exception("Unable to create unit test directory: " + UNIT_TEST_TARGET_DIR);
+        }
+    }
+
+    @Test
+    void testSaveAndLoad() {
+        PyDictionary attribute = new PyDictionary();
+        attribute.__setitem__("wlst_name", new PyString("ListenPort"));
+        attribute.__setitem__("default_value", new PyLong(7001L));
+        attribute.__setitem__("restart_required", new PyRealBoolean(true));
+        attribute.__setitem__("derived_default", Py.None);
+
+        PyDictionary attributes = new PyDictionary();
+        attributes.__setitem__("ListenPort", attribute);
+        PyDictionary wlstNames = new PyDictionary();
+        wlstNames.__setitem__("ListenPort", attribute);
+
+        PyDictionary folder = new PyDictionary();
+        folder.__setitem__("attributes", attributes);
+        folder.__setitem__("wlst_names_map", wlstNames);
+        folder.__setitem__("wlst_skip_names", new PyList(new PyObject[] { new PyString("ListenPort") }));
+
+        AliasCategoryCache cache = new AliasCategoryCache(UNIT_TEST_TARGET_DIR);
+        assertTrue(cache.save("Server-12.2.1.3-OFFLINE", RESOURCES, folder), "cache entry was saved");
+
+        PyObject loaded = cache.load("Server-12.2.1.3-OFFLINE");
+        assertNotNull(loaded, "cache entry was loaded");
+        assertEquals(folder, loaded, "loaded entry matches saved entry");
+
+        PyObject loadedAttributes = loaded.__finditem__("attributes");
+        PyObject loadedWlstNames = loaded.__finditem__("wlst_names_map");
+        assertSame(loadedAttributes.__finditem__("ListenPort"), loadedWlstNames.__finditem__("ListenPort"),
+            "shared attribute dictionary is loaded once");
+    }
+
+    @Test
+    void testBooleanValues() {
+        PyDictionary folder = new PyDictionary();
+        folder.__setitem__("merge", Py.True);
+        folder.__setitem__("restart_required", Py.False);
+        folder.__setitem__("default_value", new PyInteger(1));
+
+        AliasCategoryCache cache = new AliasCategoryCache(UNIT_TEST_TARGET_DIR);
+        assertTrue(cache.save("Boolean-12.2.1.3-OFFLINE", RESOURCES, folder), "cache entry was saved");
+
+        PyObject loaded = cache.load("Boolean-12.2.1.3-OFFLINE");
+        assertNotNull(loaded, "cache entry was loaded");
+        assertSame(Py.True, loaded.__finditem__("merge"), "True is loaded as a boolean");
+        assertSame(Py.False, loaded.__finditem__("restart_required"), "False is loaded as a boolean");
+        assertFalse(loaded.__finditem__("default_value") instanceof PyBoolean, "integer is not loaded as a boolean");
+        assertEquals(new PyInteger(1), loaded.__finditem__("default_value"), "integer is loaded");
+    }
+
+    @Test
+    void testMissingEntry() {
+        AliasCategoryCache cache = new AliasCategoryCache(UNIT_TEST_TARGET_DIR);
+        assertNull(cache.load("Missing-12.2.1.3-OFFLINE"), "missing entry is not loaded");
+    }
+
+    @Test
+    void testCorruptEntry() throws Exception {
+        File cacheFile = new File(UNIT_TEST_TARGET_DIR, "Corrupt-12.2.1.3-OFFLINE.bin");
+        try (FileOutputStream output = new FileOutputStream(cacheFile)) {
+            output.write(new byte[] { 1, 2, 3, 4 });
+        }
+
+        AliasCategoryCache cache = new AliasCategoryCache(UNIT_TEST_TARGET_DIR);
+        assertNull(cache.load("Corrupt-12.2.1.3-OFFLINE"), "corrupt entry is not loaded");
+    }
+}
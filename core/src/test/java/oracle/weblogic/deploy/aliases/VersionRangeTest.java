@@ -0,0 +1,67 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.aliases;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.function.Executable;
+
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertSame;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+public class VersionRangeTest {
+    private static final String VERSION_1036 = "10.3.6.0";
+    private static final String VERSION_1221 = "12.2.1.0";
+    private static final String VERSION_14110 = "14.1.1.0.0";
+
+    private static final String RANGE_1036_AND_NEWER = "[10.3.6,)";
+    private static final String RANGE_BETWEEN_1212_AND_1221 = "(12.1.2,12.2.1]";
+    private static final String SINGLE_VERSION_1221 = "[12.2.1]";
+
+    @Test
+    public void testRangeIsCompiledOnce() throws Exception {
+        VersionRange range = VersionRange.getInstance(RANGE_1036_AND_NEWER);
+        assertSame(range, VersionRange.getInstance(RANGE_1036_AND_NEWER), "expected the same compiled range");
+    }
+
+    @Test
+    public void testIncludes() throws Exception {
+        VersionRange range = VersionRange.getInstance(RANGE_BETWEEN_1212_AND_1221);
+        assertFalse(range.includes(VERSION_1036), "expected " + VERSION_1036 + " to not be in range " + range);
+        assertTrue(range.includes(VERSION_1221), "expected " + VERSION_1221 + " to be in range " + range);
+        assertFalse(range.includes(VERSION_14110), "expected " + VERSION_14110 + " to not be in range " + range);
+
+        // remembered results are the same
+        assertTrue(range.includes(VERSION_1221), "expected " + VERSION_1221 + " to be in range " + range);
+
+        range = VersionRange.getInstance(SINGLE_VERSION_1221);
+        assertTrue(range.includes(VERSION_1221), "expected " + VERSION_1221 + " to be in range " + range);
+        assertFalse(range.includes(VERSION_14110), "expected " + VERSION_14110 + " to not be in range " + range);
+    }
+
+    @Test
+    public void testIncludesMatchesVersionUtils() throws Exception {
+        String[] versions = { VERSION_1036, VERSION_1221, VERSION_14110 };
+        String[] ranges = { RANGE_1036_AND_NEWER, RANGE_BETWEEN_1212_AND_1221, SINGLE_VERSION_1221 };
+        for (String rangeText : ranges) {
+            VersionRange range = VersionRange.getInstance(rangeText);
+            for (String version : versions) {
+                assertTrue(range.includes(version) == VersionUtils.isVersionInRange(version, rangeText),
+                    "expected the same result for " + version + " in range " + rangeText);
+            }
+        }
+    }
+
+    @Test
+    public void testInvalidRange() {
+        assertThrows(VersionException.class, new Executable() {
+            @Override
+            public void execute() throws Throwable {
+                VersionRange.getInstance("not-a-range");
+            }
+        }, "Test must raise VersionException for an invalid range");
+    }
+}
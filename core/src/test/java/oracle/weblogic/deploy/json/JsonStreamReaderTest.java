@@ -0,0 +1,143 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.json;
+
+import java.io.ByteArrayInputStream;
+import java.io.InputStream;
+import java.util.logging.Level;
+import java.util.logging.Logger;
+
+import oracle.weblogic.deploy.util.FileUtils;
+import oracle.weblogic.deploy.util.PyOrderedDict;
+import oracle.weblogic.deploy.util.PyRealBoolean;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.function.Executable;
+import org.python.core.Py;
+import org.python.core.PyDictionary;
+import org.python.core.PyFloat;
+import org.python.core.PyList;
+import org.python.core.PyLong;
+import org.python.core.PyObject;
+import org.python.core.PyString;
+
+import static java.nio.charset.StandardCharsets.UTF_8;
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+class JsonStreamReaderTest {
+    private static final String ALIAS_FILE = "oracle/weblogic/deploy/aliases/category_modules/Server.json";
+
+    private static final String MODEL_TEXT = "{\n"
+        + "  \"topology\": {\n"
+        + "    \"Name\": \"my\\tdomain \\\"one\\\"\",\n"
+        + "    \"Server\": {\n"
+        + "      \"m1\": { \"ListenPort\": 8001, \"Weight\": -1.5e2, \"Enabled\": true, \"Notes\": null },\n"
+        + "      \"m2\": { \"ListenPort\": 0, \"Targets\": [ \"a\", [ ], { }, false ] }\n"
+        + "    }\n"
+        + "  }\n"
+        + "}\n";
+
+    @Test
+    void testReadModel() throws Exception {
+        PyDictionary model = read(MODEL_TEXT);
+        assertTrue(model instanceof PyOrderedDict, "ordered dictionary was created");
+
+        PyObject topology = model.__finditem__("topology");
+        assertEquals(new PyString("my\tdomain \"one\""), topology.__finditem__("Name"));
+
+        PyObject server = topology.__finditem__("Server").__finditem__("m1");
+        assertEquals(new PyLong(8001), server.__finditem__("ListenPort"));
+        assertEquals(new PyFloat(-150.0), server.__finditem__("Weight"));
+        assertEquals(new PyRealBoolean(true), server.__finditem__("Enabled"));
+        assertEquals(Py.None, server.__finditem__("Notes"));
+
+        PyObject targets = topology.__finditem__("Server").__finditem__("m2").__finditem__("Targets");
+        assertTrue(targets instanceof PyList, "list was created");
+        assertEquals(4, targets.__len__());
+        assertEquals(new PyRealBoolean(false), targets.__finditem__(3));
+
+        // dictionaries without tokens are marked by the reader
+        assertTrue(((PyOrderedDict) model).isTokenFree(), "model has no tokens");
+        assertFalse(((PyOrderedDict) read("{ \"a\": { \"b\": [ \"@@ENV:B@@\" ] } }")).isTokenFree(),
+            "model has a token in a list");
+    }
+
+    @Test
+    void testUnicodeEscape() throws Exception {
+        PyDictionary dictionary = read("{ \"abc\": \"caf\\u00e9\" }");
+        assertEquals(new PyString("caf\u00e9"), dictionary.__finditem__("abc"));
+    }
+
+    @Test
+    void testMatchesAntlrParser() throws Exception {
+        assertEquals(parseWithAntlr(MODEL_TEXT), read(MODEL_TEXT), "model matches ANTLR parser result");
+
+        String aliasText = new String(
+            FileUtils.readInputStreamToByteArray(FileUtils.getResourceAsStream(ALIAS_FILE)), UTF_8);
+        assertEquals(parseWithAntlr(aliasText), read(aliasText), "alias file matches ANTLR parser result");
+    }
+
+    @Test
+    void testSyntaxErrors() {
+        String[] badTexts = {
+            "",
+            "{ \"abc\": \"xyz\"/ }",
+            "{ \"abc\": \"xyz\n123\" }",
+            "{ \"abc\": 0123 }",
+            "{ \"abc\": tru }",
+            "{ \"abc\": [ 1, 2 }",
+            "{ \"abc\": \"\\q\" }",
+            "{ \"abc\": 1 } }"
+        };
+
+        Logger logger = Logger.getLogger("wlsdeploy.json");
+        Level originalLevel = logger.getLevel();
+        logger.setLevel(Level.OFF);
+        try {
+            for (final String badText : badTexts) {
+                assertThrows(JsonException.class, new Executable() {
+                    @Override
+                    public void execute() throws Throwable {
+                        read(badText);
+                    }
+                }, "Test must raise JsonException for " + badText);
+            }
+        } finally {
+            logger.setLevel(originalLevel);
+        }
+    }
+
+    @Test
+    void testDuplicateObjectError() {
+        assertThrows(JsonException.class, new Executable() {
+            @Override
+            public void execute() throws Throwable {
+                read("{ \"topology\": { }, \"topology\": { } }");
+            }
+        }, "Test must raise JsonException for a duplicate object");
+    }
+
+    private static PyDictionary read(String text) throws JsonException {
+        InputStream stream = new ByteArrayInputStream(text.getBytes(UTF_8));
+        return new JsonStreamReader("String", stream, true, false).read();
+    }
+
+    private static PyDictionary parseWithAntlr(String text) throws JsonException {
+        String previous = System.setProperty(AbstractJsonTranslator.USE_ANTLR_PARSER_PROPERTY, "true");
+        try {
+            InputStream stream = new ByteArrayInputStream(text.getBytes(UTF_8));
+            return new JsonStreamTranslator("String", stream, true).parse();
+        } finally {
+            if (previous == null) {
+                System.clearProperty(AbstractJsonTranslator.USE_ANTLR_PARSER_PROPERTY);
+            } else {
+                System.setProperty(AbstractJsonTranslator.USE_ANTLR_PARSER_PROPERTY, previous);
+            }
+        }
+    }
+}
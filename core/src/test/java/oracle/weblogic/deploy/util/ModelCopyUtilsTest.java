@@ -0,0 +1,62 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.util;
+
+import org.junit.jupiter.api.Test;
+import org.python.core.Py;
+import org.python.core.PyDictionary;
+import org.python.core.PyInteger;
+import org.python.core.PyList;
+import org.python.core.PyObject;
+import org.python.core.PyString;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertNotSame;
+import static org.junit.jupiter.api.Assertions.assertSame;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+public class ModelCopyUtilsTest {
+
+    @Test
+    void testCopyModel() {
+        PyString name = new PyString("server1");
+        PyOrderedDict server = new PyOrderedDict();
+        server.__setitem__("Name", name);
+        server.__setitem__("ListenPort", new PyInteger(7001));
+        server.__setitem__("Enabled", new PyRealBoolean(true));
+        server.__setitem__("Notes", Py.None);
+        server.__setitem__("Targets", new PyList(new PyObject[] { new PyString("cluster1") }));
+
+        PyDictionary plain = new PyDictionary();
+        plain.__setitem__(new PyString("key"), new PyString("value"));
+        server.__setitem__("Plain", plain);
+
+        PyOrderedDict model = new PyOrderedDict();
+        model.__setitem__("Server", server);
+        model.addComment("Server", "the servers");
+
+        PyOrderedDict copy = (PyOrderedDict) ModelCopyUtils.copyModel(model);
+        assertNotSame(model, copy);
+        assertEquals(model, copy, "copy has the same entries and comments");
+        assertEquals(model.getCommentMap(), copy.getCommentMap(), "comments were copied");
+
+        PyOrderedDict serverCopy = (PyOrderedDict) copy.__finditem__("Server");
+        assertNotSame(server, serverCopy);
+        assertEquals(server.keys(), serverCopy.keys(), "key order was kept");
+        assertSame(name, serverCopy.__finditem__("Name"), "immutable values are shared");
+
+        PyObject targetsCopy = serverCopy.__finditem__("Targets");
+        assertNotSame(server.__finditem__("Targets"), targetsCopy);
+        assertTrue(targetsCopy instanceof PyList, "list was copied as a list");
+
+        PyObject plainCopy = serverCopy.__finditem__("Plain");
+        assertNotSame(plain, plainCopy);
+        assertEquals(PyDictionary.class, plainCopy.getClass(), "plain dictionary was copied as a plain dictionary");
+
+        // changing the copy does not change the original
+        serverCopy.__setitem__("ListenPort", new PyInteger(8001));
+        assertEquals(new PyInteger(7001), server.__finditem__("ListenPort"));
+    }
+}
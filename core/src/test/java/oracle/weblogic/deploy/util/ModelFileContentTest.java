@@ -0,0 +1,124 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.ByteArrayOutputStream;
+import java.io.File;
+import java.io.IOException;
+import java.io.InputStream;
+import java.nio.file.Files;
+
+import org.junit.jupiter.api.BeforeAll;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.function.Executable;
+
+import static java.nio.charset.StandardCharsets.UTF_8;
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+public class ModelFileContentTest {
+    private static final File UNIT_TEST_TARGET_DIR =
+        new File(WLSDeployZipFileTest.UNIT_TEST_TARGET_DIR, "model-files");
+
+    @BeforeAll
+    static void initialize() {
+        if (!UNIT_TEST_TARGET_DIR.exists() && !UNIT_TEST_TARGET_DIR.mkdirs()) {
+            throw new IllegalStateException("Unable to create directory " + UNIT_TEST_TARGET_DIR);
+        }
+    }
+
+    @Test
+    void testFormatFromContent() throws Exception {
+        ModelFileContent json = ModelFileContent.load(writeFile("json-model.yaml", "\n  {\"topology\": {}}\n"), 0);
+        assertTrue(json.isJson(), "brace content is JSON, whatever the extension");
+
+        ModelFileContent yaml = ModelFileContent.load(writeFile("yaml-model.json", "# {\ntopology:\n"), 0);
+        assertFalse(yaml.isJson(), "other content is YAML, whatever the extension");
+
+        ModelFileContent empty = ModelFileContent.load(writeFile("empty.yaml", ""), 0);
+        assertFalse(empty.isJson(), "empty content is YAML");
+        assertEquals(0, empty.getSize());
+    }
+
+    @Test
+    void testByteOrderMarkIsSkipped() throws Exception {
+        byte[] text = "{\"a\": 1}".getBytes(UTF_8);
+        byte[] bytes = new byte[text.length + 3];
+        bytes[0] = (byte) 0xEF;
+        bytes[1] = (byte) 0xBB;
+        bytes[2] = (byte) 0xBF;
+        System.arraycopy(text, 0, bytes, 3, text.length);
+
+        ModelFileContent content = ModelFileContent.load(writeFile("bom.json", bytes), 0);
+        assertTrue(content.isJson(), "content after the byte order mark is JSON");
+        assertEquals("{\"a\": 1}", readAll(content.getInputStream()));
+        assertEquals("{\"a\": 1}", readAll(content.getInputStream()), "each stream starts at the beginning");
+    }
+
+    @Test
+    void testCodePointLimit() throws Exception {
+        // five code points in eight bytes
+        final File file = writeFile("limit.yaml", "a: \u00e9\u20ac");
+        ModelFileContent content = ModelFileContent.load(file, 5);
+        assertEquals(8, content.getSize());
+
+        assertThrows(TranslateException.class, new Executable() {
+            @Override
+            public void execute() throws Throwable {
+                ModelFileContent.load(file, 4);
+            }
+        }, "YAML with more code points than the limit must be rejected");
+
+        assertThrows(TranslateException.class, new Executable() {
+            @Override
+            public void execute() throws Throwable {
+                ModelFileContent.load(file, 1);
+            }
+        }, "YAML that is four times larger than the limit must be rejected without counting");
+
+        // the YAML limit does not apply to JSON
+        ModelFileContent json = ModelFileContent.load(writeFile("limit.json", "{\"a\": \"\u00e9\u20ac\"}"), 1);
+        assertTrue(json.isJson());
+    }
+
+    @Test
+    void testLargeFileIsReleased() throws Exception {
+        StringBuilder text = new StringBuilder("topology:\n  Server:\n");
+        int i = 0;
+        while (text.length() < 2 * 1024 * 1024) {
+            text.append("    server-").append(i++).append(":\n      ListenPort: 8001\n");
+        }
+        File file = writeFile("large.yaml", text.toString());
+
+        // the file is not held open or mapped after loading, so it can be deleted while the content is used
+        ModelFileContent content = ModelFileContent.load(file, 0);
+        Files.delete(file.toPath());
+        assertFalse(file.exists(), "loaded file is deleted");
+        assertFalse(content.isJson());
+        assertEquals(text.toString(), readAll(content.getInputStream()));
+    }
+
+    private static File writeFile(String name, String text) throws IOException {
+        return writeFile(name, text.getBytes(UTF_8));
+    }
+
+    private static File writeFile(String name, byte[] bytes) throws IOException {
+        File file = new File(UNIT_TEST_TARGET_DIR, name);
+        Files.write(file.toPath(), bytes);
+        return file;
+    }
+
+    private static String readAll(InputStream stream) throws IOException {
+        ByteArrayOutputStream output = new ByteArrayOutputStream();
+        byte[] buffer = new byte[4096];
+        int count;
+        while ((count = stream.read(buffer, 0, buffer.length)) >= 0) {
+            output.write(buffer, 0, count);
+        }
+        return new String(output.toByteArray(), UTF_8);
+    }
+}
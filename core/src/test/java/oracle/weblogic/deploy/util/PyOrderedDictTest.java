@@ -1,10 +1,16 @@
 /*
- * Copyright (c) 2017, 2022, Oracle Corporation and/or its affiliates.  All rights reserved.
+ * Copyright (c) 2017, 2023, Oracle Corporation and/or its affiliates.  All rights reserved.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.util;
 
+import java.lang.management.ManagementFactory;
+import java.lang.management.MemoryMXBean;
+
 import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.TestReporter;
+import org.junit.jupiter.api.condition.EnabledIfSystemProperty;
+import org.python.core.Py;
 import org.python.core.PyDictionary;
 import org.python.core.PyInteger;
 import org.python.core.PyList;
@@ -13,9 +19,18 @@ import org.python.core.PyString;
 import org.python.core.PyTuple;
 
 import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
 import static org.junit.jupiter.api.Assertions.assertTrue;
 
 public class PyOrderedDictTest {
+    // the number of dictionary entries in the synthetic model for the memory benchmark, which only runs if it is set
+    private static final String BENCHMARK_NODES_PROPERTY = "wdt.ordered.dict.benchmark.nodes";
+    private static final int BENCHMARK_NODES = Integer.getInteger(BENCHMARK_NODES_PROPERTY, 0);
+
+    // the largest ratio of the ordered model size to the plain model size
+    private static final long BENCHMARK_MAX_SIZE_RATIO = 2;
+    private static final int BENCHMARK_ATTRIBUTES = 20;
+
     @Test
     void testIsInstance() {
         PyOrderedDict myOrderedDict = new PyOrderedDict();
@@ -126,4 +141,162 @@ public class PyOrderedDictTest {
 
         assertEquals(myOrderedDictKeys, expected);
     }
+
+    @Test
+    void testDeleteAndReplace() {
+        PyOrderedDict myOrderedDict = new PyOrderedDict();
+        myOrderedDict.__setitem__("one", new PyInteger(1));
+        myOrderedDict.__setitem__("two", new PyInteger(2));
+        myOrderedDict.__setitem__("three", new PyInteger(3));
+
+        // replacing a value keeps the original position
+        myOrderedDict.__setitem__("one", new PyInteger(11));
+        myOrderedDict.__delitem__(new PyString("two"));
+        myOrderedDict.__setitem__("two", new PyInteger(22));
+
+        PyObject[] keys = { new PyString("one"), new PyString("three"), new PyString("two") };
+        assertEquals(new PyList(keys), myOrderedDict.keys());
+        assertEquals(3, myOrderedDict.__len__());
+        assertEquals(new PyInteger(11), myOrderedDict.get(new PyString("one")));
+        assertEquals(Py.None, myOrderedDict.get(new PyString("four")));
+        assertFalse(myOrderedDict.has_key(new PyString("four")), "has_key for missing key returns false");
+
+        assertEquals(new PyInteger(3), myOrderedDict.pop(new PyString("three")));
+        myOrderedDict.clear();
+        assertFalse(myOrderedDict.__nonzero__(), "cleared dictionary is empty");
+    }
+
+    @Test
+    void testDeleteManyKeys() {
+        // deleting keys does not search the key order, so this is linear in the number of keys
+        int keyCount = 100000;
+        PyOrderedDict myOrderedDict = new PyOrderedDict();
+        for (int i = 0; i < keyCount; i++) {
+            myOrderedDict.__setitem__("server-" + i, new PyInteger(i));
+        }
+        for (int i = 0; i < keyCount; i += 2) {
+            myOrderedDict.__delitem__(new PyString("server-" + i));
+        }
+
+        assertEquals(keyCount / 2, myOrderedDict.__len__());
+        PyList keys = myOrderedDict.keys();
+        for (int i = 0; i < keys.size(); i++) {
+            assertEquals(new PyString("server-" + (2 * i + 1)), keys.pyget(i));
+        }
+        assertEquals(new PyInteger(1), myOrderedDict.getValues().pyget(0));
+
+        // the remaining keys are deleted from the end, and a deleted key is added back at the end
+        for (int i = keyCount - 1; i > 0; i -= 2) {
+            myOrderedDict.__delitem__(new PyString("server-" + i));
+        }
+        assertFalse(myOrderedDict.__nonzero__(), "all keys were deleted");
+        myOrderedDict.__setitem__("server-0", new PyInteger(0));
+        assertEquals(new PyList(new PyObject[] { new PyString("server-0") }), myOrderedDict.keys());
+    }
+
+    @Test
+    void testTokenFree() {
+        PyOrderedDict child = new PyOrderedDict();
+        child.__setitem__("ListenPort", new PyInteger(7001));
+        PyOrderedDict parent = new PyOrderedDict();
+        parent.__setitem__("Name", new PyString("server1"));
+        parent.__setitem__("Child", child);
+        assertFalse(parent.isTokenFree(), "unmarked dictionary may have tokens");
+
+        child.markTokenFree();
+        parent.markTokenFree();
+        assertTrue(parent.isTokenFree(), "marked dictionaries without tokens are token free");
+        assertTrue(parent.copy().isTokenFree(), "copy keeps the mark");
+
+        // a change to a nested dictionary clears its mark, which is seen by the parent
+        child.__setitem__("ListenAddress", new PyString("@@PROP:address@@"));
+        assertFalse(parent.isTokenFree(), "nested dictionary was changed");
+        child.markTokenFree();
+        assertFalse(parent.isTokenFree(), "nested dictionary has a token");
+
+        // strings in lists are checked each time, since lists can change without notice
+        child.__delitem__(new PyString("ListenAddress"));
+        child.markTokenFree();
+        PyList targets = new PyList();
+        parent.__setitem__("Target", targets);
+        parent.markTokenFree();
+        assertTrue(parent.isTokenFree(), "list has no tokens");
+        targets.append(new PyString("@@ENV:CLUSTER@@"));
+        assertFalse(parent.isTokenFree(), "list has a token");
+
+        PyOrderedDict keyToken = new PyOrderedDict();
+        keyToken.__setitem__("@@PROP:name@@", new PyInteger(1));
+        keyToken.markTokenFree();
+        assertFalse(keyToken.isTokenFree(), "key has a token");
+    }
+
+    @Test
+    void testTokenFreeSubtreeResult() {
+        PyOrderedDict grandchild = new PyOrderedDict();
+        grandchild.__setitem__("ListenPort", new PyInteger(7001));
+        grandchild.markTokenFree();
+        PyOrderedDict child = new PyOrderedDict();
+        child.__setitem__("SSL", grandchild);
+        child.markTokenFree();
+        PyOrderedDict parent = new PyOrderedDict();
+        parent.__setitem__("Server", child);
+        parent.markTokenFree();
+
+        // the subtree results are kept by each dictionary for the next check
+        assertTrue(parent.isTokenFree(), "subtree has no tokens");
+        assertTrue(child.isTokenFree(), "kept subtree result has no tokens");
+
+        // a token added below the kept results is seen at each level
+        grandchild.__setitem__("ListenAddress", new PyString("@@PROP:address@@"));
+        grandchild.markTokenFree();
+        assertFalse(parent.isTokenFree(), "nested dictionary has a token");
+        assertFalse(child.isTokenFree(), "nested dictionary has a token");
+
+        grandchild.__delitem__(new PyString("ListenAddress"));
+        grandchild.markTokenFree();
+        PyOrderedDict token = new PyOrderedDict();
+        token.__setitem__("Name", new PyString("@@ENV:NAME@@"));
+        grandchild.__setitem__("Token", token);
+        grandchild.markTokenFree();
+        assertFalse(parent.isTokenFree(), "added dictionary has a token");
+    }
+
+    @Test
+    @EnabledIfSystemProperty(named = BENCHMARK_NODES_PROPERTY, matches = "[1-9][0-9]*")
+    void testMemoryBenchmark(TestReporter reporter) {
+        MemoryMXBean memoryBean = ManagementFactory.getMemoryMXBean();
+
+        long before = getRetainedHeap(memoryBean);
+        PyDictionary plainModel = createModel(new PyDictionary());
+        long plainBytes = getRetainedHeap(memoryBean) - before;
+
+        before = getRetainedHeap(memoryBean);
+        PyDictionary orderedModel = createModel(new PyOrderedDict());
+        long orderedBytes = getRetainedHeap(memoryBean) - before;
+
+        assertEquals(plainModel.__len__(), orderedModel.__len__());
+        reporter.publishEntry("nodes", String.valueOf(BENCHMARK_NODES));
+        reporter.publishEntry("dictionaryBytes", String.valueOf(plainBytes));
+        reporter.publishEntry("orderedDictionaryBytes", String.valueOf(orderedBytes));
+        assertTrue(orderedBytes <= BENCHMARK_MAX_SIZE_RATIO * plainBytes, "ordered model is at most "
+            + BENCHMARK_MAX_SIZE_RATIO + " times the size of the plain model");
+    }
+
+    // a model of folders with the same number of attributes, so there are the specified number of entries
+    private static PyDictionary createModel(PyDictionary model) {
+        int folderCount = BENCHMARK_NODES / (BENCHMARK_ATTRIBUTES + 1);
+        for (int i = 0; i < folderCount; i++) {
+            PyDictionary folder = (model instanceof PyOrderedDict) ? new PyOrderedDict() : new PyDictionary();
+            for (int j = 0; j < BENCHMARK_ATTRIBUTES; j++) {
+                folder.__setitem__("Attribute" + j, new PyInteger(j));
+            }
+            model.__setitem__("folder-" + i, folder);
+        }
+        return model;
+    }
+
+    private static long getRetainedHeap(MemoryMXBean memoryBean) {
+        System.gc();
+        return memoryBean.getHeapMemoryUsage().getUsed();
+    }
 }
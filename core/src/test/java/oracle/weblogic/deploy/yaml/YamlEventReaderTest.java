@@ -0,0 +1,217 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.yaml;
+
+import java.io.ByteArrayInputStream;
+import java.io.File;
+import java.lang.management.ManagementFactory;
+import java.lang.management.MemoryPoolMXBean;
+import java.lang.management.MemoryType;
+import java.nio.file.Files;
+import java.util.concurrent.Callable;
+
+import oracle.weblogic.deploy.util.PyOrderedDict;
+
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.TestReporter;
+import org.junit.jupiter.api.condition.EnabledIfSystemProperty;
+import org.junit.jupiter.api.function.Executable;
+import org.python.core.PyDictionary;
+import org.python.core.PyInteger;
+import org.python.core.PyList;
+import org.python.core.PyObject;
+import org.python.core.PyString;
+
+import static java.nio.charset.StandardCharsets.UTF_8;
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+public class YamlEventReaderTest {
+    private static final String[] MODEL_FILES = {
+        "src/test/resources/yaml/empty.yaml",
+        "src/test/resources/yaml/flat-map-with-scalars.yaml",
+        "src/test/resources/yaml/nested-dict.yaml",
+        "src/test/resources/yaml/comment-model.yaml",
+        "src/test/resources/yaml/multiple-docs.yaml"
+    };
+
+    private static final String ALIAS_TEXT = "defaults: &defaults\n"
+        + "  ListenPort: 8001\n"
+        + "  Notes: ~\n"
+        + "  Targets: &targets [ cluster1, cluster2 ]\n"
+        + "topology:\n"
+        + "  Server:\n"
+        + "    m1:\n"
+        + "      <<: *defaults\n"
+        + "      ListenPort: 9001\n"
+        + "      Machine:\n"
+        + "    m2:\n"
+        + "      ListenPort: 0x1F41\n"
+        + "      Weight: 1.5\n"
+        + "      Enabled: yes\n"
+        + "      Targets: *targets\n"
+        + "      List: [ 1, ~, '2' ]\n";
+
+    // the number of servers in the generated model for the peak heap measurement, which only runs if it is set
+    private static final String HEAP_TEST_SERVERS_PROPERTY = "wdt.yaml.heap.test.servers";
+    private static final int HEAP_TEST_SERVERS = Integer.getInteger(HEAP_TEST_SERVERS_PROPERTY, 0);
+
+    @Test
+    public void testMatchesConstructor() throws Exception {
+        for (String modelFile : MODEL_FILES) {
+            byte[] bytes = Files.readAllBytes(new File(modelFile).toPath());
+            assertEquals(parseWithConstructor(bytes), parse(bytes), "event reader result matches for " + modelFile);
+        }
+
+        byte[] bytes = ALIAS_TEXT.getBytes(UTF_8);
+        assertEquals(parseWithConstructor(bytes), parse(bytes), "event reader result matches for aliases");
+    }
+
+    @Test
+    public void testAliasesAndMergeKeys() throws Exception {
+        PyDictionary model = (PyDictionary) parse(ALIAS_TEXT.getBytes(UTF_8)).__getitem__(0);
+        assertTrue(model instanceof PyOrderedDict, "ordered dictionary was created");
+
+        PyObject servers = model.__finditem__("topology").__finditem__("Server");
+        PyObject m1 = servers.__finditem__("m1");
+        assertEquals(new PyInteger(9001), m1.__finditem__("ListenPort"), "explicit key overrides merged key");
+        assertEquals(new PyDictionary(), m1.__finditem__("Notes"), "null value is an empty dictionary");
+        assertEquals(new PyDictionary(), m1.__finditem__("Machine"), "empty value is an empty dictionary");
+
+        PyObject m2 = servers.__finditem__("m2");
+        assertEquals(new PyInteger(8001), m2.__finditem__("ListenPort"), "hexadecimal value is resolved");
+        assertEquals(new PyString("2"), m2.__finditem__("List").__getitem__(2), "quoted value is a string");
+
+        // each alias gets a separate copy
+        PyObject targets = m2.__finditem__("Targets");
+        assertTrue(targets instanceof PyList, "alias list was created");
+        assertTrue(targets != model.__finditem__("defaults").__finditem__("Targets"), "alias list is a copy");
+        assertTrue(targets != m1.__finditem__("Targets"), "merged alias list is a copy");
+
+        // dictionaries without tokens are marked by the reader
+        assertTrue(((PyOrderedDict) model).isTokenFree(), "model has no tokens");
+        PyDictionary tokenModel = (PyDictionary) parse("a:\n  b: 1\nc:\n  d: '@@PROP:d@@'\n".getBytes(UTF_8))
+            .__getitem__(0);
+        assertTrue(((PyOrderedDict) tokenModel.__finditem__("a")).isTokenFree(), "a has no tokens");
+        assertFalse(((PyOrderedDict) tokenModel).isTokenFree(), "model has a token below c");
+    }
+
+    @Test
+    public void testErrors() {
+        String[] badTexts = {
+            "abc: 1\nabc: 2\n",
+            "abc: *undefined\n",
+            "abc: [ 1, 2\n",
+            "abc:\n  <<: [ 1, 2 ]\n",
+            "abc: !custom xyz\n",
+            "- abc\n- xyz\n",
+            "abc: 1\n---\nxyz: 2\n"
+        };
+
+        for (final String badText : badTexts) {
+            assertThrows(YamlException.class, new Executable() {
+                @Override
+                public void execute() throws Throwable {
+                    new YamlStreamTranslator("String", new ByteArrayInputStream(badText.getBytes(UTF_8))).parse();
+                }
+            }, "Test must raise YamlException for " + badText);
+        }
+    }
+
+    @Test
+    @EnabledIfSystemProperty(named = HEAP_TEST_SERVERS_PROPERTY, matches = "[1-9][0-9]*")
+    public void testPeakHeap(TestReporter reporter) throws Exception {
+        final byte[] bytes = createModelText(HEAP_TEST_SERVERS).getBytes(UTF_8);
+
+        PeakHeapResult constructorResult = measurePeakHeap(new Callable<PyList>() {
+            @Override
+            public PyList call() throws Exception {
+                return parseWithConstructor(bytes);
+            }
+        });
+
+        PeakHeapResult eventResult = measurePeakHeap(new Callable<PyList>() {
+            @Override
+            public PyList call() throws Exception {
+                return parse(bytes);
+            }
+        });
+
+        assertEquals(constructorResult.documents, eventResult.documents, "event reader result matches");
+        reporter.publishEntry("modelBytes", String.valueOf(bytes.length));
+        reporter.publishEntry("constructorPeakHeapBytes", String.valueOf(constructorResult.peakHeapBytes));
+        reporter.publishEntry("eventReaderPeakHeapBytes", String.valueOf(eventResult.peakHeapBytes));
+        assertTrue(eventResult.peakHeapBytes < constructorResult.peakHeapBytes,
+            "event reader peak heap is lower than the constructor peak heap");
+    }
+
+    private static PyList parse(byte[] bytes) throws YamlException {
+        return new YamlStreamTranslator("String", new ByteArrayInputStream(bytes), true).parseDocuments(true);
+    }
+
+    private static PyList parseWithConstructor(byte[] bytes) throws YamlException {
+        String previous = System.setProperty(AbstractYamlTranslator.USE_CONSTRUCTOR_PROPERTY, "true");
+        try {
+            return parse(bytes);
+        } finally {
+            if (previous == null) {
+                System.clearProperty(AbstractYamlTranslator.USE_CONSTRUCTOR_PROPERTY);
+            } else {
+                System.setProperty(AbstractYamlTranslator.USE_CONSTRUCTOR_PROPERTY, previous);
+            }
+        }
+    }
+
+    // the sum of the peak usage of each heap pool, relative to the usage before the parse
+    private static PeakHeapResult measurePeakHeap(Callable<PyList> parser) throws Exception {
+        System.gc();
+        long baseline = 0;
+        for (MemoryPoolMXBean pool : ManagementFactory.getMemoryPoolMXBeans()) {
+            if (pool.getType() == MemoryType.HEAP) {
+                pool.resetPeakUsage();
+                baseline += pool.getUsage().getUsed();
+            }
+        }
+
+        PyList documents = parser.call();
+
+        long peak = 0;
+        for (MemoryPoolMXBean pool : ManagementFactory.getMemoryPoolMXBeans()) {
+            if (pool.getType() == MemoryType.HEAP) {
+                peak += pool.getPeakUsage().getUsed();
+            }
+        }
+        return new PeakHeapResult(documents, Math.max(peak - baseline, 0));
+    }
+
+    private static String createModelText(int serverCount) {
+        StringBuilder text = new StringBuilder("domainInfo:\n  AdminUserName: weblogic\ntopology:\n  Server:\n");
+        for (int i = 0; i < serverCount; i++) {
+            text.append("    server-").append(i).append(":\n")
+                .append("      ListenPort: ").append(8000 + i).append('\n')
+                .append("      ListenAddress: host-").append(i).append(".example.com\n")
+                .append("      Cluster: cluster-1\n")
+                .append("      Notes: 'server ").append(i).append(" of ").append(serverCount).append("'\n")
+                .append("      SSL:\n")
+                .append("        Enabled: true\n")
+                .append("        ListenPort: ").append(9000 + i).append('\n')
+                .append("      ServerStart:\n")
+                .append("        Arguments: [ -Xms512m, -Xmx1024m ]\n");
+        }
+        return text.toString();
+    }
+
+    private static final class PeakHeapResult {
+        private final PyList documents;
+        private final long peakHeapBytes;
+
+        private PeakHeapResult(PyList documents, long peakHeapBytes) {
+            this.documents = documents;
+            this.peakHeapBytes = peakHeapBytes;
+        }
+    }
+}
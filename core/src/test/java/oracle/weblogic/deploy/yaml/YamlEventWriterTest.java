@@ -0,0 +1,116 @@
+/*
+ * Copyright (c) 2023, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.yaml;
+
+import java.io.StringWriter;
+import java.math.BigInteger;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+import java.util.Map;
+
+import oracle.weblogic.deploy.util.CommentMap;
+import oracle.weblogic.deploy.util.OrderedMap;
+
+import org.junit.jupiter.api.Test;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+
+public class YamlEventWriterTest {
+
+    @Test
+    public void testMatchesDumper() throws Exception {
+        List<Object> documents = new ArrayList<>();
+        documents.add(createDocument());
+        assertEquals(dump(documents), write(documents), "event writer output matches dumper");
+    }
+
+    @Test
+    public void testMultipleDocumentsMatchDumper() throws Exception {
+        OrderedMap second = new OrderedMap();
+        second.put("two", 2);
+        List<Object> documents = Arrays.<Object>asList(createDocument(), second, new OrderedMap());
+        assertEquals(dump(documents), write(documents), "event writer output matches dumper");
+    }
+
+    @Test
+    public void testNoDocumentsMatchDumper() throws Exception {
+        List<Object> documents = new ArrayList<>();
+        assertEquals(dump(documents), write(documents), "event writer output matches dumper");
+    }
+
+    private static OrderedMap createDocument() {
+        OrderedMap server = new OrderedMap();
+        server.put("ListenPort", 8001);
+        server.put("MaxMessageSize", 12345678901L);
+        server.put("Weight", 1.5);
+        server.put("Big", new BigInteger("123456789012345678901234567890"));
+        server.put("Enabled", true);
+        server.put("Notes", null);
+        server.put("Description", "first line\nsecond line");
+        server.put("QuotedTrue", "true");
+        server.put("QuotedNumber", "123");
+        server.put("QuotedNull", "null");
+        server.put("Special", "@@PROP:value@@: # not a comment");
+        server.put("Escaped", "tab\there \u0001");
+        server.put("Empty", new OrderedMap());
+        server.put("EmptyList", new ArrayList<>());
+        server.put("Targets", Arrays.<Object>asList("cluster1", 2, Arrays.asList("a", "b")));
+
+        OrderedMap servers = new OrderedMap();
+        servers.put("m1", server);
+
+        CommentMap commentMap = new CommentMap();
+        commentMap.addComment("Server", "the managed servers");
+        commentMap.addBlankLine("Server");
+
+        OrderedMap topology = new OrderedMap();
+        topology.setCommentMap(commentMap);
+        topology.put("Name", "domain1");
+        topology.put("Server", servers);
+
+        OrderedMap document = new OrderedMap();
+        document.put("topology", topology);
+        return document;
+    }
+
+    private static String dump(List<Object> documents) throws YamlException {
+        StringWriter writer = new StringWriter();
+        new YamlStreamTranslator("String", writer).dumpDocuments(documents);
+        return writer.toString();
+    }
+
+    private static String write(List<Object> documents) throws YamlException {
+        StringWriter writer = new StringWriter();
+        YamlEventWriter eventWriter = new YamlEventWriter("String", writer);
+        for (Object document : documents) {
+            eventWriter.startDocument();
+            writeValue(eventWriter, document);
+            eventWriter.endDocument();
+        }
+        eventWriter.close();
+        return writer.toString();
+    }
+
+    private static void writeValue(YamlEventWriter eventWriter, Object value) throws YamlException {
+        if (value instanceof OrderedMap) {
+            OrderedMap map = (OrderedMap) value;
+            eventWriter.startMapping();
+            for (Map.Entry<String, Object> entry : map.entrySet()) {
+                eventWriter.writeKey(entry.getKey(), map.getCommentMap());
+                writeValue(eventWriter, entry.getValue());
+            }
+            eventWriter.endMapping();
+        } else if (value instanceof List) {
+            eventWriter.startSequence();
+            for (Object element : (List<?>) value) {
+                writeValue(eventWriter, element);
+            }
+            eventWriter.endSequence();
+        } else {
+            eventWriter.writeScalar(value);
+        }
+    }
+}
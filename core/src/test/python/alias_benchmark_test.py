@@ -0,0 +1,221 @@
+"""
+Copyright (c) 2023, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Times the alias layer, validation, model merge and YAML round-trip against a synthetic domain model.
+The scale is the number of servers, datasources and JMS resources in the model.
+"""
+import os
+
+from java.lang import System as JSystem
+from oracle.weblogic.deploy.aliases import VersionRange
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from base_benchmark_test import BaseBenchmarkTestCase
+from base_benchmark_test import elapsed_millis
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.model_constants import CLUSTER
+from wlsdeploy.aliases.model_constants import DOMAIN_NAME
+from wlsdeploy.aliases.model_constants import DRIVER_NAME
+from wlsdeploy.aliases.model_constants import ENABLED
+from wlsdeploy.aliases.model_constants import JDBC_DATASOURCE_PARAMS
+from wlsdeploy.aliases.model_constants import JDBC_DRIVER_PARAMS
+from wlsdeploy.aliases.model_constants import JDBC_DRIVER_PARAMS_PROPERTIES
+from wlsdeploy.aliases.model_constants import JDBC_RESOURCE
+from wlsdeploy.aliases.model_constants import JDBC_SYSTEM_RESOURCE
+from wlsdeploy.aliases.model_constants import JMS_RESOURCE
+from wlsdeploy.aliases.model_constants import JMS_SYSTEM_RESOURCE
+from wlsdeploy.aliases.model_constants import JNDI_NAME
+from wlsdeploy.aliases.model_constants import LISTEN_PORT
+from wlsdeploy.aliases.model_constants import QUEUE
+from wlsdeploy.aliases.model_constants import RESOURCES
+from wlsdeploy.aliases.model_constants import SERVER
+from wlsdeploy.aliases.model_constants import SSL
+from wlsdeploy.aliases.model_constants import TARGET
+from wlsdeploy.aliases.model_constants import TOPOLOGY
+from wlsdeploy.aliases.model_constants import URL
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.tool.validate.validator import Validator
+from wlsdeploy.util import cla_helper
+from wlsdeploy.util.model_translator import FileToPython
+from wlsdeploy.yaml.yaml_translator import PythonToYaml
+
+
+class AliasBenchmarkTestCase(BaseBenchmarkTestCase):
+    _report_name = 'alias-benchmark'
+    _report_timings = OrderedDict()
+    _report_values = OrderedDict()
+    _password_variable = 'db.password'
+
+    # the aliases are shared by the tests, so the report includes the query cache use for all of them
+    _aliases = None
+
+    def setUp(self):
+        BaseBenchmarkTestCase.setUp(self)
+        self._suspend_logs('wlsdeploy.validate')
+
+        if AliasBenchmarkTestCase._aliases is None:
+            start = JSystem.nanoTime()
+            AliasBenchmarkTestCase._aliases = \
+                Aliases(self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=self._wls_version)
+            self._report_timings['createAliases'] = elapsed_millis(start)
+        self.aliases = AliasBenchmarkTestCase._aliases
+
+    def tearDown(self):
+        BaseBenchmarkTestCase.tearDown(self)
+        self._restore_logs()
+
+    def testAliasResolution(self):
+        start = JSystem.nanoTime()
+        model = _create_model(self.scale)
+        self._report_timings['createModel'] = elapsed_millis(start)
+
+        start = JSystem.nanoTime()
+        attribute_count = self._resolve_model_attributes(self.aliases, model)
+        self._report_timings['aliasResolution'] = elapsed_millis(start)
+
+        self._report_values['attributeCount'] = attribute_count
+        self.assertTrue(attribute_count > 0)
+
+    def testValidateStandalone(self):
+        model = _create_model(self.scale)
+        start = JSystem.nanoTime()
+        validator = Validator(self.model_context, self.aliases, wlst_mode=WlstModes.OFFLINE)
+        validator.validate_in_standalone_mode(model, {self._password_variable: 'welcome1'})
+        self._report_timings['validateStandalone'] = elapsed_millis(start)
+
+    def testMergeModel(self):
+        # the second model updates half of the elements and adds the same number of new ones
+        model = _create_model(self.scale)
+        merge_model = _create_model(self.scale, self.scale / 2)
+        start = JSystem.nanoTime()
+        cla_helper.merge_model_dictionaries(model, merge_model, None)
+        self._report_timings['mergeModel'] = elapsed_millis(start)
+
+        self.assertEqual(len(model[TOPOLOGY][SERVER]), self.scale + self.scale / 2)
+
+    def testYamlRoundTrip(self):
+        model = _create_model(self.scale)
+        yaml_file = os.path.join(self.OUTPUT_DIR, 'alias-benchmark-model-%s.yaml' % self.scale)
+        start = JSystem.nanoTime()
+        PythonToYaml(model).write_to_yaml_file(yaml_file)
+        self._report_timings['writeYaml'] = elapsed_millis(start)
+
+        start = JSystem.nanoTime()
+        yaml_model = FileToPython(yaml_file, True).parse()
+        self._report_timings['readYaml'] = elapsed_millis(start)
+
+        self.assertEqual(len(yaml_model[TOPOLOGY][SERVER]), self.scale)
+
+    def _add_report_details(self, report):
+        query_cache_hits, query_cache_misses = self.aliases.get_query_cache_statistics()
+        report['categoryLoadTimes'] = self.aliases.get_category_load_times()
+        report['queryCacheHits'] = query_cache_hits
+        report['queryCacheMisses'] = query_cache_misses
+        report['compiledVersionRanges'] = VersionRange.getCompiledRangeCount()
+
+    def _resolve_model_attributes(self, aliases, model):
+        """
+        Convert each model attribute for servers and datasources to its WLST name and value,
+        as the create and update tools would.
+        :return: the number of attributes converted
+        """
+        count = 0
+
+        location = LocationContext().append_location(SERVER)
+        name_token = aliases.get_name_token(location)
+        for server_name, server in model[TOPOLOGY][SERVER].items():
+            location.add_name_token(name_token, server_name)
+            count += _resolve_attributes(aliases, location, server)
+
+        location = LocationContext().append_location(JDBC_SYSTEM_RESOURCE)
+        name_token = aliases.get_name_token(location)
+        location.append_location(JDBC_RESOURCE)
+        location.append_location(JDBC_DRIVER_PARAMS)
+        for resource_name, resource in model[RESOURCES][JDBC_SYSTEM_RESOURCE].items():
+            location.add_name_token(name_token, resource_name)
+            aliases.get_wlst_attributes_path(location)
+            count += _resolve_attributes(aliases, location, resource[JDBC_RESOURCE][JDBC_DRIVER_PARAMS])
+        return count
+
+
+def _resolve_attributes(aliases, location, folder):
+    """
+    Convert the attributes in the model folder to WLST names and values.
+    :return: the number of attributes converted
+    """
+    count = 0
+    aliases.get_wlst_attributes_path(location)
+    for model_name, model_value in folder.items():
+        if not isinstance(model_value, dict):
+            aliases.get_wlst_attribute_name_and_value(location, model_name, model_value)
+            count += 1
+    return count
+
+
+def _create_model(scale, first_index=0):
+    """
+    Create a model with the specified number of servers, datasources and JMS resources.
+    :param scale: the number of each element to create
+    :param first_index: the index of the first element, so that models can overlap
+    :return: the model dictionary
+    """
+    cluster_name = AliasBenchmarkTestCase._cluster_name
+    servers = OrderedDict()
+    datasources = OrderedDict()
+    jms_resources = OrderedDict()
+    for index in range(first_index, first_index + scale):
+        servers['server-%s' % index] = {
+            LISTEN_PORT: 8000 + index,
+            CLUSTER: cluster_name,
+            'ListenAddress': 'host-%s.example.com' % index,
+            SSL: {
+                ENABLED: True,
+                LISTEN_PORT: 9000 + index
+            }
+        }
+
+        datasources['datasource-%s' % index] = {
+            TARGET: cluster_name,
+            JDBC_RESOURCE: {
+                JDBC_DATASOURCE_PARAMS: {
+                    JNDI_NAME: 'jdbc/datasource-%s' % index
+                },
+                JDBC_DRIVER_PARAMS: {
+                    URL: 'jdbc:oracle:thin:@//db-%s.example.com:1521/pdb' % index,
+                    DRIVER_NAME: 'oracle.jdbc.OracleDriver',
+                    'PasswordEncrypted': '@@PROP:%s@@' % AliasBenchmarkTestCase._password_variable,
+                    JDBC_DRIVER_PARAMS_PROPERTIES: {
+                        'user': {
+                            'Value': 'user-%s' % index
+                        }
+                    }
+                }
+            }
+        }
+
+        jms_resources['jms-module-%s' % index] = {
+            TARGET: cluster_name,
+            JMS_RESOURCE: {
+                QUEUE: {
+                    'queue-%s' % index: {
+                        JNDI_NAME: 'jms/queue-%s' % index
+                    }
+                }
+            }
+        }
+
+    model = OrderedDict()
+    model[TOPOLOGY] = {
+        DOMAIN_NAME: 'benchmark_domain',
+        CLUSTER: {
+            cluster_name: {}
+        },
+        SERVER: servers
+    }
+    model[RESOURCES] = {
+        JDBC_SYSTEM_RESOURCE: datasources,
+        JMS_SYSTEM_RESOURCE: jms_resources
+    }
+    return model
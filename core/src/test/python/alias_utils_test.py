@@ -4,7 +4,19 @@ Licensed under the Universal Permissive License v 1.0 as shown at https://oss.or
 """
 import unittest
 
+from oracle.weblogic.deploy.aliases import AliasException
+
 from wlsdeploy.aliases import alias_utils
+from wlsdeploy.aliases.alias_constants import ATTRIBUTES
+from wlsdeploy.aliases.alias_constants import FOLDERS
+from wlsdeploy.aliases.alias_constants import WLST_ATTRIBUTES_PATH
+from wlsdeploy.aliases.alias_constants import WLST_CREATE_PATH
+from wlsdeploy.aliases.alias_constants import WLST_LIST_PATH
+from wlsdeploy.aliases.alias_constants import WLST_PATH
+from wlsdeploy.aliases.alias_constants import WLST_PATHS
+from wlsdeploy.aliases.alias_constants import WLST_SUBFOLDERS_PATH
+from wlsdeploy.aliases.alias_constants import WLST_TYPE
+from wlsdeploy.aliases.location_context import LocationContext
 
 
 class ListTestCase(unittest.TestCase):
@@ -136,6 +148,46 @@ class ListTestCase(unittest.TestCase):
         self.assertEqual(lists_equal, True, message)
         return
 
+    def testResolvePathTokensSharesFolder(self):
+        subfolder = {WLST_TYPE: 'Log'}
+        attribute = {WLST_PATH: 'WP001', WLST_TYPE: 'string'}
+        folder = {
+            WLST_PATHS: {'WP001': '/Server/%SERVER%'},
+            WLST_ATTRIBUTES_PATH: 'WP001',
+            ATTRIBUTES: {'ListenAddress': attribute},
+            FOLDERS: {'Log': subfolder}
+        }
+        location = LocationContext().append_location('Server').add_name_token('SERVER', 'ms1')
+
+        resolved = alias_utils.resolve_path_tokens(location, '/Server', folder)
+        self.assertEqual(resolved[WLST_ATTRIBUTES_PATH], '/Server/ms1')
+        self.assertEqual(resolved[WLST_SUBFOLDERS_PATH], '/Server/ms1')
+        self.assertEqual(resolved[WLST_LIST_PATH], '/Server')
+        self.assertEqual(resolved[WLST_CREATE_PATH], '/')
+        self.assertEqual(resolved[WLST_PATHS]['WP001'], '/Server/ms1')
+        self.assertEqual(resolved[ATTRIBUTES]['ListenAddress'][WLST_PATH], '/Server/ms1')
+        self.assertEqual(resolved[ATTRIBUTES]['ListenAddress'][WLST_TYPE], 'string')
+        self.assertEqual(resolved[FOLDERS]['Log'] is subfolder, True)
+
+        # the shared folder dictionary is not modified
+        self.assertEqual(folder[WLST_ATTRIBUTES_PATH], 'WP001')
+        self.assertEqual(folder[WLST_PATHS]['WP001'], '/Server/%SERVER%')
+        self.assertEqual(attribute[WLST_PATH], 'WP001')
+        self.assertEqual(WLST_SUBFOLDERS_PATH in folder, False)
+        return
+
+    def testResolvePathTokensMissingWlstPath(self):
+        folder = {
+            WLST_PATHS: {'WP001': '/Server/%SERVER%'},
+            WLST_ATTRIBUTES_PATH: 'WP001',
+            ATTRIBUTES: {'ListenAddress': {WLST_TYPE: 'string'}}
+        }
+        location = LocationContext().append_location('Server').add_name_token('SERVER', 'ms1')
+
+        resolved = alias_utils.resolve_path_tokens(location, '/Server', folder)
+        self.assertRaises(AliasException, resolved[ATTRIBUTES].__getitem__, 'ListenAddress')
+        return
+
     def __lists_are_equal(self, actual, expected):
         if actual is None and expected is None:
             return True, 'ok'
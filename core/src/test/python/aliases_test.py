@@ -15,15 +15,21 @@ from oracle.weblogic.deploy.aliases import TypeUtils
 from oracle.weblogic.deploy.aliases import VersionUtils
 
 from wlsdeploy.aliases import alias_utils
+from wlsdeploy.aliases.alias_constants import MODEL_NAME
+from wlsdeploy.aliases.alias_constants import WLST_PATH
+from wlsdeploy.aliases.alias_entries import AliasEntries
+from wlsdeploy.aliases.alias_entries import get_alias_entries
 from wlsdeploy.aliases.aliases import Aliases
 from wlsdeploy.aliases.location_context import LocationContext
 import wlsdeploy.aliases.model_constants as FOLDERS
 from wlsdeploy.aliases.validation_codes import ValidationCodes
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception import exception_helper
+from wlsdeploy.exception.expection_types import ExceptionType
 import wlsdeploy.logging.platform_logger as platform_logger
 from wlsdeploy.util.cla_utils import CommandLineArgUtil
 from wlsdeploy.util.model_context import ModelContext
+from wlsdeploy.util.weblogic_helper import WebLogicHelper
 
 
 class AliasesTestCase(unittest.TestCase):
@@ -1369,6 +1375,138 @@ class AliasesTestCase(unittest.TestCase):
         self.assertEquals(expected_list[0], actual_list[0])
         self.assertEquals(expected_list[1], actual_list[1])
 
+    def testAttributeNameQueryCache(self):
+        aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=self.wls_version)
+        location_1 = get_jdbc_driver_params_location('ds1', aliases)
+        location_2 = get_jdbc_driver_params_location('ds2', aliases)
+
+        names_1 = aliases.get_model_attribute_names(location_1)
+        hits, misses = aliases.get_query_cache_statistics()
+        self.assertEquals(0, hits)
+        self.assertEquals(1, misses)
+
+        # same model folders with different instance names should use the cached result
+        names_2 = aliases.get_model_attribute_names(location_2)
+        hits, misses = aliases.get_query_cache_statistics()
+        self.assertEquals(1, hits)
+        self.assertEquals(1, misses)
+        self.assertEquals(names_1, names_2)
+
+        # changes to a returned list should not affect the cached result
+        names_2.append('NotAnAttribute')
+        names_3 = aliases.get_model_attribute_names(location_1)
+        self.assertEquals(names_1, names_3)
+
+        aliases.get_model_uses_path_tokens_attribute_names(location_1)
+        aliases.get_model_uses_path_tokens_attribute_names(location_2, only_readable=True)
+        hits, misses = aliases.get_query_cache_statistics()
+        self.assertEquals(2, hits)
+        self.assertEquals(3, misses)
+
+    def testAttributeEntriesAreShared(self):
+        alias_entries = AliasEntries(wlst_mode=WlstModes.OFFLINE, wls_version=self.wls_version)
+        location_1 = get_jdbc_driver_params_location('ds1', self.aliases)
+        location_2 = get_jdbc_driver_params_location('ds2', self.aliases)
+
+        entry_1 = alias_entries.get_alias_attribute_entry_by_model_name(location_1, 'DriverName')
+        entry_2 = alias_entries.get_alias_attribute_entry_by_model_name(location_2, 'DriverName')
+        self.assertTrue(entry_1 is entry_2)
+        self.assertEquals('DriverName', entry_1.wlst_name)
+        self.assertEquals('DriverName', entry_1[MODEL_NAME])
+        self.assertFalse(WLST_PATH in entry_1)
+
+        wlst_entry = alias_entries.get_alias_attribute_entry_by_wlst_name(location_1, 'DriverName')
+        self.assertTrue(wlst_entry is entry_1)
+
+        # ignored WLST names are indexed with no entry, unknown names are errors
+        self.assertEquals(None, alias_entries.get_alias_attribute_entry_by_wlst_name(location_2, 'Name'))
+        self.assertRaises(AliasException, alias_entries.get_alias_attribute_entry_by_wlst_name, location_2,
+                          'NotAnAttribute')
+
+        entries = alias_entries.get_alias_attribute_entries_by_location(location_1)
+        self.assertTrue(entries['DriverName'] is entry_1)
+
+        # entries are returned by reference, so they must not allow changes
+        self.assertRaises(TypeError, setattr, entry_1, 'wlst_name', 'NotAnAttribute')
+        try:
+            entry_1[MODEL_NAME] = 'NotAnAttribute'
+            self.fail('attribute entry should not allow changes')
+        except (TypeError, AttributeError):
+            pass
+
+    def testContainedCategoriesLoadOnDemand(self):
+        alias_entries = AliasEntries(wlst_mode=WlstModes.OFFLINE, wls_version=self.wls_version)
+        location = LocationContext()
+        location.append_location(FOLDERS.RESOURCE_GROUP_TEMPLATE)
+        location.add_name_token(self.aliases.get_name_token(location), 'MyResourceGroupTemplate')
+
+        # the contained resource categories are only loaded when their parent folder is used
+        alias_entries.get_alias_attribute_entries_by_location(location)
+        alias_entries.get_dictionary_for_location(location)
+        self.assertEquals(1, alias_entries.get_loaded_category_count())
+
+        location.append_location(FOLDERS.JDBC_SYSTEM_RESOURCE)
+        alias_entries.get_alias_attribute_entries_by_location(location)
+        self.assertEquals(2, alias_entries.get_loaded_category_count())
+
+        location.append_location(FOLDERS.JDBC_RESOURCE)
+        alias_entries.get_alias_attribute_entries_by_location(location)
+        self.assertEquals(2, alias_entries.get_loaded_category_count())
+
+        # listing the subfolders loads the remaining contained categories
+        location.pop_location()
+        location.pop_location()
+        subfolder_names = alias_entries.get_model_subfolder_names_for_location(location)
+        self.assertTrue(FOLDERS.JDBC_SYSTEM_RESOURCE in subfolder_names)
+        self.assertTrue(alias_entries.get_loaded_category_count() > 2)
+
+    def testAliasEntriesAreSharedByAliases(self):
+        validate_aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE,
+                                   wls_version=self.wls_version, exception_type=ExceptionType.VALIDATE)
+        prepare_aliases = Aliases(model_context=self.model_context, wlst_mode=WlstModes.OFFLINE,
+                                  wls_version=self.wls_version, exception_type=ExceptionType.PREPARE)
+        self.assertTrue(validate_aliases._alias_entries is prepare_aliases._alias_entries)
+        self.assertTrue(self.aliases._alias_entries is prepare_aliases._alias_entries)
+        self.assertFalse(self.online_aliases._alias_entries is prepare_aliases._alias_entries)
+
+    def testAliasEntriesDefaultVersionIsShared(self):
+        actual_version = WebLogicHelper(self.logger).get_actual_weblogic_version()
+        default_entries = get_alias_entries(WlstModes.OFFLINE)
+        self.assertTrue(default_entries is get_alias_entries(WlstModes.OFFLINE, actual_version))
+        self.assertTrue(default_entries is get_alias_entries(WlstModes.OFFLINE, None))
+
+    def testCategoryLoadTimes(self):
+        location = LocationContext().append_location(FOLDERS.SERVER)
+        self.aliases.get_model_attribute_names(location)
+
+        load_times = self.aliases.get_category_load_times()
+        self.assertTrue(FOLDERS.SERVER in load_times)
+        self.assertTrue(load_times[FOLDERS.SERVER] >= 0)
+
+    def testGetModelAttributeNamesAndValues(self):
+        location = LocationContext().append_location(FOLDERS.SERVER)
+        token = self.aliases.get_name_token(location)
+        location.add_name_token(token, 'AdminServer')
+
+        wlst_values = [('ListenPort', 8001), ('Notes', ''), ('NoSuchAttribute', 'value'), ('ListenPort', 7001)]
+        results = self.aliases.get_model_attribute_names_and_values(location, wlst_values)
+        self.assertEqual(len(results), 4)
+
+        self.assertEqual(results[0], ('ListenPort', 'ListenPort', 8001, None))
+        self.assertEqual(results[1], ('Notes', 'Notes', None, None))
+        self.assertEqual(results[3], ('ListenPort', 'ListenPort', None, None))
+
+        wlst_name, model_name, model_value, error = results[2]
+        self.assertEqual(wlst_name, 'NoSuchAttribute')
+        self.assertEqual(model_name, None)
+        self.assertEqual(model_value, None)
+        self.assertNotEqual(error, None)
+
+        # the results match the single attribute method
+        for wlst_name, wlst_value in [('ListenPort', 8001), ('Notes', ''), ('ListenPort', 7001)]:
+            model_name, model_value = self.aliases.get_model_attribute_name_and_value(location, wlst_name, wlst_value)
+            self.assertTrue((wlst_name, model_name, model_value, None) in results)
+
 
 def get_jdbc_ds_params_location(name, aliases):
     location = get_jdbc_resource_location(name, aliases)
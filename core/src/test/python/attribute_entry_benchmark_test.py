@@ -0,0 +1,62 @@
+"""
+Copyright (c) 2023, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Times the per-attribute alias entry lookup, comparing the deep copy of each attribute dictionary
+that the lookups used to return with the shared read-only entries they return now.
+The scale is the number of lookups of each server attribute.
+"""
+import copy
+
+from java.lang import System as JSystem
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from base_benchmark_test import BaseBenchmarkTestCase
+from base_benchmark_test import elapsed_millis
+from wlsdeploy.aliases.alias_constants import ATTRIBUTES
+from wlsdeploy.aliases.alias_constants import WLST_PATH
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.model_constants import SERVER
+from wlsdeploy.aliases.wlst_modes import WlstModes
+
+
+class AttributeEntryBenchmarkTestCase(BaseBenchmarkTestCase):
+    _report_name = 'attribute-entry-benchmark'
+    _report_timings = OrderedDict()
+    _report_values = OrderedDict()
+
+    def testAttributeEntryLookup(self):
+        aliases = Aliases(self.model_context, wlst_mode=WlstModes.OFFLINE, wls_version=self._wls_version)
+        alias_entries = aliases._alias_entries
+        location = LocationContext().append_location(SERVER)
+        location.add_name_token(aliases.get_name_token(location), 'server-1')
+        attributes = alias_entries.get_dictionary_for_location(location, False)[ATTRIBUTES]
+        attribute_names = attributes.keys()
+
+        # the lookups before, which copied the attribute dictionary and removed the unresolved path
+        start = JSystem.nanoTime()
+        for count in range(self.scale):
+            for attribute_name in attribute_names:
+                entry = copy.deepcopy(attributes[attribute_name])
+                if WLST_PATH in entry:
+                    del entry[WLST_PATH]
+        self._report_timings['copiedEntryLookup'] = elapsed_millis(start)
+
+        start = JSystem.nanoTime()
+        for count in range(self.scale):
+            for attribute_name in attribute_names:
+                entry = alias_entries.get_alias_attribute_entry_by_model_name(location, attribute_name)
+        self._report_timings['sharedEntryLookup'] = elapsed_millis(start)
+
+        lookup_count = self.scale * len(attribute_names)
+        self._report_values['lookupCount'] = lookup_count
+        self.assertTrue(lookup_count > 0)
+
+        # the shared entry is returned for each lookup, and matches a copy without the path
+        first_name = attribute_names[0]
+        expected = copy.deepcopy(attributes[first_name])
+        del expected[WLST_PATH]
+        entry = alias_entries.get_alias_attribute_entry_by_model_name(location, first_name)
+        self.assertTrue(entry is alias_entries.get_alias_attribute_entry_by_model_name(location, first_name))
+        self.assertEqual(entry, expected)
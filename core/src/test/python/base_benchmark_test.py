@@ -0,0 +1,92 @@
+"""
+Copyright (c) 2023, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+
+from java.lang import System as JSystem
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+from base_test import BaseTestCase
+from wlsdeploy.json.json_translator import PythonToJson
+from wlsdeploy.util import env_helper
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class BaseBenchmarkTestCase(BaseTestCase):
+    """
+    Base class for the benchmark tests.
+    Each subclass times its operations against synthetic models, and writes the timings to a JSON report
+    that can be compared between builds.  The report is rewritten after each test.
+
+    The model sizes default to a small scale so the normal unit test run stays fast.  For a large
+    benchmark, set the WDT_BENCHMARK_SCALE environment variable, such as to 2000.  Each subclass
+    describes how it sizes its models from the scale.  The reports are written to the
+    unit-tests/benchmark directory, unless the WDT_BENCHMARK_REPORT_DIR environment variable
+    specifies a different directory.
+    """
+    _wls_version = '14.1.1.0.0'
+    _default_scale = 20
+    _cluster_name = 'cluster-1'
+
+    # subclasses declare these, to collect the timings and values for their report
+    _report_name = None
+    _report_timings = None
+    _report_values = None
+
+    def __init__(self, *args):
+        BaseTestCase.__init__(self, *args)
+        self.OUTPUT_DIR = os.path.join(self.TEST_OUTPUT_DIR, 'benchmark')
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._establish_directory(self.OUTPUT_DIR)
+
+        arg_map = {
+            CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+            CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+        }
+        self.model_context = ModelContext(self._report_name, arg_map)
+        self.scale = int(env_helper.getenv('WDT_BENCHMARK_SCALE', str(self._default_scale)))
+
+    def tearDown(self):
+        self._write_report()
+        BaseTestCase.tearDown(self)
+
+    def _add_report_details(self, report):
+        """
+        Add any details to the report, after the timings.  Subclasses can override this.
+        :param report: the report dictionary
+        """
+        pass
+
+    def _write_report(self):
+        """
+        Write the report with the timings and values collected so far.
+        """
+        report_dir = env_helper.getenv('WDT_BENCHMARK_REPORT_DIR', self.OUTPUT_DIR)
+        report_file = os.path.join(report_dir, '%s-%s.json' % (self._report_name, self.scale))
+        report = OrderedDict()
+        report['wdtVersion'] = WebLogicDeployToolingVersion.getVersion()
+        report['wlsVersion'] = self._wls_version
+        report['scale'] = self.scale
+        for key in self._report_values:
+            report[key] = self._report_values[key]
+        report['timings'] = self._report_timings
+        self._add_report_details(report)
+        PythonToJson(report).write_to_json_file(report_file)
+
+        self.assertTrue(os.path.isfile(report_file))
+        for key in self._report_timings:
+            self.assertTrue(self._report_timings[key] >= 0, key + ' timing should not be negative')
+
+
+def elapsed_millis(start_nanos):
+    """
+    Get the milliseconds since the start time.
+    :param start_nanos: the start time from System.nanoTime()
+    :return: the elapsed milliseconds
+    """
+    return (JSystem.nanoTime() - start_nanos) / 1000000.0
@@ -0,0 +1,109 @@
+"""
+Copyright (c) 2023, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Times filtering unused credentials for a synthetic model, and checks that the time scales linearly.
+The model has 2.5 datasource credentials for each unit of scale, with a minimum of 1,000.
+The timings depend on the host, so this benchmark only runs when WDT_BENCHMARK_SCALE is set.
+credential_injector_test checks the linear scaling in the normal unit test run, by counting the work.
+"""
+from java.lang import System as JSystem
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from base_benchmark_test import BaseBenchmarkTestCase
+from base_benchmark_test import elapsed_millis
+from wlsdeploy.aliases.model_constants import JDBC_DRIVER_PARAMS
+from wlsdeploy.aliases.model_constants import JDBC_RESOURCE
+from wlsdeploy.aliases.model_constants import JDBC_SYSTEM_RESOURCE
+from wlsdeploy.aliases.model_constants import PASSWORD_ENCRYPTED
+from wlsdeploy.aliases.model_constants import RESOURCES
+from wlsdeploy.aliases.model_constants import URL
+from wlsdeploy.tool.util.credential_injector import CredentialInjector
+from wlsdeploy.util import env_helper
+
+
+class CredentialInjectorBenchmarkTestCase(BaseBenchmarkTestCase):
+    _report_name = 'credential-injector-benchmark'
+    _report_timings = OrderedDict()
+    _report_values = OrderedDict()
+    _min_credentials = 1000
+    _filter_runs = 3
+
+    def setUp(self):
+        BaseBenchmarkTestCase.setUp(self)
+        self._suspend_logs('wlsdeploy.tool.util')
+
+    def tearDown(self):
+        BaseBenchmarkTestCase.tearDown(self)
+        self._restore_logs()
+
+    def testFilterCredentials(self):
+        # the timing comparison could fail on a busy host, so it is only run for a requested benchmark
+        if env_helper.getenv('WDT_BENCHMARK_SCALE') is None:
+            return
+
+        # enough credentials for the timings to be measured, even at a small scale
+        credential_count = max(self.scale * 5 / 2, self._min_credentials)
+
+        # the first run warms up the code, so it is not compared
+        self._time_filter_credentials(credential_count)
+        small_millis = self._time_filter_credentials(credential_count)
+        large_millis = self._time_filter_credentials(credential_count * 4)
+        self._report_timings['filterCredentials-%s' % credential_count] = small_millis
+        self._report_timings['filterCredentials-%s' % (credential_count * 4)] = large_millis
+
+        # a linear filter takes about four times as long for four times the credentials, and a quadratic one
+        # sixteen times as long.  The smaller time has a floor of one millisecond, for the timer resolution.
+        limit_millis = 8 * max(small_millis, 1.0)
+        self.assertTrue(large_millis <= limit_millis,
+                        'filtering %s credentials took %s ms, more than %s ms for linear scaling from %s ms for %s' %
+                        (credential_count * 4, large_millis, limit_millis, small_millis, credential_count))
+
+    def _time_filter_credentials(self, credential_count):
+        """
+        Time filtering the unused credentials for a model with the specified number of credentials.
+        The filter is run several times, each with a new credential cache, and the fastest time is used.
+        :param credential_count: the number of credentials in the model and the cache
+        :return: the fastest time in milliseconds
+        """
+        credential_model = _create_credential_model(credential_count)
+        result = None
+        for run in range(self._filter_runs):
+            injector = CredentialInjector(self._report_name, credential_model, self.model_context,
+                                          version=self._wls_version)
+            for index in range(credential_count):
+                injector.add_to_cache(token_name='ds-%s.password' % index, token_value='welcome1')
+            start = JSystem.nanoTime()
+            injector.filter_unused_credentials(credential_model)
+            elapsed = elapsed_millis(start)
+            if result is None or elapsed < result:
+                result = elapsed
+            self.assertEqual(len(injector.get_variable_cache()), credential_count / 2)
+        return result
+
+
+def _create_credential_model(credential_count):
+    """
+    Create resources with the specified number of datasources.
+    The datasources with even numbers have a password token, and the others have a plain password.
+    :param credential_count: the number of datasources
+    :return: the model
+    """
+    datasources = OrderedDict()
+    for index in range(credential_count):
+        if index % 2:
+            password = 'welcome1'
+        else:
+            password = '@@PROP:ds-%s.password@@' % index
+        datasources['ds-%s' % index] = {
+            JDBC_RESOURCE: {
+                JDBC_DRIVER_PARAMS: {
+                    URL: 'jdbc:oracle:thin:@//db-%s.example.com:1521/pdb' % index,
+                    PASSWORD_ENCRYPTED: password
+                }
+            }
+        }
+
+    model = OrderedDict()
+    model[RESOURCES] = {JDBC_SYSTEM_RESOURCE: datasources}
+    return model
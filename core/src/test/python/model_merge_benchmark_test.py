@@ -0,0 +1,73 @@
+"""
+Copyright (c) 2023, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Times merging model fragments whose keys use variables and delete notation.
+The scale is the number of servers in each fragment.
+"""
+from java.lang import System as JSystem
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from base_benchmark_test import BaseBenchmarkTestCase
+from base_benchmark_test import elapsed_millis
+from wlsdeploy.aliases.model_constants import CLUSTER
+from wlsdeploy.aliases.model_constants import LISTEN_PORT
+from wlsdeploy.aliases.model_constants import SERVER
+from wlsdeploy.aliases.model_constants import TOPOLOGY
+from wlsdeploy.util import cla_helper
+
+
+class ModelMergeBenchmarkTestCase(BaseBenchmarkTestCase):
+    _report_name = 'model-merge-benchmark'
+    _report_timings = OrderedDict()
+    _report_values = OrderedDict()
+
+    def testMergeFragments(self):
+        fragment, update_fragment, variable_map = _create_merge_fragments(self.scale)
+        start = JSystem.nanoTime()
+        cla_helper.merge_model_dictionaries(fragment, update_fragment, variable_map)
+        self._report_timings['mergeFragments'] = elapsed_millis(start)
+
+        # a quarter of the servers are deleted, and a quarter are added
+        deleted_count = len(range(1, self.scale, 4))
+        added_count = len(range(3, self.scale, 4))
+        merged_servers = fragment[TOPOLOGY][SERVER]
+        self.assertEqual(len(merged_servers), self.scale - deleted_count + added_count)
+        self.assertEqual(merged_servers['server-0'][LISTEN_PORT], 7000)
+        self.assertFalse('server-1' in merged_servers)
+
+
+def _create_merge_fragments(server_count):
+    """
+    Create two topology fragments with the specified number of servers, and the variables to merge them.
+    In the update fragment, half of the servers are named with variables that resolve to existing names,
+    a quarter delete existing servers, and a quarter are new, so no key in the update matches exactly.
+    :param server_count: the number of servers in each fragment
+    :return: the fragment, the update fragment, and the variable map
+    """
+    servers = OrderedDict()
+    update_servers = OrderedDict()
+    variable_map = {}
+    for index in range(server_count):
+        servers['server-%s' % index] = {
+            LISTEN_PORT: 8000 + index,
+            CLUSTER: ModelMergeBenchmarkTestCase._cluster_name
+        }
+
+        if index % 2 == 0:
+            variable_map['server.name.%s' % index] = 'server-%s' % index
+            update_servers['@@PROP:server.name.%s@@' % index] = {
+                LISTEN_PORT: 7000 + index
+            }
+        elif index % 4 == 1:
+            update_servers['!server-%s' % index] = {}
+        else:
+            update_servers['server-%s' % (server_count + index)] = {
+                LISTEN_PORT: 8000 + server_count + index
+            }
+
+    fragment = OrderedDict()
+    fragment[TOPOLOGY] = {SERVER: servers}
+    update_fragment = OrderedDict()
+    update_fragment[TOPOLOGY] = {SERVER: update_servers}
+    return fragment, update_fragment, variable_map
@@ -1,10 +1,11 @@
 """
-Copyright (c) 2017, 2021, Oracle and/or its affiliates.
+Copyright (c) 2017, 2023, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
 import unittest
 
+from wlsdeploy.util import model_translator
 from wlsdeploy.util.model_translator import FileToPython, PythonToFile
 
 class TranslatorTestCase(unittest.TestCase):
@@ -90,3 +91,31 @@ class TranslatorTestCase(unittest.TestCase):
         self.assertEqual(newPythonDict['bar'], pythonDict['bar'])
         self.assertEqual(newPythonDict['baz'], pythonDict['baz'])
         self.assertEqual(newPythonDict['newline'], pythonDict['newline'])
+
+    def testKeptModelIsParsedOnce(self):
+        parse_counts = model_translator._parse_counts
+        parsed = parse_counts['parsed']
+        reused = parse_counts['reused']
+
+        model_translator.load_model_file(self._src_yaml_file)
+        pythonDict = model_translator.parse_model_file(self._src_yaml_file)
+        self.assertEqual(pythonDict['bar'], 'test "legal" yaml')
+        self.assertEqual(parse_counts['parsed'], parsed + 1)
+        self.assertEqual(parse_counts['reused'], reused + 1)
+
+        # the kept model was given to the first caller, so the file is parsed again
+        otherDict = model_translator.parse_model_file(self._src_yaml_file)
+        self.assertEqual(otherDict, pythonDict)
+        self.assertEqual(parse_counts['parsed'], parsed + 2)
+        self.assertEqual(parse_counts['reused'], reused + 1)
+
+    def testReleaseKeptModels(self):
+        parse_counts = model_translator._parse_counts
+        reused = parse_counts['reused']
+
+        # a tool that fails after loading a model releases it, so it is not reused by a later parse
+        model_translator.load_model_file(self._src_yaml_file)
+        model_translator.release_kept_models()
+        self.assertEqual(len(model_translator._kept_models), 0)
+        model_translator.parse_model_file(self._src_yaml_file)
+        self.assertEqual(parse_counts['reused'], reused)
@@ -0,0 +1,63 @@
+"""
+Copyright (c) 2023, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Times substituting variable tokens in a synthetic model.
+The model has 50 attribute values for each unit of scale.
+"""
+from java.lang import System as JSystem
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from base_benchmark_test import BaseBenchmarkTestCase
+from base_benchmark_test import elapsed_millis
+from wlsdeploy.aliases.model_constants import SERVER
+from wlsdeploy.aliases.model_constants import TOPOLOGY
+from wlsdeploy.util import variables
+
+
+class VariablesBenchmarkTestCase(BaseBenchmarkTestCase):
+    _report_name = 'variables-benchmark'
+    _report_timings = OrderedDict()
+    _report_values = OrderedDict()
+    _values_per_scale = 50
+
+    def testSubstituteVariables(self):
+        value_count = self.scale * self._values_per_scale
+        substitution_model, variable_map = _create_substitution_model(value_count)
+        start = JSystem.nanoTime()
+        variables.substitute(substitution_model, variable_map, self.model_context)
+        self._report_timings['substituteVariables'] = elapsed_millis(start)
+
+        self._report_values['valueCount'] = value_count
+        substituted_server = substitution_model[TOPOLOGY][SERVER]['server-1']
+        self.assertEqual(substituted_server['ListenAddress'], 'host-1.example.com')
+        self.assertEqual(substituted_server['Notes'], 'server 1 in domain benchmark_domain')
+
+
+def _create_substitution_model(value_count):
+    """
+    Create a topology with the specified number of attribute values, and the variables to substitute them.
+    Half of the values have no tokens, and the others have one or two @@PROP tokens.
+    :param value_count: the number of attribute values, ten for each server
+    :return: the model, and the variable map
+    """
+    servers = OrderedDict()
+    variable_map = {'domain.name': 'benchmark_domain'}
+    for index in range(value_count / 10):
+        variable_map['host.%s' % index] = 'host-%s.example.com' % index
+        servers['server-%s' % index] = {
+            'ListenAddress': '@@PROP:host.%s@@' % index,
+            'Notes': 'server %s in domain @@PROP:domain.name@@' % index,
+            'Machine': 'machine-%s' % index,
+            'Cluster': VariablesBenchmarkTestCase._cluster_name,
+            'ExternalDnsName': '@@PROP:host.%s@@' % index,
+            'JavaCompiler': 'javac',
+            'ClientCertProxyEnabled': 'false',
+            'StartupMode': 'RUNNING',
+            'ListenAddressURL': 'http://@@PROP:host.%s@@:@@PROP:domain.name@@' % index,
+            'GracefulShutdownTimeout': '@@PROP:domain.name@@'
+        }
+
+    model = OrderedDict()
+    model[TOPOLOGY] = {SERVER: servers}
+    return model, variable_map
@@ -80,6 +80,31 @@ class VariablesTestCase(unittest.TestCase):
         variables.substitute(model, {}, self.model_context)
         self.assertEqual(model['domainInfo']['AdminUserName'], 'file-variable-value')
 
+    def testFileVariableIsReadOnce(self):
+        """
+        A file used by several @@FILE tokens is read once, and read again when it changes.
+        """
+        output_dir = '../../unit-tests'
+        if not os.path.isdir(output_dir):
+            os.makedirs(output_dir)
+        path = output_dir + '/file-variable-read-once.txt'
+        _write_text(path, 'first-value\n')
+        variables._clear_file_token_values()
+
+        token = '@@FILE:' + path + '@@'
+        model = {'domainInfo': {'AdminUserName': token, 'AdminPassword': token}}
+        reads = variables._file_token_counts['read']
+        variables.substitute(model, {}, self.model_context)
+        self.assertEqual(model['domainInfo']['AdminUserName'], 'first-value')
+        self.assertEqual(model['domainInfo']['AdminPassword'], 'first-value')
+        self.assertEqual(variables._file_token_counts['read'], reads + 1)
+
+        _write_text(path, 'the-second-value\n')
+        model = {'domainInfo': {'AdminUserName': token}}
+        variables.substitute(model, {}, self.model_context)
+        self.assertEqual(model['domainInfo']['AdminUserName'], 'the-second-value')
+        self.assertEqual(variables._file_token_counts['read'], reads + 2)
+
     def testFileVariableNotFound(self):
         try:
             path = self._resources_dir + '/no-file.txt'
@@ -103,6 +128,21 @@ class VariablesTestCase(unittest.TestCase):
         variables.substitute(model, {}, self.model_context)
         self.assertEqual(model['domainInfo']['AdminUserName'], 'file-variable-value')
 
+    def testVariableWithEnvironmentVariable(self):
+        """
+        A variable value may contain tokens that are resolved after variables, but not other variables.
+        """
+        os.environ['envVariable'] = 'the-admin-user'
+        model = {'domainInfo': {'AdminUserName': 'a-@@PROP:user@@-b', 'AdminPassword': '@@PROP:password@@'}}
+        try:
+            variables.substitute(model, {'user': '@@ENV:envVariable@@', 'password': '@@PROP:user@@'},
+                                 self.model_context)
+        except VariableException:
+            pass
+        else:
+            self.fail('Test must raise VariableException when a variable value contains a variable')
+        self.assertEqual(model['domainInfo']['AdminUserName'], 'a-the-admin-user-b')
+
     def testEnvironmentVariableNotFound(self):
         try:
             model = {'domainInfo': {'AdminUserName': '@@ENV:notaVariable@@'}}
@@ -136,6 +176,22 @@ class VariablesTestCase(unittest.TestCase):
         variables.substitute(model, {}, self.model_context)
         self.assertEqual(model['domainInfo']['AdminUserName'], 'mySecret1')
 
+    def testSecretTokenIsReadOnUse(self):
+        """
+        Verify that secret files are listed when the first secret is resolved, but only read when they are used.
+        """
+        os.environ['WDT_MODEL_SECRETS_DIRS'] = self._resources_dir + "/secrets"
+        os.environ['WDT_MODEL_SECRETS_NAME_DIR_PAIRS'] = "dirY=" + self._resources_dir + "/secrets"
+        model = {'domainInfo': {'AdminUserName': '@@SECRET:dirY:secret1@@', 'AdminPassword': '@@SECRET:dirY:secret1@@'}}
+        variables._clear_secret_token_map()
+        variables._clear_file_token_values()
+        reads = variables._file_token_counts['read']
+        variables.substitute(model, {}, self.model_context)
+        self.assertEqual(model['domainInfo']['AdminUserName'], 'mySecret1')
+        self.assertEqual(model['domainInfo']['AdminPassword'], 'mySecret1')
+        self.assertEqual(variables._file_token_counts['read'], reads + 1)
+        self.assertEqual(variables._list_known_secret_tokens(), "'dirY:secret1', 'my-secrets:secret2'")
+
     def testSecretTokenNotFound(self):
         try:
             model = {'domainInfo': {'AdminUserName': '@@SECRET:noName:noKey@@'}}
@@ -195,5 +251,13 @@ class VariablesTestCase(unittest.TestCase):
             self.fail('Test must raise VariableException when token has a syntax error')
 
 
+def _write_text(file_name, text):
+    text_file = open(file_name, 'w')
+    try:
+        text_file.write(text)
+    finally:
+        text_file.close()
+
+
 if __name__ == '__main__':
     unittest.main()
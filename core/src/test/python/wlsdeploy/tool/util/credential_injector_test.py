@@ -0,0 +1,123 @@
+"""
+Copyright (c) 2023, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from base_test import BaseTestCase
+from wlsdeploy.aliases.model_constants import JDBC_DRIVER_PARAMS
+from wlsdeploy.aliases.model_constants import JDBC_RESOURCE
+from wlsdeploy.aliases.model_constants import JDBC_SYSTEM_RESOURCE
+from wlsdeploy.aliases.model_constants import PASSWORD_ENCRYPTED
+from wlsdeploy.aliases.model_constants import RESOURCES
+from wlsdeploy.aliases.model_constants import URL
+from wlsdeploy.tool.util.credential_injector import CredentialInjector
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class CredentialInjectorTestCase(BaseTestCase):
+    _program_name = 'credential_injector_test'
+    _wls_version = '14.1.1.0.0'
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._suspend_logs('wlsdeploy.tool.util')
+
+        arg_map = {
+            CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+            CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+        }
+        self.model_context = ModelContext(self._program_name, arg_map)
+
+    def tearDown(self):
+        BaseTestCase.tearDown(self)
+        self._restore_logs()
+
+    def testFilterUnusedCredentials(self):
+        injector = self._filter_credentials(10)
+        variable_cache = injector.get_variable_cache()
+        self.assertEqual(len(variable_cache), 5)
+        self.assertTrue('ds-0.password' in variable_cache)
+        self.assertFalse('ds-1.password' in variable_cache)
+
+    def testFilterCredentialsScalesLinearly(self):
+        # each model dictionary is visited once, and each cache key is checked once against the model variables
+        for credential_count in [100, 400]:
+            injector = self._filter_credentials(credential_count)
+            self.assertEqual(injector.visit_count, 3 + (3 * credential_count))
+            self.assertEqual(injector.model_variables.check_count, credential_count)
+            self.assertEqual(len(injector.get_variable_cache()), credential_count / 2)
+
+    def _filter_credentials(self, credential_count):
+        """
+        Filter the unused credentials for a model with the specified number of datasources,
+        and a cache with a credential for each of them.
+        :param credential_count: the number of datasources and cache entries
+        :return: the counting injector that was used
+        """
+        model = _create_credential_model(credential_count)
+        injector = _CountingCredentialInjector(self._program_name, model, self.model_context,
+                                               version=self._wls_version)
+        for index in range(credential_count):
+            injector.add_to_cache(token_name='ds-%s.password' % index, token_value='welcome1')
+        injector.filter_unused_credentials(model)
+        return injector
+
+
+class _CountingCredentialInjector(CredentialInjector):
+    """
+    A credential injector that counts the model dictionaries it visits, and the checks against the model variables.
+    """
+    def __init__(self, program_name, model, model_context, version=None):
+        CredentialInjector.__init__(self, program_name, model, model_context, version=version)
+        self.visit_count = 0
+        self.model_variables = None
+
+    def _get_model_variables(self, model_dictionary):
+        self.model_variables = _CountingSet(CredentialInjector._get_model_variables(self, model_dictionary))
+        return self.model_variables
+
+    def _add_model_variables(self, model_dictionary, variables):
+        self.visit_count += 1
+        CredentialInjector._add_model_variables(self, model_dictionary, variables)
+
+
+class _CountingSet(dict):
+    """
+    A dictionary used as a set, that counts the membership checks.
+    """
+    def __init__(self, values):
+        dict.__init__(self, values)
+        self.check_count = 0
+
+    def __contains__(self, key):
+        self.check_count += 1
+        return dict.__contains__(self, key)
+
+
+def _create_credential_model(credential_count):
+    """
+    Create resources with the specified number of datasources.
+    The datasources with even numbers have a password token, and the others have a plain password.
+    :param credential_count: the number of datasources
+    :return: the model
+    """
+    datasources = OrderedDict()
+    for index in range(credential_count):
+        if index % 2:
+            password = 'welcome1'
+        else:
+            password = '@@PROP:ds-%s.password@@' % index
+        datasources['ds-%s' % index] = {
+            JDBC_RESOURCE: {
+                JDBC_DRIVER_PARAMS: {
+                    URL: 'jdbc:oracle:thin:@//db-%s.example.com:1521/pdb' % index,
+                    PASSWORD_ENCRYPTED: password
+                }
+            }
+        }
+
+    model = OrderedDict()
+    model[RESOURCES] = {JDBC_SYSTEM_RESOURCE: datasources}
+    return model
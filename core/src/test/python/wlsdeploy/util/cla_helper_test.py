@@ -5,6 +5,11 @@ Licensed under the Universal Permissive License v1.0 as shown at http://oss.orac
 import os
 import shutil
 
+from java.io import File
+from java.nio.file import Files
+from java.nio.file.attribute import PosixFilePermissions
+from oracle.weblogic.deploy.util import TranslateException
+
 from base_test import BaseTestCase
 from wlsdeploy.aliases.aliases import Aliases
 from wlsdeploy.aliases.wlst_modes import WlstModes
@@ -162,6 +167,65 @@ class ClaHelperTest(BaseTestCase):
         server = self._check_single_server(dictionary, 'm1')
         self.assertEquals(2, len(server), "server should have two attributes")
 
+    # model files that are parsed concurrently should be merged in the order they were specified,
+    # and an error should be reported for the first file in the list that failed.
+    def testMergeModelFilesInOrder(self):
+        self._establish_directory(self.OUTPUT_DIR)
+        model_files = []
+        for index in range(6):
+            model_file = os.path.join(self.OUTPUT_DIR, 'merge-model-%s.yaml' % index)
+            _write_text(model_file, 'topology:\n    Server:\n        m1:\n            ListenPort: %s\n'
+                        '        m%s:\n            ListenPort: 9000\n' % (8000 + index, index + 2))
+            model_files.append(model_file)
+
+        merged = cla_helper.merge_model_files(','.join(model_files))
+        servers = merged['topology']['Server']
+        self.assertEquals(8005, servers['m1']['ListenPort'], "last model file should set m1 listen port")
+        self.assertEquals(['m1', 'm2', 'm3', 'm4', 'm5', 'm6', 'm7'], list(servers.keys()))
+
+        bad_file = os.path.join(self.OUTPUT_DIR, 'merge-model-bad.yaml')
+        _write_text(bad_file, 'topology: [ 1, 2\n')
+        try:
+            cla_helper.merge_model_files(','.join([model_files[0], bad_file, model_files[1]]))
+            self.fail('merge should fail for ' + bad_file)
+        except TranslateException, te:
+            self.assertTrue(te.getLocalizedMessage().find('merge-model-bad.yaml') >= 0)
+
+    # a merged model saved in the cache directory should be used for the same model files and variables,
+    # and a change to the variables should use a different cache file.
+    def testMergeModelFilesWithCache(self):
+        cache_dir = os.path.join(self.OUTPUT_DIR, 'model-cache')
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+        self._establish_directory(cache_dir)
+
+        model_files = []
+        for index in range(2):
+            model_file = os.path.join(self.OUTPUT_DIR, 'cache-model-%s.yaml' % index)
+            _write_text(model_file, 'topology:\n    Server:\n        m%s:\n            ListenPort: 9000\n' % index)
+            model_files.append(model_file)
+        model_file_value = ','.join(model_files)
+
+        merged = cla_helper.merge_model_files(model_file_value, {'port': '9000'}, cache_dir)
+        self.assertEquals(['m0', 'm1'], list(merged['topology']['Server'].keys()))
+        cache_files = os.listdir(cache_dir)
+        self.assertEquals(1, len(cache_files), "merged model should be saved in the cache directory")
+
+        # the saved model is not substituted, so only the owner can read it
+        if File.separatorChar != '\\':
+            cache_path = File(cache_dir, cache_files[0]).toPath()
+            permissions = PosixFilePermissions.toString(Files.getPosixFilePermissions(cache_path))
+            self.assertEquals('rw-------', permissions, "saved model should only be readable by the owner")
+
+        # replace the saved model, to show that it is used instead of the model files
+        _write_text(os.path.join(cache_dir, cache_files[0]), 'topology:\n    Server:\n        cached: {}\n')
+        merged = cla_helper.merge_model_files(model_file_value, {'port': '9000'}, cache_dir)
+        self.assertEquals(['cached'], list(merged['topology']['Server'].keys()))
+
+        merged = cla_helper.merge_model_files(model_file_value, {'port': '9001'}, cache_dir)
+        self.assertEquals(['m0', 'm1'], list(merged['topology']['Server'].keys()))
+        self.assertEquals(2, len(os.listdir(cache_dir)), "different variables should use a different cache file")
+
     def testPersistModelAfterFilter(self):
         """
         Verify filter was run and changes are persisted to model file
@@ -244,3 +308,11 @@ def _build_variable_map():
         "server1a": "m1",
         "server1b": "m1"
     }
+
+
+def _write_text(file_name, text):
+    model_file = open(file_name, 'w')
+    try:
+        model_file.write(text)
+    finally:
+        model_file.close()
@@ -79,6 +79,7 @@ ECHO              [-domain_type ^<domain_type^>]
 ECHO              [-java_home ^<java_home^>]
 ECHO              [-archive_file ^<archive_file^>]
 ECHO              [-variable_file ^<variable_file^>]
+ECHO              [-model_cache_dir ^<model_cache_dir^>]
 ECHO              [-passphrase_env ^<passphrase_env^>]
 ECHO              [-passphrase_file ^<passphrase_file^>]
 ECHO              [-opss_wallet] ^<opss_wallet_file^>]
@@ -133,6 +134,15 @@ ECHO                           be specified as a comma-separated list of propert
 ECHO                           files, where each successive set of properties layers
 ECHO                           on top of the previous ones.
 ECHO.
+ECHO         model_cache_dir - the directory for saved merged models.  A merged model
+ECHO                           is saved for the model files and variables, and is used
+ECHO                           by later runs with the same files and variables instead
+ECHO                           of merging the model files again.
+ECHO                           The saved models are not substituted, so they
+ECHO                           contain any passwords from the model files.  The
+ECHO                           files are only readable by their owner, and are
+ECHO                           not deleted by the tool.
+ECHO.
 ECHO         passphrase_env  - An alternative to entering the encryption passphrase
 ECHO                           at a prompt. The value is an ENVIRONMENT VARIABLE name
 ECHO                           that WDT will use to retrieve the passphrase.
@@ -40,6 +40,7 @@ usage() {
   echo "          [-java_home <java_home>]"
   echo "          [-archive_file <archive_file>]"
   echo "          [-variable_file <variable_file>]"
+  echo "          [-model_cache_dir <model_cache_dir>]"
   echo "          [-opss_wallet <opss_wallet_file>]"
   echo "          [-opss_wallet_passphrase_env <opss_wallet_passphrase_env>]"
   echo "          [-opss_wallet_passphrase_file <opss_wallet_passphrase_file>]"
@@ -94,6 +95,15 @@ usage() {
   echo "                          files, where each successive set of properties layers"
   echo "                          on top of the previous ones."
   echo ""
+  echo "        model_cache_dir - the directory for saved merged models.  A merged model"
+  echo "                          is saved for the model files and variables, and is used"
+  echo "                          by later runs with the same files and variables instead"
+  echo "                          of merging the model files again."
+  echo "                          The saved models are not substituted, so they"
+  echo "                          contain any passwords from the model files.  The"
+  echo "                          files are only readable by their owner, and are"
+  echo "                          not deleted by the tool."
+  echo ""
   echo "        passphrase_env  - An alternative to entering the encryption passphrase"
   echo "                          at a prompt. The value is an ENVIRONMENT VARIABLE name"
   echo "                          that WDT will use to retrieve the passphrase."
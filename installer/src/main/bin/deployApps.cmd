@@ -75,6 +75,7 @@ ECHO              [-domain_home ^<domain_home^>]
 ECHO              -model_file ^<model_file^>
 ECHO              [-archive_file ^<archive_file^>]
 ECHO              [-variable_file ^<variable_file^>]
+ECHO              [-model_cache_dir ^<model_cache_dir^>]
 ECHO              [-domain_type ^<domain_type^>]
 ECHO              [-passphrase_env ^<passphrase_env^>]
 ECHO              [-passphrase_file ^<passphrase_file^>]
@@ -113,6 +114,15 @@ ECHO                           be specified as a comma-separated list of propert
 ECHO                           files, where each successive set of properties layers
 ECHO                           on top of the previous ones.
 ECHO.
+ECHO         model_cache_dir - the directory for saved merged models.  A merged model
+ECHO                           is saved for the model files and variables, and is used
+ECHO                           by later runs with the same files and variables instead
+ECHO                           of merging the model files again.
+ECHO                           The saved models are not substituted, so they
+ECHO                           contain any passwords from the model files.  The
+ECHO                           files are only readable by their owner, and are
+ECHO                           not deleted by the tool.
+ECHO.
 ECHO         domain_type     - the type of domain (e.g., WLS, JRF).
 ECHO                           Used to locate wlst.cmd if -wlst_path not specified
 ECHO.
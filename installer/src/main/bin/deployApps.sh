@@ -36,6 +36,7 @@ usage() {
   echo "          -model_file <model_file>"
   echo "          [-archive_file <archive_file>]"
   echo "          [-variable_file <variable_file>]"
+  echo "          [-model_cache_dir <model_cache_dir>]"
   echo "          [-domain_type <domain_type>]"
   echo "          [-passphrase_env <passphrase_env>]"
   echo "          [-passphrase_file <passphrase_file>]"
@@ -74,6 +75,15 @@ usage() {
   echo "                          files, where each successive set of properties layers"
   echo "                          on top of the previous ones."
   echo ""
+  echo "        model_cache_dir - the directory for saved merged models.  A merged model"
+  echo "                          is saved for the model files and variables, and is used"
+  echo "                          by later runs with the same files and variables instead"
+  echo "                          of merging the model files again."
+  echo "                          The saved models are not substituted, so they"
+  echo "                          contain any passwords from the model files.  The"
+  echo "                          files are only readable by their owner, and are"
+  echo "                          not deleted by the tool."
+  echo ""
   echo "        domain_type     - the type of domain (e.g., WLS, JRF)."
   echo "                          Used to locate wlst.cmd if -wlst_path not specified."
   echo ""
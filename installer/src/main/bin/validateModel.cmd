@@ -76,6 +76,7 @@ ECHO Usage: %SCRIPT_NAME% [-help]
 ECHO              [-oracle_home ^<oracle_home^>]
 ECHO              -model_file ^<model_file^>
 ECHO              [-variable_file ^<variable_file^>]
+ECHO              [-model_cache_dir ^<model_cache_dir^>]
 ECHO              [-archive_file ^<archive_file^>]
 ECHO              [-target ^<target^>]
 ECHO              [-target_version ^<target_version^>]
@@ -98,6 +99,15 @@ ECHO                           variable values for all variables used in the mod
 ECHO                           If the variable file is not provided, validation will
 ECHO                           only validate the artifacts provided.
 ECHO.
+ECHO         model_cache_dir - the directory for saved merged models.  A merged model
+ECHO                           is saved for the model files and variables, and is used
+ECHO                           by later runs with the same files and variables instead
+ECHO                           of merging the model files again.
+ECHO                           The saved models are not substituted, so they
+ECHO                           contain any passwords from the model files.  The
+ECHO                           files are only readable by their owner, and are
+ECHO                           not deleted by the tool.
+ECHO.
 ECHO         archive_file    - the path to the archive file to use.  If the archive
 ECHO                           file is not provided, validation will only validate the
 ECHO                           artifacts provided.  This can also be specified as a
@@ -33,6 +33,7 @@ usage() {
   echo "          [-oracle_home <oracle_home>]"
   echo "          -model_file <model_file>"
   echo "          [-variable_file <variable_file>]"
+  echo "          [-model_cache_dir <model_cache_dir>]"
   echo "          [-archive_file <archive_file>]"
   echo "          [-target <target>]"
   echo "          [-target_version <target_version>]"
@@ -55,6 +56,15 @@ usage() {
   echo "                         If the variable file is not provided, validation will"
   echo "                         only validate the artifacts provided."
   echo ""
+  echo "        model_cache_dir - the directory for saved merged models.  A merged model"
+  echo "                          is saved for the model files and variables, and is used"
+  echo "                          by later runs with the same files and variables instead"
+  echo "                          of merging the model files again."
+  echo "                          The saved models are not substituted, so they"
+  echo "                          contain any passwords from the model files.  The"
+  echo "                          files are only readable by their owner, and are"
+  echo "                          not deleted by the tool."
+  echo ""
   echo "        archive_file   - the path to the archive file to use.  If the archive"
   echo "                         file is not provided, validation will only validate the"
   echo "                         artifacts provided.  This can also be specified as a"